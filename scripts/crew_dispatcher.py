@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Alex AI Crew Dispatcher
+Long-lived batch task dispatcher: priority heap, per-member concurrency limits and backpressure on an asyncio worker pool
+"""
+
+import sys
+import time
+import heapq
+import random
+import asyncio
+import argparse
+from itertools import count
+from typing import Dict, Any, Awaitable, Callable, List, Optional, Tuple
+
+# Task priority used when a task does not set one; lower runs first
+DEFAULT_TASK_PRIORITY = 5
+DEFAULT_WORKERS = 8
+# Tasks one member may run at the same time
+MEMBER_CONCURRENCY = 2
+# Queued tasks before submit_batch starts waiting for room
+MAX_QUEUE = 1000
+
+Handler = Callable[[str, Dict[str, Any]], Awaitable[Any]]
+
+
+async def simulated_handler(member_id: str, task: Dict[str, Any]) -> Dict[str, Any]:
+    """Stand-in for real crew work: sleeps for the task's ``duration`` (default 10ms)"""
+    await asyncio.sleep(task.get("duration", 0.01))
+    return {"handled_by": member_id}
+
+
+class CrewDispatcher:
+    """Queue batches of tasks for the crew and run them on a pool of asyncio workers.
+
+    Each task is routed through the engagement's crew registry when it is
+    submitted and queued in a heap ordered by the task's own priority, then
+    by the priority of its best candidate member, then by arrival. There is
+    one heap per distinct candidate list, so a worker only compares the
+    heads of the lists that have a candidate below its concurrency limit and
+    takes the first of them, trying candidates in routing order. One busy
+    member never stalls tasks another member could run, and tasks waiting
+    on a saturated member cost nothing to skip. ``submit_batch`` waits while
+    ``max_queue`` tasks are queued, which pushes back on producers instead
+    of letting the heap grow without bound. Queue latency, run time and
+    throughput are recorded on the engagement's ``PerformanceMetrics``, and
+    every outcome updates the member's live performance score.
+    """
+
+    def __init__(self, engagement: Any, handler: Handler = simulated_handler, workers: int = DEFAULT_WORKERS,
+                 member_concurrency: int = MEMBER_CONCURRENCY, member_limits: Optional[Dict[str, int]] = None,
+                 max_queue: int = MAX_QUEUE):
+        self.engagement = engagement
+        self.registry = engagement.crew_registry
+        self.metrics = engagement.metrics
+        self.scoring = engagement.crew_scoring
+        self.handler = handler
+        self.workers = workers
+        self.member_limits = {member_id: member_concurrency for member_id in self.registry.priority_order}
+        self.member_limits.update(member_limits or {})
+        self.max_queue = max_queue
+        self.running = {member_id: 0 for member_id in self.member_limits}
+        # Candidate list -> heap of its queued tasks
+        self.queues: Dict[Tuple[str, ...], List[Any]] = {}
+        self.queued = 0
+        self.sequence = count()
+        # Workers wait on ``condition`` for work, producers on ``space`` for room; both share one lock
+        self.condition: Optional[asyncio.Condition] = None
+        self.space: Optional[asyncio.Condition] = None
+        self.worker_tasks: List[asyncio.Task] = []
+        self.stopping = False
+        self.first_submit: Optional[float] = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+
+    async def start(self):
+        """Start the worker pool on the running event loop"""
+        self._ensure_condition()
+        self.stopping = False
+        self.worker_tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+
+    async def stop(self, drain: bool = True):
+        """Stop the workers, after finishing queued tasks unless ``drain`` is False"""
+        async with self.condition:
+            if not drain:
+                for queue in self.queues.values():
+                    for key in queue:
+                        key[-1]["future"].cancel()
+                self.queues.clear()
+                self.queued = 0
+            self.stopping = True
+            self.condition.notify_all()
+            self.space.notify_all()
+        await asyncio.gather(*self.worker_tasks, return_exceptions=True)
+        self.worker_tasks = []
+
+    async def submit_batch(self, tasks: List[Dict[str, Any]]) -> List[asyncio.Future]:
+        """Queue tasks and return one future per task, waiting for room when the queue is full"""
+        loop = asyncio.get_running_loop()
+        self._ensure_condition()
+        if self.first_submit is None:
+            self.first_submit = time.perf_counter()
+        futures = []
+        for task in tasks:
+            future = loop.create_future()
+            futures.append(future)
+            candidates = [member_id for member_id, _ in self.registry.route(task.get("capabilities", []))]
+            if not candidates:
+                future.set_result(self._result(task, None, "unroutable", 0.0, 0.0, None))
+                continue
+            entry = {"task": task, "future": future, "queued_at": time.perf_counter()}
+            key = (task.get("priority", DEFAULT_TASK_PRIORITY), self.registry.get(candidates[0]).priority,
+                   next(self.sequence), entry)
+            async with self.space:
+                await self.space.wait_for(lambda: self.queued < self.max_queue or self.stopping)
+                if self.stopping:
+                    future.cancel()
+                    continue
+                heapq.heappush(self.queues.setdefault(tuple(candidates), []), key)
+                self.queued += 1
+                self.condition.notify()
+        return futures
+
+    async def run_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submit tasks and wait for every result, in submission order"""
+        return list(await asyncio.gather(*await self.submit_batch(tasks)))
+
+    def queue_depth(self) -> int:
+        """Tasks waiting for a worker"""
+        return self.queued
+
+    def _ensure_condition(self):
+        # Tasks may be queued before the workers start; both sides share one lock
+        if self.condition is None:
+            lock = asyncio.Lock()
+            self.condition = asyncio.Condition(lock)
+            self.space = asyncio.Condition(lock)
+
+    def _take(self) -> Optional[Any]:
+        """Pop the first queued task with a free candidate, leaving the rest queued"""
+        running, limits = self.running, self.member_limits
+        best = None
+        for candidates, queue in self.queues.items():
+            if (best is None or queue[0] < best[1][0]) and any(running[m] < limits[m] for m in candidates):
+                best = (candidates, queue)
+        if best is None:
+            return None
+        candidates, queue = best
+        entry = heapq.heappop(queue)[-1]
+        if not queue:
+            del self.queues[candidates]
+        self.queued -= 1
+        member_id = next(m for m in candidates if running[m] < limits[m])
+        running[member_id] += 1
+        return entry, member_id
+
+    async def _worker(self):
+        while True:
+            async with self.condition:
+                taken = None
+                while taken is None:
+                    taken = self._take()
+                    if taken is None:
+                        if self.stopping and not self.queued:
+                            return
+                        await self.condition.wait()
+                # A slot in the queue was freed for a waiting producer
+                self.space.notify()
+
+            entry, member_id = taken
+            started = time.perf_counter()
+            queue_latency = started - entry["queued_at"]
+            try:
+                output = await self.handler(member_id, entry["task"])
+                status, error = "completed", None
+            except Exception as e:
+                output, status, error = None, "failed", str(e)
+            run_time = time.perf_counter() - started
+
+            self.scoring.record(member_id, status == "completed", run_time)
+            async with self.condition:
+                self.running[member_id] -= 1
+                self._record(status, queue_latency)
+                # One member slot was freed, so at most one waiting worker can use it; when stopping,
+                # every waiting worker must wake to see whether the queue has drained
+                if self.stopping:
+                    self.condition.notify_all()
+                else:
+                    self.condition.notify()
+            if not entry["future"].done():
+                entry["future"].set_result(
+                    self._result(entry["task"], member_id, status, queue_latency, run_time, output, error))
+
+    def _record(self, status: str, queue_latency: float):
+        metrics = self.metrics
+        if status == "completed":
+            metrics.tasks_completed += 1
+        else:
+            metrics.tasks_failed += 1
+            metrics.error_count += 1
+        metrics.queue_latency_total += queue_latency
+        metrics.max_queue_latency = max(metrics.max_queue_latency, queue_latency)
+        finished = metrics.tasks_completed + metrics.tasks_failed
+        elapsed = time.perf_counter() - self.first_submit
+        metrics.dispatch_throughput = finished / elapsed if elapsed > 0 else 0.0
+
+    def _result(self, task: Dict[str, Any], member_id: Optional[str], status: str, queue_latency: float,
+                run_time: float, output: Any, error: Optional[str] = None) -> Dict[str, Any]:
+        return {
+            "task_id": task.get("id"),
+            "member_id": member_id,
+            "status": status,
+            "queue_latency": round(queue_latency, 6),
+            "run_time": round(run_time, 6),
+            "output": output,
+            "error": error
+        }
+
+
+def dispatch_batch(engagement: Any, tasks: List[Dict[str, Any]], **options) -> List[Dict[str, Any]]:
+    """Run one batch to completion from synchronous code"""
+    async def run():
+        async with CrewDispatcher(engagement, **options) as dispatcher:
+            return await dispatcher.run_batch(tasks)
+    return asyncio.run(run())
+
+
+def main():
+    """Dispatch a batch of random simulated tasks and print throughput and queue latency"""
+    from optimized_alex_ai_engagement import OptimizedAlexAIEngagement
+
+    parser = argparse.ArgumentParser(description="Alex AI Crew Dispatcher")
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks in the batch")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Concurrent workers")
+    parser.add_argument("--member-concurrency", type=int, default=MEMBER_CONCURRENCY, help="Tasks per member at once")
+    parser.add_argument("--duration", type=float, default=0.01, help="Simulated seconds per task")
+    args = parser.parse_args()
+
+    engagement = OptimizedAlexAIEngagement()
+    capabilities = list(engagement.crew_registry.by_capability)
+    rng = random.Random(0)
+    tasks = [
+        {"id": i, "capabilities": rng.sample(capabilities, 2), "priority": rng.randint(1, 9), "duration": args.duration}
+        for i in range(args.tasks)
+    ]
+
+    print(f"📬 Dispatching {len(tasks)} tasks over {args.workers} workers")
+    results = dispatch_batch(engagement, tasks, workers=args.workers, member_concurrency=args.member_concurrency)
+    metrics = engagement.metrics
+    finished = metrics.tasks_completed + metrics.tasks_failed
+    print(f"   Completed: {metrics.tasks_completed}, failed: {metrics.tasks_failed}, "
+          f"unroutable: {sum(1 for r in results if r['status'] == 'unroutable')}")
+    print(f"   Throughput: {metrics.dispatch_throughput:.0f} tasks/s")
+    print(f"   Queue latency: avg {metrics.queue_latency_total / max(1, finished) * 1000:.1f}ms, "
+          f"max {metrics.max_queue_latency * 1000:.1f}ms")
+    return 0 if metrics.tasks_failed == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Alex AI Crew Member
+Compact immutable crew member records and zero-copy activation views over them
+"""
+
+import sys
+import time
+import argparse
+import threading
+import tracemalloc
+from typing import Dict, Any, Iterable, Iterator, List, Tuple
+
+# Text fields shared by many members (departments, ranks, statuses) are interned once
+INTERNED_FIELDS = ("id", "name", "rank", "department", "specialization", "avatar", "personality", "expertise", "status")
+SEQUENCE_FIELDS = ("capabilities", "core_values", "skills")
+# Members defined without a status are active, as before the records existed
+FIELD_DEFAULTS = {"status": "active"}
+
+
+class CapabilityCatalog:
+    """Process-wide, append-only numbering of capability names, one bit each.
+
+    Capabilities are interned here as members are loaded, so every member,
+    task and registry in the process agrees on which bit means what, and a
+    capability set is a plain ``int``: containment is ``task & ~member == 0``
+    and overlap is ``(task & member).bit_count()``.
+    """
+
+    def __init__(self):
+        self.bits: Dict[str, int] = {}
+        self.names_by_bit: List[str] = []
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.names_by_bit)
+
+    def bit(self, name: str) -> int:
+        """Bit number of a capability, numbering it on first sight"""
+        bit = self.bits.get(name)
+        if bit is None:
+            with self.lock:
+                bit = self.bits.get(name)
+                if bit is None:
+                    bit = self.bits[sys.intern(name)] = len(self.names_by_bit)
+                    self.names_by_bit.append(name)
+        return bit
+
+    def mask(self, names: Iterable[str], create: bool = False) -> int:
+        """Bitmask of capability names; unknown names are numbered when ``create`` is set, else ignored"""
+        mask = 0
+        bits = self.bits
+        for name in names:
+            bit = self.bit(name) if create else bits.get(name)
+            if bit is not None:
+                mask |= 1 << bit
+        return mask
+
+    def names(self, mask: int) -> Tuple[str, ...]:
+        """Capability names set in a mask, in bit order"""
+        names = []
+        while mask:
+            low = mask & -mask
+            names.append(self.names_by_bit[low.bit_length() - 1])
+            mask ^= low
+        return tuple(names)
+
+
+CAPABILITIES = CapabilityCatalog()
+
+
+class CrewMember:
+    """One crew member as a slotted, read-only record.
+
+    Strings are interned, so a department or capability named by a thousand
+    members is stored once, and lists become tuples. ``capability_mask``
+    holds the member's capabilities as bits of the process-wide
+    ``CAPABILITIES`` catalog. Item access (``member["name"]``,
+    ``member.get(...)``) is kept so code written against the old definition
+    dicts keeps working.
+    """
+
+    __slots__ = INTERNED_FIELDS + SEQUENCE_FIELDS + ("priority", "capability_mask")
+
+    def __init__(self, definition: Dict[str, Any]):
+        set_field = object.__setattr__
+        for field in INTERNED_FIELDS:
+            set_field(self, field, sys.intern(str(definition.get(field, FIELD_DEFAULTS.get(field, "")))))
+        for field in SEQUENCE_FIELDS:
+            set_field(self, field, tuple(sys.intern(str(value)) for value in definition.get(field, ())))
+        set_field(self, "priority", definition.get("priority", 0))
+        set_field(self, "capability_mask", CAPABILITIES.mask(self.capabilities, create=True))
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"CrewMember is immutable; cannot set {name}")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"CrewMember is immutable; cannot delete {name}")
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__slots__
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Field value, or ``default`` for unknown fields"""
+        return getattr(self, key, default)
+
+    def keys(self) -> Tuple[str, ...]:
+        """Field names, for ``dict(member)`` and ``{**member}``"""
+        return self.__slots__
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain JSON-serialisable copy, for reports"""
+        data = {field: getattr(self, field) for field in self.__slots__ if field != "capability_mask"}
+        for field in SEQUENCE_FIELDS:
+            data[field] = list(data[field])
+        return data
+
+    def __repr__(self) -> str:
+        return f"CrewMember({self.id!r}, priority={self.priority})"
+
+
+class ActivationView:
+    """Per-activation values layered over a shared ``CrewMember`` without copying it.
+
+    Only the activation's own fields are stored; every other key reads
+    through to the member, so activating the whole crew allocates three
+    slots per member instead of a fresh dict of every field.
+    """
+
+    __slots__ = ("member", "initialization_time", "performance_score")
+
+    def __init__(self, member: CrewMember, initialization_time: float, performance_score: float):
+        self.member = member
+        self.initialization_time = initialization_time
+        self.performance_score = performance_score
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "initialization_time":
+            return self.initialization_time
+        if key == "performance_score":
+            return self.performance_score
+        return self.member[key]
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names that are not slots of the view itself
+        return getattr(self.member, name)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Activation or member field, or ``default``"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain copy of the member plus the activation fields, for reports"""
+        return {**self.member.to_dict(), "initialization_time": self.initialization_time,
+                "performance_score": self.performance_score}
+
+
+def measure(agents: int = 10000) -> Dict[str, Any]:
+    """Bytes allocated for a registry of synthetic agents and one activation of all of them, dicts vs records"""
+    departments = [f"Department {i}" for i in range(12)]
+    definitions = [
+        {
+            "id": f"agent_{i}", "name": f"Agent {i}", "rank": "Lieutenant", "department": departments[i % 12],
+            "specialization": "Synthetic Load", "avatar": "🤖", "personality": "Logical, analytical, precise",
+            "expertise": "Analytics, Logic, Data Processing", "status": "active", "priority": i % 10,
+            "capabilities": [f"capability_{(i + j) % 40}" for j in range(3)],
+            "core_values": ["Logic", "Precision"], "skills": ["analysis", "processing"]
+        }
+        for i in range(agents)
+    ]
+
+    def allocated(build):
+        tracemalloc.start()
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del kept
+        return size
+
+    def dict_registry():
+        # Like parsed JSON: every member owns its own strings and lists
+        return [{key: (list(value) if isinstance(value, list) else "".join(value) if isinstance(value, str) else value)
+                 for key, value in definition.items()} for definition in definitions]
+
+    dicts = dict_registry()
+    records = [CrewMember(definition) for definition in definitions]
+    now = time.time()
+    return {
+        "agents": agents,
+        "registry_dicts": allocated(dict_registry),
+        "registry_records": allocated(lambda: [CrewMember(definition) for definition in definitions]),
+        "activation_copies": allocated(lambda: [{**member, "initialization_time": now, "performance_score": 0.5}
+                                                for member in dicts]),
+        "activation_views": allocated(lambda: [ActivationView(member, now, 0.5) for member in records])
+    }
+
+
+def main():
+    """Compare the memory cost of dict members against slotted records and views"""
+    parser = argparse.ArgumentParser(description="Alex AI Crew Member")
+    parser.add_argument("--agents", type=int, default=10000, help="Synthetic agents to build")
+    args = parser.parse_args()
+
+    result = measure(args.agents)
+    print(f"🧮 {result['agents']} agents")
+    print(f"   Registry:   {result['registry_dicts'] / 1024:.0f} KiB as dicts, "
+          f"{result['registry_records'] / 1024:.0f} KiB as records")
+    print(f"   Activation: {result['activation_copies'] / 1024:.0f} KiB as copies, "
+          f"{result['activation_views'] / 1024:.0f} KiB as views")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+Alex AI Crew Registry
+Crew loaded lazily from memories/ identity files, indexed by capability, department and priority for constant-time routing
+"""
+
+import os
+import sys
+import json
+import time
+import random
+import marshal
+import argparse
+import threading
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from crew_member import CAPABILITIES, CrewMember
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MEMORIES_DIR = os.path.join(REPO_ROOT, "memories")
+IDENTITY_SUFFIX = "_identity_milestone.json"
+CACHE_FILE = os.path.join(REPO_ROOT, ".alex_ai_cache", "crew_registry.marshal")
+# Bump when parse_identity changes what it returns
+CACHE_VERSION = 1
+# Priority of identities without an engagement section: after every configured member
+DEFAULT_PRIORITY = 100
+
+
+def parse_identity(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Crew member definition from one identity milestone document"""
+    content = data["content"]
+    crew_member = content["crew_member"]
+    identity = content.get("identity_core", {})
+    engagement = content.get("engagement", {})
+    skills = list(content.get("capabilities", {}))
+    return {
+        "id": crew_member["id"],
+        "name": crew_member["name"],
+        "rank": crew_member.get("rank", ""),
+        "department": crew_member["department"],
+        "specialization": crew_member.get("specialization", ""),
+        "avatar": crew_member.get("avatar", ""),
+        "personality": identity.get("personality", ""),
+        "core_values": identity.get("core_values", []),
+        "expertise": engagement.get("expertise", crew_member.get("specialization", "")),
+        "status": engagement.get("status", "active"),
+        "priority": engagement.get("priority", DEFAULT_PRIORITY),
+        # Routing capabilities; identities without an engagement section route by their skills
+        "capabilities": engagement.get("capabilities", skills),
+        "skills": skills
+    }
+
+
+def load_crew_definitions(memories_dir: str = MEMORIES_DIR, cache_file: Optional[str] = CACHE_FILE) -> Dict[str, Dict[str, Any]]:
+    """Crew members from every identity file, in priority order.
+
+    Parsed members are kept in a marshal file next to the size and mtime of
+    the identity file they came from. A start with unchanged files costs one
+    directory listing, one ``stat`` per file and one marshal load; only new or
+    edited identities are parsed as JSON again.
+    """
+    cached = _read_cache(cache_file) if cache_file else {}
+    entries = {}
+    changed = False
+    with os.scandir(memories_dir) as it:
+        for entry in it:
+            if not entry.name.endswith(IDENTITY_SUFFIX) or not entry.is_file():
+                continue
+            stat = entry.stat()
+            previous = cached.get(entry.name)
+            if previous is not None and previous[0] == stat.st_mtime_ns and previous[1] == stat.st_size:
+                entries[entry.name] = previous
+                continue
+            try:
+                with open(entry.path, "r", encoding="utf-8") as f:
+                    member = parse_identity(json.load(f))
+            except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+                print(f"⚠️  Skipping {entry.name}: {e}")
+                # Remembered as unusable until the file changes
+                member = None
+            entries[entry.name] = (stat.st_mtime_ns, stat.st_size, member)
+            changed = True
+
+    if cache_file and (changed or entries.keys() != cached.keys()):
+        _write_cache(cache_file, entries)
+
+    members = [member for _, _, member in entries.values() if member is not None]
+    members.sort(key=lambda member: (member["priority"], member["id"]))
+    return {member["id"]: member for member in members}
+
+
+def _read_cache(cache_file: str) -> Dict[str, Tuple[int, int, Optional[Dict[str, Any]]]]:
+    try:
+        with open(cache_file, "rb") as f:
+            version, entries = marshal.loads(f.read())
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    return entries if version == CACHE_VERSION else {}
+
+
+def _write_cache(cache_file: str, entries: Dict[str, Tuple[int, int, Optional[Dict[str, Any]]]]):
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        temporary = f"{cache_file}.{os.getpid()}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(marshal.dumps((CACHE_VERSION, entries)))
+        os.replace(temporary, cache_file)
+    except OSError:
+        pass  # A read-only checkout still works, it just parses every start
+
+
+class CrewRegistry:
+    """Crew members indexed once at load time so lookups never scan every member.
+
+    Definitions become immutable ``CrewMember`` records whose capabilities
+    are bitmasks over the process-wide ``CAPABILITIES`` catalog.
+    ``by_capability`` and ``by_department`` map a key to the ids of the active
+    members that carry it, each list already in priority order.
+
+    For scoring, the index is also transposed: ``member_sets`` maps each
+    capability bit to an integer with bit ``i`` set when the member of rank
+    ``i`` has that capability. Per-member overlap counts for a task are then
+    the bit-sliced sum of the task's k member sets, computed for the whole
+    crew at once with a handful of big-integer operations, and members of
+    equal overlap come out already in priority order (lowest bit first).
+    """
+
+    def __init__(self, crew_members: Dict[str, Dict[str, Any]]):
+        ordered = sorted(crew_members.items(), key=lambda item: item[1]["priority"])
+        self.members: Dict[str, CrewMember] = {
+            member_id: definition if isinstance(definition, CrewMember) else CrewMember(definition)
+            for member_id, definition in ordered
+        }
+        self.priority_order: List[str] = [
+            member_id for member_id, member in self.members.items() if member.status == "active"
+        ]
+        self.rank = {member_id: position for position, member_id in enumerate(self.priority_order)}
+        self.all_members = (1 << len(self.priority_order)) - 1
+        self.by_capability: Dict[str, List[str]] = {}
+        self.by_department: Dict[str, List[str]] = {}
+        self.member_sets: Dict[int, int] = {}
+        for position, member_id in enumerate(self.priority_order):
+            member = self.members[member_id]
+            for capability in member.capabilities:
+                self.by_capability.setdefault(capability, []).append(member_id)
+                bit = CAPABILITIES.bits[capability]
+                self.member_sets[bit] = self.member_sets.get(bit, 0) | (1 << position)
+            self.by_department.setdefault(member.department, []).append(member_id)
+
+    def __len__(self) -> int:
+        return len(self.priority_order)
+
+    def get(self, member_id: str) -> CrewMember:
+        """Member record by id"""
+        return self.members[member_id]
+
+    def capability_mask(self, capabilities: Iterable[str]) -> int:
+        """Bitmask of known capabilities; unknown ones are ignored"""
+        return CAPABILITIES.mask(capabilities)
+
+    def with_capability(self, capability: str) -> List[str]:
+        """Active members carrying a capability, highest priority first"""
+        return self.by_capability.get(capability, [])
+
+    def in_department(self, department: str) -> List[str]:
+        """Active members of a department, highest priority first"""
+        return self.by_department.get(department, [])
+
+    def covers(self, member_id: str, task_capabilities: Iterable[str]) -> bool:
+        """True when a member has every capability a task needs; a task needing nothing is covered by nobody"""
+        needed = set(task_capabilities)
+        task_mask = CAPABILITIES.mask(needed)
+        return (bool(needed) and len(needed) == task_mask.bit_count()
+                and task_mask & ~self.members[member_id].capability_mask == 0)
+
+    def route(self, task_capabilities: Iterable[str], limit: int = 0,
+              require_all: bool = False) -> List[Tuple[str, int]]:
+        """Members able to handle a task as (member id, matched capabilities), best first.
+
+        Members matching more of the task's capabilities rank first; ties go
+        to the higher-priority member. Unknown capabilities match nobody, so
+        with ``require_all`` a task naming one has no candidates, and a task
+        naming none has no candidates either way.
+        """
+        needed = set(task_capabilities)
+        task_mask = CAPABILITIES.mask(needed)
+        if not needed or (require_all and task_mask.bit_count() != len(needed)):
+            return []
+        return self._rank(task_mask, limit, len(needed) if require_all else 1)
+
+    def score_batch(self, tasks: Iterable[Iterable[str]], limit: int = 0) -> List[List[Tuple[str, int]]]:
+        """Rank the whole crew for every task in a batch, same order as ``route``"""
+        mask = CAPABILITIES.mask
+        return [self._rank(mask(task), limit, 1) for task in tasks]
+
+    def _rank(self, task_mask: int, limit: int, minimum: int) -> List[Tuple[str, int]]:
+        # planes[j] holds bit j of every member's overlap count (bit-sliced addition)
+        planes: List[int] = []
+        member_sets = self.member_sets
+        most = task_mask.bit_count()
+        while task_mask:
+            low = task_mask & -task_mask
+            task_mask ^= low
+            carry = member_sets.get(low.bit_length() - 1, 0)
+            for j in range(len(planes)):
+                if not carry:
+                    break
+                planes[j], carry = planes[j] ^ carry, planes[j] & carry
+            if carry:
+                planes.append(carry)
+
+        ranked: List[Tuple[str, int]] = []
+        order = self.priority_order
+        everyone = self.all_members
+        for count in range(min(most, (1 << len(planes)) - 1), minimum - 1, -1):
+            selected = everyone
+            for j, plane in enumerate(planes):
+                selected &= plane if count >> j & 1 else ~plane
+            while selected:
+                low = selected & -selected
+                ranked.append((order[low.bit_length() - 1], count))
+                if len(ranked) == limit:
+                    return ranked
+                selected ^= low
+        return ranked
+
+    def stats(self) -> Dict[str, Any]:
+        """Index sizes"""
+        return {
+            "members": len(self.priority_order),
+            "capabilities": len(self.by_capability),
+            "departments": len(self.by_department)
+        }
+
+
+_registry: Optional[CrewRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_crew_registry() -> CrewRegistry:
+    """Process-wide crew registry, loaded from memories/ on first access"""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = CrewRegistry(load_crew_definitions())
+        return _registry
+
+
+def benchmark(registry: CrewRegistry, tasks: int = 100000, capabilities_per_task: int = 3) -> Dict[str, Any]:
+    """Route random tasks drawn from the registry's own capabilities one by one and as one batch"""
+    capabilities = list(registry.by_capability) + ["unknown_capability"]
+    rng = random.Random(0)
+    batch = [rng.sample(capabilities, min(capabilities_per_task, len(capabilities))) for _ in range(tasks)]
+    start = time.perf_counter()
+    routed = sum(1 for task in batch if registry.route(task))
+    elapsed = time.perf_counter() - start
+    start = time.perf_counter()
+    registry.score_batch(batch, limit=3)
+    batch_elapsed = time.perf_counter() - start
+    return {
+        "tasks": tasks,
+        "routed": routed,
+        "elapsed": round(elapsed, 3),
+        "tasks_per_second": round(tasks / elapsed) if elapsed else None,
+        "batch_top3_elapsed": round(batch_elapsed, 3)
+    }
+
+
+def main():
+    """Route a task by capability, or benchmark routing throughput"""
+    parser = argparse.ArgumentParser(description="Alex AI Crew Registry")
+    parser.add_argument("capabilities", nargs="*", help="Capabilities the task needs")
+    parser.add_argument("--benchmark", action="store_true", help="Measure routing throughput")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    registry = get_crew_registry()
+    print(f"📂 Loaded from {MEMORIES_DIR} in {(time.perf_counter() - start) * 1000:.1f}ms")
+    stats = registry.stats()
+    print(f"👥 {stats['members']} members, {stats['capabilities']} capabilities, {stats['departments']} departments")
+
+    if args.benchmark:
+        result = benchmark(registry)
+        print(f"⚡ Routed {result['tasks']} tasks in {result['elapsed']}s ({result['tasks_per_second']} tasks/s)")
+        print(f"   Top 3 for the whole batch in {result['batch_top3_elapsed']}s")
+        return 0
+
+    ranked = registry.route(args.capabilities)
+    if not ranked:
+        print("❌ No crew member handles these capabilities")
+        return 1
+    for member_id, matched in ranked:
+        print(f"   {registry.get(member_id).name}: {matched}/{len(set(args.capabilities))} capabilities")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
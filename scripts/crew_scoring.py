@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Alex AI Crew Scoring
+Live per-member performance scores updated incrementally from task outcomes and cached until their inputs change
+"""
+
+import sys
+import time
+import random
+import argparse
+import threading
+from typing import Dict, Optional
+
+from crew_member import CrewMember
+
+# Weight of each new latency sample in the moving average
+LATENCY_ALPHA = 0.2
+# Latency at which the latency factor is 0.5; faster members approach 1.0
+LATENCY_TARGET = 0.1
+# Observations after which observed behaviour and the static score weigh the same
+PRIOR_WEIGHT = 10
+
+
+def static_score(member: CrewMember) -> float:
+    """Score from definition alone in [0, 1]: higher priority members start higher, capabilities add a bonus"""
+    # Priorities past 10 (DEFAULT_PRIORITY for identities without an engagement section) bottom out at 0
+    base_score = max(0.0, 1.0 - (member.priority * 0.1))
+    capability_bonus = len(member.capabilities) * 0.05
+    return min(1.0, base_score + capability_bonus)
+
+
+class MemberStats:
+    """Running outcome counts and latency average for one member, with its cached score"""
+
+    __slots__ = ("prior", "completed", "failed", "latency_ewma", "cached")
+
+    def __init__(self, prior: float):
+        self.prior = prior
+        self.completed = 0
+        self.failed = 0
+        self.latency_ewma: Optional[float] = None
+        self.cached: Optional[float] = prior
+
+
+class CrewScoring:
+    """Per-member scores that blend the static score with observed behaviour.
+
+    ``record`` folds one task outcome into the member's counts and latency
+    EWMA in constant time and only marks the cached score stale. ``score``
+    recomputes a stale score once and then serves it from the cache, so
+    routing can read scores on every dispatch however many tasks complete
+    in between. Observed performance is the success rate times a latency
+    factor; its weight grows with the number of observations, so a new
+    member starts at its static score.
+    """
+
+    def __init__(self, members: Dict[str, CrewMember], alpha: float = LATENCY_ALPHA,
+                 latency_target: float = LATENCY_TARGET, prior_weight: float = PRIOR_WEIGHT):
+        self.alpha = alpha
+        self.latency_target = latency_target
+        self.prior_weight = prior_weight
+        self.lock = threading.Lock()
+        self.stats = {member_id: MemberStats(static_score(member)) for member_id, member in members.items()}
+        self.recomputed = 0
+
+    def record(self, member_id: str, success: bool, latency: float):
+        """Fold one finished task into a member's stats"""
+        with self.lock:
+            stats = self.stats[member_id]
+            if success:
+                stats.completed += 1
+            else:
+                stats.failed += 1
+            if stats.latency_ewma is None:
+                stats.latency_ewma = latency
+            else:
+                stats.latency_ewma += self.alpha * (latency - stats.latency_ewma)
+            stats.cached = None
+
+    def score(self, member_id: str) -> float:
+        """Current score of a member, recomputed only after new outcomes"""
+        stats = self.stats[member_id]
+        cached = stats.cached
+        if cached is not None:
+            return cached
+        with self.lock:
+            if stats.cached is None:
+                stats.cached = self._compute(stats)
+                self.recomputed += 1
+            return stats.cached
+
+    def scores(self) -> Dict[str, float]:
+        """Current score of every member"""
+        return {member_id: self.score(member_id) for member_id in self.stats}
+
+    def member_stats(self, member_id: str) -> Dict[str, float]:
+        """Observed counts, success rate and latency average of a member"""
+        stats = self.stats[member_id]
+        total = stats.completed + stats.failed
+        return {
+            "completed": stats.completed,
+            "failed": stats.failed,
+            "success_rate": stats.completed / total if total else None,
+            "latency_ewma": stats.latency_ewma,
+            "score": self.score(member_id)
+        }
+
+    def _compute(self, stats: MemberStats) -> float:
+        total = stats.completed + stats.failed
+        if not total:
+            return stats.prior
+        success_rate = stats.completed / total
+        latency_factor = self.latency_target / (self.latency_target + stats.latency_ewma)
+        weight = total / (total + self.prior_weight)
+        return (1 - weight) * stats.prior + weight * success_rate * latency_factor
+
+
+_scoring: Optional[CrewScoring] = None
+_scoring_lock = threading.Lock()
+
+
+def get_crew_scoring() -> CrewScoring:
+    """Process-wide scores for the crew registry's members, kept across engagements"""
+    global _scoring
+    from crew_registry import get_crew_registry
+
+    with _scoring_lock:
+        if _scoring is None:
+            _scoring = CrewScoring(get_crew_registry().members)
+        return _scoring
+
+
+def main():
+    """Feed simulated outcomes into the scores and time updates against cached reads"""
+    parser = argparse.ArgumentParser(description="Alex AI Crew Scoring")
+    parser.add_argument("--outcomes", type=int, default=100000, help="Simulated task outcomes")
+    args = parser.parse_args()
+
+    scoring = get_crew_scoring()
+    member_ids = list(scoring.stats)
+    rng = random.Random(0)
+    # Each member gets its own reliability and speed
+    profiles = {member_id: (rng.uniform(0.7, 1.0), rng.uniform(0.02, 0.3)) for member_id in member_ids}
+
+    start = time.perf_counter()
+    for _ in range(args.outcomes):
+        member_id = rng.choice(member_ids)
+        reliability, latency = profiles[member_id]
+        scoring.record(member_id, rng.random() < reliability, rng.expovariate(1 / latency))
+    update_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(args.outcomes):
+        scoring.score(rng.choice(member_ids))
+    read_time = time.perf_counter() - start
+
+    print(f"📈 {args.outcomes} outcomes recorded in {update_time:.3f}s, {args.outcomes} reads in {read_time:.3f}s "
+          f"({scoring.recomputed} recomputations)")
+    for member_id in member_ids:
+        stats = scoring.member_stats(member_id)
+        print(f"   {member_id}: score {stats['score']:.2f}, success {stats['success_rate']:.0%}, "
+              f"latency {stats['latency_ewma'] * 1000:.0f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Alex AI Engagement Cache
+Bounded LRU/TTL cache with a memory budget for derived crew data such as route rankings, with real hit, miss and eviction counts
+"""
+
+import sys
+import time
+import random
+import argparse
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Hashable, Optional, Tuple
+
+MAX_ENTRIES = 4096
+# Seconds an entry stays valid
+DEFAULT_TTL = 300.0
+# Approximate bytes the cached values may hold
+MAX_BYTES = 4 * 1024 * 1024
+
+MISSING = object()
+
+
+def estimate_size(value: Any, seen: Optional[set] = None) -> int:
+    """Approximate bytes held by a value, following containers but not slotted records they point to"""
+    if seen is None:
+        seen = set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(estimate_size(k, seen) + estimate_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(estimate_size(item, seen) for item in value)
+    return size
+
+
+class EngagementCache:
+    """Least-recently-used cache bounded by entry count, approximate bytes and age.
+
+    ``get`` moves a hit to the most-recent end and treats an expired entry as
+    a miss (and drops it). ``put`` evicts from the least-recent end until both
+    the entry limit and the byte budget hold again, and returns how many
+    entries it evicted so callers can account for them. Counters are only
+    ever incremented by real lookups, never by inserts.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, ttl: float = DEFAULT_TTL, max_bytes: int = MAX_BYTES):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        # key -> (value, expires_at, size)
+        self.entries: "OrderedDict[Hashable, Tuple[Any, float, int]]" = OrderedDict()
+        self.bytes = 0
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        entry = self.entries.get(key)
+        return entry is not None and entry[1] > time.monotonic()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value, or ``default`` when missing or expired"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if entry[1] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, ttl: Optional[float] = None, size: Optional[int] = None) -> int:
+        """Store a value; returns how many entries were evicted to make room"""
+        size = estimate_size(value) if size is None else size
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self.lock:
+            if key in self.entries:
+                self._remove(key)
+            if size > self.max_bytes:
+                return 0  # Larger than the whole budget: never cached
+            self.entries[key] = (value, expires_at, size)
+            self.bytes += size
+            evicted = 0
+            while len(self.entries) > self.max_entries or self.bytes > self.max_bytes:
+                self._remove(next(iter(self.entries)))
+                evicted += 1
+            self.evictions += evicted
+            return evicted
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Tuple[Any, bool, int]:
+        """Cached value or the loader's result; returns (value, hit, evicted)"""
+        value = self.get(key, MISSING)
+        if value is not MISSING:
+            return value, True, 0
+        value = loader()
+        return value, False, self.put(key, value, ttl)
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Drop one entry; returns whether it was cached"""
+        with self.lock:
+            if key not in self.entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self):
+        """Drop every entry, keeping the counters"""
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Occupancy and lookup counters"""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self.entries),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    def _remove(self, key: Hashable):
+        self.bytes -= self.entries.pop(key)[2]
+
+
+_cache: Optional[EngagementCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_engagement_cache() -> EngagementCache:
+    """Process-wide cache shared by every engagement"""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EngagementCache()
+        return _cache
+
+
+def main():
+    """Replay a skewed lookup stream against a small cache and print its counters"""
+    parser = argparse.ArgumentParser(description="Alex AI Engagement Cache")
+    parser.add_argument("--lookups", type=int, default=100000, help="Lookups to replay")
+    parser.add_argument("--keys", type=int, default=2000, help="Distinct keys in the stream")
+    parser.add_argument("--max-entries", type=int, default=500, help="Cache entry limit")
+    parser.add_argument("--max-bytes", type=int, default=MAX_BYTES, help="Cache byte budget")
+    args = parser.parse_args()
+
+    cache = EngagementCache(max_entries=args.max_entries, max_bytes=args.max_bytes)
+    rng = random.Random(0)
+    start = time.perf_counter()
+    for _ in range(args.lookups):
+        # Skewed stream: low keys are looked up far more often than high ones
+        key = min(int(rng.expovariate(4 / args.keys)), args.keys - 1)
+        cache.get_or_load(key, lambda: {"key": key, "payload": "x" * 64})
+    elapsed = time.perf_counter() - start
+
+    stats = cache.stats()
+    print(f"🗃️  {args.lookups} lookups in {elapsed:.3f}s")
+    print(f"   Hit rate: {stats['hit_rate']:.1%} ({stats['hits']} hits, {stats['misses']} misses)")
+    print(f"   Evictions: {stats['evictions']}, entries: {stats['entries']}, bytes: {stats['bytes']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
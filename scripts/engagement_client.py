@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Alex AI Engagement Client
+Thin command-line client for the resident engagement daemon; imports only the standard library so it starts fast
+"""
+
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import subprocess
+from typing import Dict, Any
+
+# Seconds to wait for a daemon started with --start to accept connections
+START_TIMEOUT = 10.0
+
+
+def socket_path() -> str:
+    """Daemon socket: $ALEX_AI_ENGAGEMENT_SOCKET, else per-user in the runtime or temp directory"""
+    configured = os.environ.get("ALEX_AI_ENGAGEMENT_SOCKET")
+    if configured:
+        return configured
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or "/tmp"
+    return os.path.join(runtime_dir, f"alex-ai-engagement-{os.getuid()}.sock")
+
+
+class EngagementClient:
+    """One connection to the daemon, sending JSON-line requests and reading JSON-line replies"""
+
+    def __init__(self, path: str = None, timeout: float = 30.0):
+        self.path = path or socket_path()
+        self.connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.connection.settimeout(timeout)
+        self.connection.connect(self.path)
+        self.reader = self.connection.makefile("rb")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def request(self, op: str, **params) -> Dict[str, Any]:
+        """Send one request and return the daemon's reply"""
+        self.connection.sendall(json.dumps({"op": op, **params}).encode("utf-8") + b"\n")
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("engagement daemon closed the connection")
+        return json.loads(line)
+
+    def close(self):
+        """Close the connection"""
+        self.reader.close()
+        self.connection.close()
+
+
+def start_daemon(path: str) -> bool:
+    """Start the daemon in the background and wait until it accepts connections"""
+    daemon = os.path.join(os.path.dirname(os.path.abspath(__file__)), "engagement_daemon.py")
+    subprocess.Popen([sys.executable, daemon, "--socket", path], stdin=subprocess.DEVNULL,
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.monotonic() + START_TIMEOUT
+    while time.monotonic() < deadline:
+        try:
+            EngagementClient(path).close()
+            return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+
+def main():
+    """Send one request to the engagement daemon and print the reply"""
+    parser = argparse.ArgumentParser(description="Alex AI Engagement Client")
+    parser.add_argument("op", choices=["ping", "status", "engage", "route", "dispatch", "shutdown"])
+    parser.add_argument("args", nargs="*", help="route: capabilities; dispatch: JSON file of tasks (- for stdin)")
+    parser.add_argument("--limit", type=int, default=0, help="route: best N members only")
+    parser.add_argument("--socket", default=None, help="Daemon socket path")
+    parser.add_argument("--start", action="store_true", help="Start the daemon when it is not running")
+    parser.add_argument("--time", action="store_true", help="Print the round-trip time")
+    args = parser.parse_args()
+
+    path = args.socket or socket_path()
+    params: Dict[str, Any] = {}
+    if args.op == "route":
+        params = {"capabilities": args.args, "limit": args.limit}
+    elif args.op == "dispatch":
+        source = args.args[0] if args.args else "-"
+        with (sys.stdin if source == "-" else open(source, "r", encoding="utf-8")) as f:
+            params = {"tasks": json.load(f)}
+
+    try:
+        client = EngagementClient(path)
+    except OSError:
+        if not args.start:
+            print(f"❌ Engagement daemon is not running at {path} (use --start)", file=sys.stderr)
+            return 2
+        if not start_daemon(path):
+            print(f"❌ Engagement daemon did not start at {path}", file=sys.stderr)
+            return 2
+        client = EngagementClient(path)
+
+    with client:
+        start = time.perf_counter()
+        reply = client.request(args.op, **params)
+        elapsed = time.perf_counter() - start
+
+    print(json.dumps(reply.get("result") if reply.get("ok") else reply, indent=2))
+    if args.time:
+        print(f"⏱️  {elapsed * 1e6:.0f}µs round trip, {reply.get('elapsed_us', 0):.0f}µs in the daemon", file=sys.stderr)
+    return 0 if reply.get("ok") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Alex AI Engagement Daemon
+Resident engagement service on a Unix socket that keeps the crew registry, connection pools and caches warm
+"""
+
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import asyncio
+import argparse
+from dataclasses import asdict
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+from engagement_client import socket_path
+from crew_dispatcher import CrewDispatcher
+from optimized_alex_ai_engagement import OptimizedAlexAIEngagement
+
+# Seconds between background connection probes; requests read the last result
+PROBE_INTERVAL = 30.0
+# Longest request line the daemon reads; dispatch batches of thousands of tasks fit well within it
+MAX_REQUEST_BYTES = 16 * 1024 * 1024
+
+
+class EngagementDaemon:
+    """Long-lived engagement that answers JSON-line requests over a Unix socket.
+
+    Everything a one-shot engagement rebuilds on every run is built once at
+    startup and kept: the crew registry and scores, the warmed connection
+    pools, the engagement cache and a running crew dispatcher. Backends are
+    re-probed in the background, so an ``engage`` request reports the last
+    known connection status instead of waiting on the network. Each request
+    is one JSON object per line with an ``op``; each reply is one line with
+    ``ok``, ``result`` or ``error``, and the time spent in the daemon.
+    """
+
+    def __init__(self, path: Optional[str] = None, probe_interval: float = PROBE_INTERVAL):
+        self.path = path or socket_path()
+        self.probe_interval = probe_interval
+        self.engagement = OptimizedAlexAIEngagement(verbose=False)
+        self.dispatcher: Optional[CrewDispatcher] = None
+        self.connection_status: Dict[str, Any] = {}
+        self.started_at = time.time()
+        self.requests = 0
+        self.stop_event: Optional[asyncio.Event] = None
+        self.handlers = {
+            "ping": self.handle_ping,
+            "status": self.handle_status,
+            "engage": self.handle_engage,
+            "route": self.handle_route,
+            "dispatch": self.handle_dispatch,
+            "shutdown": self.handle_shutdown
+        }
+
+    async def serve(self):
+        """Warm up, then serve requests until a shutdown request or SIGTERM/SIGINT"""
+        self.claim_socket()
+        self.stop_event = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self.stop_event.set)
+
+        await self.warm()
+        self.dispatcher = CrewDispatcher(self.engagement)
+        await self.dispatcher.start()
+        # Bind with a private umask so the socket is never reachable by other users, not even briefly
+        umask = os.umask(0o077)
+        try:
+            server = await asyncio.start_unix_server(self.handle_connection, path=self.path, limit=MAX_REQUEST_BYTES)
+        finally:
+            os.umask(umask)
+        probes = asyncio.create_task(self.probe_loop())
+        print(f"🛰️  Alex AI Engagement Daemon listening on {self.path}", flush=True)
+
+        try:
+            async with server:
+                await self.stop_event.wait()
+        finally:
+            probes.cancel()
+            await self.dispatcher.stop()
+            if os.path.exists(self.path):
+                os.unlink(self.path)
+            print("🛑 Engagement daemon stopped", flush=True)
+
+    def claim_socket(self):
+        """Remove a stale socket file, refusing to start when another daemon answers on it"""
+        if not os.path.exists(self.path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.path)
+        except OSError:
+            os.unlink(self.path)
+            return
+        finally:
+            probe.close()
+        raise RuntimeError(f"an engagement daemon is already running at {self.path}")
+
+    async def warm(self):
+        """Load the crew and open every backend pool before the first request"""
+        start = time.perf_counter()
+        await asyncio.to_thread(self.engagement.connection_pool.warm)
+        self.connection_status = await self.engagement.probe_connections()
+        self.engagement.optimize_crew_initialization()
+        print(f"🔥 Warmed {len(self.engagement.crew_registry)} crew members and "
+              f"{len(self.engagement.connection_pool.pools)} connection pools in {time.perf_counter() - start:.3f}s",
+              flush=True)
+
+    async def probe_loop(self):
+        """Refresh the connection status in the background"""
+        while True:
+            await asyncio.sleep(self.probe_interval)
+            self.connection_status = await self.engagement.probe_connections()
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer every request line on one client connection"""
+        try:
+            while True:
+                line = await self.read_request(reader)
+                if line is None:
+                    writer.write(self.reply({"ok": False, "error": f"request line exceeds {MAX_REQUEST_BYTES} bytes"}))
+                elif not line:
+                    break
+                else:
+                    writer.write(await self.answer(line))
+                await writer.drain()
+        except (ConnectionError, asyncio.CancelledError):
+            # Client went away, or the daemon is stopping with this connection still open
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def read_request(reader: asyncio.StreamReader) -> Optional[bytes]:
+        """Next request line, b"" at end of stream, or None when the line was over the limit and skipped"""
+        oversized = False
+        while True:
+            try:
+                line = await reader.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                return b"" if oversized else e.partial
+            except asyncio.LimitOverrunError as e:
+                # Discard the buffered part of the oversized line and keep reading up to its end
+                await reader.readexactly(e.consumed)
+                oversized = True
+                continue
+            return None if oversized else line
+
+    async def answer(self, line: bytes) -> bytes:
+        """Reply line for one request line"""
+        start = time.perf_counter()
+        self.requests += 1
+        try:
+            request = json.loads(line)
+            handler = self.handlers.get(request.get("op"))
+            if handler is None:
+                raise ValueError(f"unknown op: {request.get('op')!r}")
+            reply = {"ok": True, "result": await handler(request)}
+        except Exception as e:
+            reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        reply["elapsed_us"] = round((time.perf_counter() - start) * 1e6, 1)
+        return self.reply(reply)
+
+    @staticmethod
+    def reply(reply: Dict[str, Any]) -> bytes:
+        """Encode one reply line"""
+        return json.dumps(reply, default=str).encode("utf-8") + b"\n"
+
+    async def handle_ping(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Liveness check"""
+        return {"pong": True}
+
+    async def handle_status(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Uptime, crew, connection, pool, cache, dispatcher and engagement metrics"""
+        return {
+            "uptime": round(time.time() - self.started_at, 3),
+            "requests": self.requests,
+            "crew": self.engagement.crew_registry.stats(),
+            "connections": self.connection_status,
+            "pools": self.engagement.connection_pool.metrics(),
+            "cache": self.engagement.crew_cache.stats(),
+            "queue_depth": self.dispatcher.queue_depth(),
+            "metrics": asdict(self.engagement.metrics)
+        }
+
+    async def handle_engage(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Activate the crew from the warm registry and report the last known connection status"""
+        crew_result = self.engagement.optimize_crew_initialization()
+        return {
+            "activated_crew": [
+                {"id": member.id, "name": member.name, "department": member.department,
+                 "performance_score": round(member.performance_score, 4)}
+                for member in crew_result["activated_crew"].values()
+            ],
+            "total_activated": crew_result["total_activated"],
+            "cache_efficiency": crew_result["cache_efficiency"],
+            "connections_healthy": self.connection_status.get("healthy"),
+            "engagement_timestamp": datetime.now().isoformat()
+        }
+
+    async def handle_route(self, request: Dict[str, Any]) -> Any:
+        """Crew members ranked for the request's capabilities"""
+        capabilities = request.get("capabilities")
+        if not isinstance(capabilities, list) or not all(isinstance(c, str) for c in capabilities):
+            raise ValueError("route needs 'capabilities' as a list of strings")
+        return self.engagement.route_task(capabilities, int(request.get("limit") or 0))
+
+    async def handle_dispatch(self, request: Dict[str, Any]) -> Any:
+        """Run a batch of tasks on the resident dispatcher and return their results"""
+        tasks = request.get("tasks")
+        if not isinstance(tasks, list) or not all(isinstance(task, dict) for task in tasks):
+            raise ValueError("dispatch needs 'tasks' as a list of objects")
+        return await self.dispatcher.run_batch(tasks)
+
+    async def handle_shutdown(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Stop serving once this reply is sent"""
+        self.stop_event.set()
+        return {"stopping": True}
+
+
+def main():
+    """Run the engagement daemon in the foreground"""
+    parser = argparse.ArgumentParser(description="Alex AI Engagement Daemon")
+    parser.add_argument("--socket", default=None, help="Unix socket path (default: per-user runtime path)")
+    parser.add_argument("--probe-interval", type=float, default=PROBE_INTERVAL, help="Seconds between backend probes")
+    args = parser.parse_args()
+
+    daemon = EngagementDaemon(args.socket, args.probe_interval)
+    try:
+        asyncio.run(daemon.serve())
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+Alex AI Engagement Connection Pool
+Pooled, health-checked backend clients for N8N, Supabase and OpenRouter shared by every engagement in a process
+"""
+
+import os
+import sys
+import time
+import atexit
+import threading
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Callable, Iterator, List, Optional
+
+# Backends the engagement talks to; a backend without a URL is simulated
+BACKENDS = [
+    {
+        "name": "n8n",
+        "url_env": "N8N_BASE_URL",
+        "key_env": "N8N_API_KEY",
+        "headers": {"X-N8N-API-KEY": "{key}"},
+        "health_path": "/healthz",
+        "simulated_latency": 0.1
+    },
+    {
+        "name": "supabase",
+        "url_env": "SUPABASE_URL",
+        "key_env": "SUPABASE_ANON_KEY",
+        "headers": {"apikey": "{key}", "Authorization": "Bearer {key}"},
+        "health_path": "/rest/v1/",
+        "simulated_latency": 0.05
+    },
+    {
+        "name": "openrouter",
+        "url_env": "OPENROUTER_BASE_URL",
+        # The public endpoint is used once an API key is configured
+        "default_url": "https://openrouter.ai/api/v1",
+        "key_env": "OPENROUTER_API_KEY",
+        "headers": {"Authorization": "Bearer {key}"},
+        "health_path": "/models",
+        "simulated_latency": 0.08
+    }
+]
+
+MIN_POOL_SIZE = 1
+MAX_POOL_SIZE = 4
+# Seconds an idle connection above the minimum is kept before it is closed
+IDLE_TIMEOUT = 60.0
+# Seconds between background eviction and health-check passes
+HEALTH_INTERVAL = 30.0
+REQUEST_TIMEOUT = 5.0
+
+
+class HTTPConnection:
+    """One keep-alive HTTP session against a backend base URL"""
+
+    mode = "http"
+
+    def __init__(self, base_url: str, headers: Dict[str, str], health_path: str, timeout: float = REQUEST_TIMEOUT,
+                 connect_timeout: Optional[float] = None):
+        try:
+            import requests
+        except ImportError:
+            raise RuntimeError("requests is not installed; cannot open HTTP connections")
+        self.base_url = base_url.rstrip("/")
+        self.health_path = health_path
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update(headers)
+        # Open the TCP/TLS connection now so the first lease gets a warm socket, within the caller's budget
+        self.check(connect_timeout)
+
+    def request(self, method: str, path: str, **kwargs) -> Any:
+        """Send a request relative to the backend base URL"""
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.request(method, self.base_url + path, **kwargs)
+
+    def check(self, timeout: Optional[float] = None) -> bool:
+        """True when the backend answers its health endpoint within ``timeout`` (default: the request timeout)"""
+        try:
+            return self.request("GET", self.health_path, timeout=timeout or self.timeout).ok
+        except Exception:
+            return False
+
+    def close(self):
+        """Close the underlying session and its sockets"""
+        self.session.close()
+
+
+class SimulatedConnection:
+    """Stand-in for a backend with no configured URL: pays the connect latency once, like a real socket"""
+
+    mode = "simulated"
+
+    def __init__(self, backend: str, latency: float, connect_timeout: Optional[float] = None):
+        self.backend = backend
+        if connect_timeout is not None and latency > connect_timeout:
+            time.sleep(connect_timeout)
+            raise TimeoutError(f"{backend} did not connect within {connect_timeout}s")
+        time.sleep(latency)
+        self.closed = False
+
+    def request(self, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """Answer every request locally"""
+        return {"backend": self.backend, "method": method, "path": path, "simulated": True}
+
+    def check(self, timeout: Optional[float] = None) -> bool:
+        """Healthy until closed"""
+        return not self.closed
+
+    def close(self):
+        """Mark the connection closed"""
+        self.closed = True
+
+
+def connection_factory(backend: Dict[str, Any]) -> Callable[[], Any]:
+    """Connection constructor for a backend, resolved from the environment"""
+    key = os.environ.get(backend["key_env"], "")
+    url = os.environ.get(backend["url_env"]) or (backend.get("default_url") if key else None)
+    if not url:
+        return partial(SimulatedConnection, backend["name"], backend["simulated_latency"])
+    headers = {header: value.format(key=key) for header, value in backend["headers"].items() if key}
+    return partial(HTTPConnection, url, headers, backend["health_path"])
+
+
+class BackendPool:
+    """Bounded pool of connections to one backend.
+
+    Connections are handed out most-recently-used first, so the warmest socket
+    is reused and the coldest ones age out. New connections are opened outside
+    the lock, so a slow connect never blocks leases of idle connections. When
+    ``max_size`` connections are leased, callers wait for a release up to their
+    timeout. A connection opened for a lease with a timeout must connect
+    within what is left of it. ``evict_idle`` closes connections idle longer than
+    ``idle_timeout`` down to ``min_size``; ``health_check`` drops idle
+    connections that fail their check and refills to ``min_size``.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Any], min_size: int = MIN_POOL_SIZE,
+                 max_size: int = MAX_POOL_SIZE, idle_timeout: float = IDLE_TIMEOUT):
+        self.name = name
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max(max_size, min_size, 1)
+        self.idle_timeout = idle_timeout
+        self.mode = getattr(getattr(factory, "func", factory), "mode", "custom")
+        self.condition = threading.Condition()
+        # (connection, released_at) with the most recently released at the right
+        self.idle: deque = deque()
+        self.in_use = 0
+        self.opening = 0
+        self.closed = False
+        self.leased_at: Dict[int, float] = {}
+        self.stats = {
+            "leases": 0, "created": 0, "reused": 0, "waits": 0, "timeouts": 0, "connect_failures": 0,
+            "evicted_idle": 0, "discarded": 0, "health_checks": 0, "health_failures": 0,
+            "peak_in_use": 0, "wait_time": 0.0, "max_wait": 0.0, "lease_time": 0.0
+        }
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """Lease a connection, reusing an idle one when possible"""
+        start = time.monotonic()
+        connection = None
+        with self.condition:
+            waited = False
+            while True:
+                if self.closed:
+                    raise RuntimeError(f"{self.name} pool is closed")
+                if self.idle:
+                    connection = self.idle.pop()[0]
+                    self.stats["reused"] += 1
+                    break
+                if self.in_use + self.opening < self.max_size:
+                    self.opening += 1
+                    break
+                remaining = None if timeout is None else timeout - (time.monotonic() - start)
+                if remaining is not None and remaining <= 0:
+                    self.stats["timeouts"] += 1
+                    raise TimeoutError(f"no {self.name} connection free within {timeout}s")
+                if not waited:
+                    self.stats["waits"] += 1
+                    waited = True
+                self.condition.wait(remaining)
+            if connection is not None:
+                self._leased(connection, start)
+                return connection
+
+        try:
+            if timeout is None:
+                connection = self.factory()
+            else:
+                connection = self.factory(connect_timeout=max(timeout - (time.monotonic() - start), 0.001))
+        except Exception:
+            with self.condition:
+                self.opening -= 1
+                self.stats["connect_failures"] += 1
+                self.condition.notify()
+            raise
+        with self.condition:
+            self.opening -= 1
+            self.stats["created"] += 1
+            self._leased(connection, start)
+        return connection
+
+    def release(self, connection: Any, discard: bool = False):
+        """Return a leased connection; discarded or post-close connections are closed instead"""
+        with self.condition:
+            self.in_use -= 1
+            leased_at = self.leased_at.pop(id(connection), None)
+            if leased_at is not None:
+                self.stats["lease_time"] += time.monotonic() - leased_at
+            keep = not discard and not self.closed
+            if keep:
+                self.idle.append((connection, time.monotonic()))
+            else:
+                self.stats["discarded"] += discard
+            self.condition.notify()
+        if not keep:
+            connection.close()
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        """Context-managed lease; a connection that raised is not trusted again"""
+        connection = self.acquire(timeout)
+        try:
+            yield connection
+        except BaseException:
+            self.release(connection, discard=True)
+            raise
+        else:
+            self.release(connection)
+
+    def fill(self) -> int:
+        """Open connections until the pool holds ``min_size``; returns how many were opened"""
+        opened = 0
+        while True:
+            with self.condition:
+                if self.closed or self.in_use + self.opening + len(self.idle) >= self.min_size:
+                    return opened
+                self.opening += 1
+            try:
+                connection = self.factory()
+            except Exception:
+                with self.condition:
+                    self.opening -= 1
+                    self.stats["connect_failures"] += 1
+                return opened
+            with self.condition:
+                self.opening -= 1
+                self.stats["created"] += 1
+                self.idle.appendleft((connection, time.monotonic()))
+                self.condition.notify()
+            opened += 1
+
+    def evict_idle(self) -> int:
+        """Close connections idle longer than ``idle_timeout``, keeping ``min_size``"""
+        now = time.monotonic()
+        evicted = []
+        with self.condition:
+            # Oldest releases sit on the left
+            while (self.idle and now - self.idle[0][1] > self.idle_timeout
+                   and self.in_use + self.opening + len(self.idle) > self.min_size):
+                evicted.append(self.idle.popleft()[0])
+            self.stats["evicted_idle"] += len(evicted)
+        for connection in evicted:
+            connection.close()
+        return len(evicted)
+
+    def health_check(self) -> int:
+        """Check idle connections, drop failing ones and refill; returns how many failed"""
+        with self.condition:
+            checking = list(self.idle)
+            self.idle.clear()
+            self.in_use += len(checking)
+        failed = 0
+        for connection, released_at in checking:
+            healthy = connection.check()
+            with self.condition:
+                self.in_use -= 1
+                self.stats["health_checks"] += 1
+                if healthy and not self.closed:
+                    self.idle.appendleft((connection, released_at))
+                    self.condition.notify()
+                    continue
+                failed += 1
+                self.stats["health_failures"] += not healthy
+            connection.close()
+        self.fill()
+        return failed
+
+    def close(self):
+        """Close idle connections; leased ones are closed when released"""
+        with self.condition:
+            self.closed = True
+            idle = [connection for connection, _ in self.idle]
+            self.idle.clear()
+            self.condition.notify_all()
+        for connection in idle:
+            connection.close()
+
+    def metrics(self) -> Dict[str, Any]:
+        """Pool occupancy plus lease, reuse and health counters"""
+        with self.condition:
+            stats = dict(self.stats)
+            stats.update(in_use=self.in_use, idle=len(self.idle), min_size=self.min_size, max_size=self.max_size)
+        leases = stats["leases"]
+        stats["reuse_rate"] = stats["reused"] / leases if leases else 0.0
+        stats["avg_wait"] = stats["wait_time"] / leases if leases else 0.0
+        for field in ("wait_time", "max_wait", "lease_time", "avg_wait", "reuse_rate"):
+            stats[field] = round(stats[field], 4)
+        return stats
+
+    def _leased(self, connection: Any, start: float):
+        now = time.monotonic()
+        wait = now - start
+        self.in_use += 1
+        self.leased_at[id(connection)] = now
+        self.stats["leases"] += 1
+        self.stats["wait_time"] += wait
+        self.stats["max_wait"] = max(self.stats["max_wait"], wait)
+        self.stats["peak_in_use"] = max(self.stats["peak_in_use"], self.in_use)
+
+
+class ConnectionPoolManager:
+    """One ``BackendPool`` per backend plus a background eviction and health-check thread"""
+
+    def __init__(self, backends: Optional[List[Dict[str, Any]]] = None, min_size: int = MIN_POOL_SIZE,
+                 max_size: int = MAX_POOL_SIZE, idle_timeout: float = IDLE_TIMEOUT,
+                 health_interval: float = HEALTH_INTERVAL):
+        self.backends = backends if backends is not None else BACKENDS
+        self.health_interval = health_interval
+        self.pools = {
+            backend["name"]: BackendPool(backend["name"], connection_factory(backend), min_size, max_size, idle_timeout)
+            for backend in self.backends
+        }
+        self.stop_event = threading.Event()
+        self.health_thread: Optional[threading.Thread] = None
+
+    def pool(self, name: str) -> BackendPool:
+        """Pool for a backend by name"""
+        try:
+            return self.pools[name]
+        except KeyError:
+            raise ValueError(f"unknown backend: {name}")
+
+    def lease(self, name: str, timeout: Optional[float] = None):
+        """Context-managed connection lease from a backend's pool"""
+        return self.pool(name).lease(timeout)
+
+    def warm(self, names: Optional[List[str]] = None) -> Dict[str, int]:
+        """Open every pool's minimum connections concurrently; returns connections opened per backend"""
+        names = names or list(self.pools)
+        with ThreadPoolExecutor(max_workers=len(names) or 1) as executor:
+            opened = executor.map(lambda name: self.pools[name].fill(), names)
+            return dict(zip(names, opened))
+
+    def maintain(self):
+        """One eviction and health-check pass over every pool"""
+        for pool in self.pools.values():
+            pool.evict_idle()
+            pool.health_check()
+
+    def start_health_checks(self):
+        """Run ``maintain`` every ``health_interval`` seconds in a daemon thread"""
+        if self.health_thread is not None:
+            return
+        self.health_thread = threading.Thread(target=self._health_loop, name="engagement-pool-health", daemon=True)
+        self.health_thread.start()
+
+    def close(self):
+        """Stop the health-check thread and close every pool"""
+        self.stop_event.set()
+        if self.health_thread is not None:
+            self.health_thread.join(timeout=1.0)
+        for pool in self.pools.values():
+            pool.close()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-backend pool metrics including how each backend is reached"""
+        return {name: {"mode": pool.mode, **pool.metrics()} for name, pool in self.pools.items()}
+
+    def _health_loop(self):
+        while not self.stop_event.wait(self.health_interval):
+            self.maintain()
+
+
+_manager: Optional[ConnectionPoolManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_pool_manager() -> ConnectionPoolManager:
+    """Process-wide pool manager, created with background health checks on first use"""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = ConnectionPoolManager()
+            _manager.start_health_checks()
+            atexit.register(_manager.close)
+        return _manager
+
+
+def main():
+    """Warm every backend pool, lease from each a few times and print the pool metrics"""
+    manager = get_pool_manager()
+    print("🔌 Alex AI Engagement Connection Pool")
+    start = time.perf_counter()
+    manager.warm()
+    print(f"   Warmed {len(manager.pools)} pools in {time.perf_counter() - start:.3f}s")
+
+    for name in manager.pools:
+        for _ in range(3):
+            with manager.lease(name, timeout=REQUEST_TIMEOUT) as connection:
+                connection.check()
+
+    for name, metrics in manager.metrics().items():
+        print(f"   {name} ({metrics['mode']}): {metrics['created']} opened, {metrics['leases']} leases, "
+              f"{metrics['reuse_rate']:.0%} reused, {metrics['idle']} idle")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
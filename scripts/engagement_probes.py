@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Alex AI Engagement Probes
+Concurrent backend health probes with per-probe deadlines and early return once the required set is healthy
+"""
+
+import time
+import asyncio
+import inspect
+import threading
+from typing import Dict, Any, Callable, List, Optional
+
+# Seconds a probe may take before it counts as timed out
+DEFAULT_DEADLINE = 2.0
+
+
+class ProbeRunner:
+    """Run every backend probe at once and stop as soon as the outcome is known.
+
+    A probe is a dict with a ``name``, a ``check`` callable returning a truthy
+    value when the backend is healthy, an optional ``deadline`` in seconds and
+    an optional ``required`` flag (default True). Coroutine checks are awaited
+    directly; plain functions run on their own daemon thread so a blocking
+    HTTP call does not hold up the others, and a check that hangs past its
+    deadline is abandoned rather than joined, so it cannot hold up the run
+    or interpreter exit either. The run ends when every required probe is
+    healthy or the first required probe fails, so startup costs the slowest
+    required probe rather than the sum of all of them. Optional probes still
+    running at that point are cancelled and reported as ``pending``.
+    """
+
+    def __init__(self, probes: List[Dict[str, Any]], default_deadline: float = DEFAULT_DEADLINE):
+        self.probes = probes
+        self.default_deadline = default_deadline
+
+    async def run(self) -> Dict[str, Any]:
+        """Probe all backends concurrently; returns per-probe results and overall health"""
+        start = time.perf_counter()
+        tasks = {asyncio.create_task(self._probe(probe)): probe for probe in self.probes}
+        required_left = {probe["name"] for probe in self.probes if probe.get("required", True)}
+        # With nothing required there is no early exit: wait for every probe
+        wait_for_all = not required_left
+
+        results: Dict[str, Dict[str, Any]] = {}
+        required_failed = False
+        pending = set(tasks)
+        while pending and not required_failed and (required_left or wait_for_all):
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                result = task.result()
+                results[result["name"]] = result
+                if result["required"]:
+                    if result["healthy"]:
+                        required_left.discard(result["name"])
+                    else:
+                        required_failed = True
+
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        for task in pending:
+            probe = tasks[task]
+            results[probe["name"]] = self._result(probe, "pending", None, None)
+
+        return {
+            "results": {probe["name"]: results[probe["name"]] for probe in self.probes},
+            "healthy": not required_failed and not required_left,
+            "elapsed": round(time.perf_counter() - start, 4)
+        }
+
+    async def _probe(self, probe: Dict[str, Any]) -> Dict[str, Any]:
+        deadline = probe.get("deadline", self.default_deadline)
+        check = probe["check"]
+        probe_start = time.perf_counter()
+        try:
+            call = check() if inspect.iscoroutinefunction(check) else run_in_daemon_thread(check)
+            status = "healthy" if await asyncio.wait_for(call, deadline) else "unhealthy"
+            error = None
+        except asyncio.TimeoutError:
+            status, error = "timeout", f"no answer within {deadline}s"
+        except Exception as e:
+            status, error = "error", str(e)
+        return self._result(probe, status, time.perf_counter() - probe_start, error)
+
+    def _result(self, probe: Dict[str, Any], status: str, latency: Optional[float],
+                error: Optional[str]) -> Dict[str, Any]:
+        return {
+            "name": probe["name"],
+            "required": probe.get("required", True),
+            "healthy": status == "healthy",
+            "status": status,
+            "latency": round(latency, 4) if latency is not None else None,
+            "error": error
+        }
+
+
+def run_in_daemon_thread(check: Callable[[], Any]) -> asyncio.Future:
+    """Future for a blocking call run on a daemon thread that nothing waits for once the future is dropped"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter: Callable[[Any], None], value: Any):
+        if not future.done():
+            setter(value)
+
+    def run():
+        try:
+            outcome = (future.set_result, check())
+        except BaseException as e:
+            outcome = (future.set_exception, e)
+        try:
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # The loop already closed: the probe was abandoned at its deadline
+
+    threading.Thread(target=run, name="engagement-probe", daemon=True).start()
+    return future
+
+
+def run_probes(probes: List[Dict[str, Any]], default_deadline: float = DEFAULT_DEADLINE) -> Dict[str, Any]:
+    """Synchronous entry point for callers outside an event loop"""
+    return asyncio.run(ProbeRunner(probes, default_deadline).run())
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Alex AI Adaptive Probe Planner
+Coverage-guided payload scheduling that prunes unproductive endpoints and payload families
+"""
+
+from collections import Counter
+from typing import Dict, List, Any, Iterator, Tuple
+
+
+class AdaptiveProbePlanner:
+    """Spend a request budget on the payload families and endpoints that respond differentially.
+
+    Every endpoint gets a benign baseline probe first. Each payload probe is then
+    compared against that baseline on status code, body length and latency; a
+    probe that differs is "differential" and raises the score of both its family
+    and its endpoint. Endpoints that answer every probe with the same 404 (or do
+    not answer at all) and families that never produce a differential response
+    are pruned once they have been sampled ``min_samples`` times.
+    """
+
+    DEAD_STATUS_CODES = (0, 404)
+
+    def __init__(self, budget: int = 200, min_samples: int = 3,
+                 length_tolerance: float = 0.1, timing_factor: float = 3.0,
+                 timing_floor: float = 0.5):
+        self.budget = budget
+        self.min_samples = min_samples
+        self.length_tolerance = length_tolerance
+        self.timing_factor = timing_factor
+        self.timing_floor = timing_floor
+
+        self.requests_sent = 0
+        self.baselines: Dict[str, Dict[str, Any]] = {}
+        self.endpoint_stats: Dict[str, Dict[str, Any]] = {}
+        self.family_stats: Dict[str, Dict[str, int]] = {}
+        self.pruned_endpoints: List[str] = []
+        self.pruned_families: List[str] = []
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def budget_remaining(self) -> int:
+        """Number of requests still available to the planner"""
+        return max(0, self.budget - self.requests_sent)
+
+    def record_baseline(self, endpoint: str, response: Dict[str, Any]):
+        """Record the benign baseline response for an endpoint"""
+        self.requests_sent += 1
+        self.baselines[endpoint] = self._signature(response)
+        self.endpoint_stats.setdefault(endpoint, {
+            "probes": 0,
+            "differential": 0,
+            "signatures": Counter()
+        })
+
+    def record(self, family: str, endpoint: str, response: Dict[str, Any]) -> bool:
+        """Record a payload response and return whether it was differential"""
+        self.requests_sent += 1
+        signature = self._signature(response)
+        differential = self.is_differential(endpoint, signature)
+
+        endpoint_stats = self.endpoint_stats.setdefault(endpoint, {
+            "probes": 0,
+            "differential": 0,
+            "signatures": Counter()
+        })
+        endpoint_stats["probes"] += 1
+        endpoint_stats["signatures"][(signature["status_code"], signature["length"])] += 1
+
+        family_stats = self.family_stats.setdefault(family, {"probes": 0, "live_probes": 0, "differential": 0})
+        family_stats["probes"] += 1
+        if self._endpoint_is_live(endpoint):
+            family_stats["live_probes"] += 1
+
+        if differential:
+            endpoint_stats["differential"] += 1
+            family_stats["differential"] += 1
+
+        self._update_pruning(family, endpoint)
+        return differential
+
+    def is_differential(self, endpoint: str, signature: Dict[str, Any]) -> bool:
+        """Compare a response signature against the endpoint baseline"""
+        baseline = self.baselines.get(endpoint)
+        if baseline is None:
+            return True
+
+        if signature["status_code"] != baseline["status_code"]:
+            return True
+
+        length_delta = abs(signature["length"] - baseline["length"])
+        if length_delta > max(32, baseline["length"] * self.length_tolerance):
+            return True
+
+        slow_threshold = max(self.timing_floor, baseline["elapsed"] * self.timing_factor)
+        if signature["elapsed"] > slow_threshold:
+            return True
+
+        return False
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def plan(self, families: Dict[str, List[Any]], endpoints: List[str]) -> Iterator[Tuple[str, Any, str]]:
+        """Yield (family, payload, endpoint) probes until the budget is spent
+
+        Probes are issued in rounds: round ``n`` sends the ``n``-th payload of every
+        live family to every live endpoint, most promising first. Scores are
+        re-read between probes, so pruning takes effect immediately.
+        """
+        max_round = max((len(payloads) for payloads in families.values()), default=0)
+
+        for round_index in range(max_round):
+            for family in self._ranked(self._live_families(families), self._family_score):
+                payloads = families[family]
+                if round_index >= len(payloads):
+                    continue
+
+                for endpoint in self._ranked(self._live_endpoints(endpoints), self._endpoint_score):
+                    if family in self.pruned_families:
+                        break
+                    if endpoint in self.pruned_endpoints:
+                        continue
+                    if self.budget_remaining() <= 0:
+                        return
+                    yield family, payloads[round_index], endpoint
+
+    def summary(self) -> Dict[str, Any]:
+        """Summarise how the budget was spent"""
+        return {
+            "budget": self.budget,
+            "requests_sent": self.requests_sent,
+            "pruned_endpoints": list(self.pruned_endpoints),
+            "pruned_families": list(self.pruned_families),
+            "family_scores": {
+                family: {"probes": stats["probes"], "differential": stats["differential"]}
+                for family, stats in self.family_stats.items()
+            },
+            "endpoint_scores": {
+                endpoint: {"probes": stats["probes"], "differential": stats["differential"]}
+                for endpoint, stats in self.endpoint_stats.items()
+            }
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _signature(self, response: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "status_code": response.get("status_code", 0),
+            "length": len(response.get("body", "")),
+            "elapsed": response.get("elapsed", 0.0)
+        }
+
+    def _update_pruning(self, family: str, endpoint: str):
+        endpoint_stats = self.endpoint_stats[endpoint]
+        if endpoint not in self.pruned_endpoints and endpoint_stats["probes"] >= self.min_samples:
+            baseline = self.baselines.get(endpoint)
+            signatures = endpoint_stats["signatures"]
+            if (baseline is not None
+                    and baseline["status_code"] in self.DEAD_STATUS_CODES
+                    and endpoint_stats["differential"] == 0
+                    and len(signatures) == 1):
+                self.pruned_endpoints.append(endpoint)
+
+        # A family is only judged unproductive on endpoints that actually answer;
+        # otherwise dead endpoints would take every family down with them.
+        family_stats = self.family_stats[family]
+        if (family not in self.pruned_families
+                and family_stats["live_probes"] >= self.min_samples
+                and family_stats["differential"] == 0):
+            self.pruned_families.append(family)
+
+    def _endpoint_is_live(self, endpoint: str) -> bool:
+        baseline = self.baselines.get(endpoint)
+        return baseline is not None and baseline["status_code"] not in self.DEAD_STATUS_CODES
+
+    def _live_families(self, families: Dict[str, List[Any]]) -> List[str]:
+        return [family for family in families if family not in self.pruned_families]
+
+    def _live_endpoints(self, endpoints: List[str]) -> List[str]:
+        return [endpoint for endpoint in endpoints if endpoint not in self.pruned_endpoints]
+
+    def _family_score(self, family: str) -> float:
+        stats = self.family_stats.get(family)
+        if not stats or not stats["probes"]:
+            return 1.0  # Unexplored families are treated as promising
+        return stats["differential"] / stats["probes"]
+
+    def _endpoint_score(self, endpoint: str) -> float:
+        stats = self.endpoint_stats.get(endpoint)
+        if not stats or not stats["probes"]:
+            return 1.0
+        return stats["differential"] / stats["probes"]
+
+    def _ranked(self, items: List[str], score) -> List[str]:
+        # sorted() is stable, so ties keep their declaration order
+        return sorted(items, key=lambda item: -score(item))
@@ -14,10 +14,16 @@ from typing import Dict, List, Any
 # Add the project root to the Python path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from payload_corpus import get_corpus
+from payload_classifiers import SQL_INJECTION_CLASSIFIER, XSS_CLASSIFIER
+from dlp_scanner import DLPScanner
+
 class AlexAISecurityTester:
     def __init__(self):
         self.test_results = []
         self.start_time = time.time()
+        self.corpus = get_corpus()
+        self.dlp_scanner = DLPScanner()
         
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all security tests and return comprehensive results"""
@@ -54,30 +60,8 @@ class AlexAISecurityTester:
         print("🔍 Testing SQL Injection Prevention...")
         
         test_cases = [
-            {
-                "name": "Normal Query",
-                "query": "SELECT * FROM users WHERE id = ?",
-                "params": [1],
-                "expected": "SAFE"
-            },
-            {
-                "name": "SQL Injection Attempt",
-                "query": "SELECT * FROM users WHERE id = 1 OR 1=1",
-                "params": [],
-                "expected": "BLOCKED"
-            },
-            {
-                "name": "UNION Attack",
-                "query": "SELECT * FROM users UNION SELECT * FROM passwords",
-                "params": [],
-                "expected": "BLOCKED"
-            },
-            {
-                "name": "DROP Table Attack",
-                "query": "SELECT * FROM users; DROP TABLE users;",
-                "params": [],
-                "expected": "BLOCKED"
-            }
+            {"name": entry["name"], "query": entry["payload"], "expected": entry["expect"]}
+            for entry in self.corpus.select("sql_injection", ["detector_case"])
         ]
         
         passed = 0
@@ -113,26 +97,8 @@ class AlexAISecurityTester:
         print("🔍 Testing XSS Prevention...")
         
         test_cases = [
-            {
-                "name": "Normal HTML",
-                "input": "<p>Hello <strong>world</strong>!</p>",
-                "expected": "SAFE"
-            },
-            {
-                "name": "Script Tag Attack",
-                "input": "<script>alert('XSS')</script><p>Hello</p>",
-                "expected": "BLOCKED"
-            },
-            {
-                "name": "Event Handler Attack",
-                "input": "<img src='x' onerror='alert(\"XSS\")'>",
-                "expected": "BLOCKED"
-            },
-            {
-                "name": "JavaScript URL Attack",
-                "input": "<a href='javascript:alert(\"XSS\")'>Click me</a>",
-                "expected": "BLOCKED"
-            }
+            {"name": entry["name"], "input": entry["payload"], "expected": entry["expect"]}
+            for entry in self.corpus.select("xss", ["detector_case"])
         ]
         
         passed = 0
@@ -232,26 +198,8 @@ class AlexAISecurityTester:
         print("🔍 Testing Data Loss Prevention...")
         
         test_cases = [
-            {
-                "name": "Credit Card Detection",
-                "content": "My card number is 4111-1111-1111-1111",
-                "expected_findings": 1
-            },
-            {
-                "name": "Email Detection",
-                "content": "Contact me at john.doe@example.com",
-                "expected_findings": 1
-            },
-            {
-                "name": "API Key Detection",
-                "content": "API_KEY=sk-1234567890abcdef1234567890abcdef",
-                "expected_findings": 1
-            },
-            {
-                "name": "Clean Content",
-                "content": "This is just normal text with no sensitive data",
-                "expected_findings": 0
-            }
+            {"name": entry["name"], "content": entry["payload"], "expected_findings": entry["expect"]}
+            for entry in self.corpus.select("sensitive_data", ["detector_case"])
         ]
         
         passed = 0
@@ -454,29 +402,11 @@ class AlexAISecurityTester:
     
     def detect_sql_injection(self, query: str) -> bool:
         """Simulate SQL injection detection"""
-        dangerous_patterns = [
-            "UNION", "DROP", "DELETE", "INSERT", "UPDATE", "EXEC", "EXECUTE",
-            "--", "/*", "*/", "OR 1=1", "AND 1=1", "';", "\";"
-        ]
-        
-        query_upper = query.upper()
-        for pattern in dangerous_patterns:
-            if pattern in query_upper:
-                return False
-        return True
+        return SQL_INJECTION_CLASSIFIER.is_safe(query)
     
     def detect_xss(self, content: str) -> bool:
         """Simulate XSS detection"""
-        dangerous_patterns = [
-            "<script", "</script>", "javascript:", "vbscript:", "onerror=",
-            "onload=", "onclick=", "onmouseover=", "onfocus=", "onblur="
-        ]
-        
-        content_lower = content.lower()
-        for pattern in dangerous_patterns:
-            if pattern in content_lower:
-                return False
-        return True
+        return XSS_CLASSIFIER.is_safe(content)
     
     def simulate_authentication(self, test_case: Dict) -> str:
         """Simulate authentication process"""
@@ -492,21 +422,8 @@ class AlexAISecurityTester:
     
     def scan_sensitive_data(self, content: str) -> List[str]:
         """Simulate sensitive data scanning"""
-        findings = []
-        
-        # Credit card pattern
-        if "4111-1111-1111-1111" in content:
-            findings.append("Credit Card")
-        
-        # Email pattern
-        if "@" in content and "." in content:
-            findings.append("Email")
-        
-        # API key pattern
-        if "API_KEY=" in content or "sk-" in content:
-            findings.append("API Key")
-        
-        return findings
+        findings = self.dlp_scanner.scan_text(content)
+        return list(dict.fromkeys(finding["label"] for finding in findings))
     
     def simulate_api_security(self, test_case: Dict) -> str:
         """Simulate API security checks"""
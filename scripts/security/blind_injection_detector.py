@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Alex AI Timing-Based Blind Injection Detector
+Detects time-delay SQL injection from latency distributions instead of response bodies
+"""
+
+import math
+import time
+import statistics
+import requests
+from typing import Dict, List, Any, Callable, Optional
+
+from http_session import stateless_session
+
+# Time-delay payload templates; {delay} is replaced with whole seconds
+TIME_DELAY_PAYLOADS = {
+    "mssql_waitfor": "1'; WAITFOR DELAY '00:00:{delay:02d}'--",
+    "mysql_sleep": "1'; SELECT SLEEP({delay})--",
+    "mysql_subquery_sleep": "1' AND (SELECT SLEEP({delay}))--",
+    "postgres_pg_sleep": "1'; SELECT pg_sleep({delay})--"
+}
+
+
+class TimingBlindInjectionDetector:
+    """Decide whether an endpoint executes injected delays using repeated timing samples.
+
+    Control probes (a benign value) and delay probes (a time-delay payload) are
+    sent one at a time, alternating, on a dedicated HTTP session, so the timing
+    measurements never share connections with the rest of the test load and a
+    backend that serialises requests never queues a control behind a sleeping
+    payload. After each round the detector either reaches a verdict or samples
+    again:
+
+    * if every delay probe came back well short of the injected delay, the
+      endpoint cannot be sleeping and the verdict is NOT_VULNERABLE;
+    * otherwise a one-sided Mann-Whitney U test compares the two latency
+      distributions, and a significant shift of at least half the injected
+      delay is reported as VULNERABLE.
+
+    Most endpoints are not vulnerable and are settled after a single round. The
+    exact test cannot go below 1 / C(2n, n) with n probes of each kind, so a
+    VULNERABLE verdict needs C(2n, n) > 1 / alpha: at alpha 0.05, four probes
+    each (the default, one round) rather than three (p >= 0.05, two rounds).
+    """
+
+    def __init__(self, base_url: str, delay_seconds: int = 2, probes_per_round: int = 4,
+                 max_rounds: int = 4, alpha: float = 0.05, time_budget: float = 60.0,
+                 request_timeout: float = 15.0):
+        self.base_url = base_url
+        self.delay_seconds = delay_seconds
+        self.probes_per_round = probes_per_round
+        self.max_rounds = max_rounds
+        self.alpha = alpha
+        self.time_budget = time_budget
+        self.request_timeout = request_timeout
+        self.requests_sent = 0
+
+        # Timing probes get their own connection so they are never queued
+        # behind, or reuse connections warmed by, the rest of the load
+        self.session = stateless_session(pool_connections=1, pool_maxsize=1)
+
+    def close(self):
+        """Release the dedicated timing session"""
+        self.session.close()
+
+    def scan(self, endpoints: List[str], build_body: Callable[[str, str], Dict[str, Any]],
+             control_value: str = "1", templates: Optional[Dict[str, str]] = None) -> List[Dict[str, Any]]:
+        """Probe every endpoint with every delay template and return one verdict per pair"""
+        templates = templates or TIME_DELAY_PAYLOADS
+        deadline = time.time() + self.time_budget
+        verdicts = []
+
+        for endpoint in endpoints:
+            for technique, template in templates.items():
+                if time.time() >= deadline:
+                    verdicts.append(self._verdict(endpoint, technique, template, "INCONCLUSIVE",
+                                                  [], [], 0, reason="time budget exhausted"))
+                    continue
+
+                verdict = self.probe(endpoint, build_body, control_value, technique, template, deadline)
+                verdicts.append(verdict)
+
+                # An endpoint that does not answer will not answer the next template either
+                if verdict["verdict"] == "SKIPPED":
+                    break
+
+        return verdicts
+
+    def probe(self, endpoint: str, build_body: Callable[[str, str], Dict[str, Any]], control_value: str,
+              technique: str, template: str, deadline: float) -> Dict[str, Any]:
+        """Sample one endpoint/template pair until the latency distributions decide it"""
+        payload = template.format(delay=self.delay_seconds)
+        control_times: List[float] = []
+        delay_times: List[float] = []
+        rounds = 0
+
+        while rounds < self.max_rounds and time.time() < deadline:
+            rounds += 1
+
+            # Sequential and interleaved (control, delay, delay, control, ...): probes never
+            # overlap on the endpoint, and drift affects both kinds equally
+            statuses = []
+            for pair in range(self.probes_per_round):
+                order = ("control", "delay") if pair % 2 == 0 else ("delay", "control")
+                for kind in order:
+                    value = control_value if kind == "control" else payload
+                    elapsed, status_code = self._timed_request(endpoint, build_body(endpoint, value))
+                    statuses.append(status_code)
+                    (control_times if kind == "control" else delay_times).append(elapsed)
+
+            if rounds == 1 and all(status in (0, 404) for status in statuses):
+                return self._verdict(endpoint, technique, payload, "SKIPPED", control_times,
+                                     delay_times, rounds, reason="endpoint not reachable")
+
+            decision = self._decide(control_times, delay_times)
+            if decision is not None:
+                return self._verdict(endpoint, technique, payload, decision, control_times,
+                                     delay_times, rounds)
+
+        return self._verdict(endpoint, technique, payload, "INCONCLUSIVE", control_times,
+                             delay_times, rounds, reason="sample limit reached")
+
+    def _timed_request(self, endpoint: str, body: Dict[str, Any]):
+        self.requests_sent += 1
+        start = time.perf_counter()
+        try:
+            response = self.session.post(f"{self.base_url}{endpoint}", json=body,
+                                         timeout=self.request_timeout)
+            return time.perf_counter() - start, response.status_code
+        except requests.exceptions.Timeout:
+            # A timeout still carries timing information: the request took at least this long
+            return self.request_timeout, -1
+        except requests.exceptions.RequestException:
+            return time.perf_counter() - start, 0
+
+    def _decide(self, control_times: List[float], delay_times: List[float]) -> Optional[str]:
+        control_median = statistics.median(control_times)
+        shift_needed = self.delay_seconds * 0.5
+
+        # An executed delay slows *every* delay probe, so one round suffices to rule it out
+        if max(delay_times) < control_median + shift_needed:
+            return "NOT_VULNERABLE"
+
+        p_value = mann_whitney_p(delay_times, control_times)
+        shift = statistics.median(delay_times) - control_median
+        if p_value < self.alpha and shift >= shift_needed:
+            return "VULNERABLE"
+
+        return None
+
+    def _verdict(self, endpoint: str, technique: str, payload: str, verdict: str,
+                 control_times: List[float], delay_times: List[float], rounds: int,
+                 reason: str = "") -> Dict[str, Any]:
+        result = {
+            "endpoint": endpoint,
+            "technique": technique,
+            "payload": payload,
+            "verdict": verdict,
+            "rounds": rounds,
+            "samples": len(control_times) + len(delay_times),
+            "control_median": round(statistics.median(control_times), 4) if control_times else None,
+            "delay_median": round(statistics.median(delay_times), 4) if delay_times else None,
+            "p_value": round(mann_whitney_p(delay_times, control_times), 5) if control_times and delay_times else None
+        }
+        if reason:
+            result["reason"] = reason
+        return result
+
+
+def mann_whitney_p(greater: List[float], lesser: List[float]) -> float:
+    """One-sided Mann-Whitney U p-value for 'greater' being stochastically larger than 'lesser'
+
+    Uses the exact null distribution for the small samples the detector
+    collects, and the normal approximation for larger ones.
+    """
+    n1, n2 = len(greater), len(lesser)
+    if n1 == 0 or n2 == 0:
+        return 1.0
+
+    u_statistic = sum(1.0 if g > l else 0.5 if g == l else 0.0 for g in greater for l in lesser)
+
+    if n1 * n2 <= 400:
+        counts = _u_distribution(n1, n2)
+        threshold = math.ceil(u_statistic)
+        return sum(counts[threshold:]) / sum(counts)
+
+    mean = n1 * n2 / 2
+    std = math.sqrt(n1 * n2 * (n1 + n2 + 1) / 12)
+    z = (u_statistic - mean - 0.5) / std
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _u_distribution(n1: int, n2: int) -> List[int]:
+    """Number of rank arrangements giving each U value under the null hypothesis"""
+    # table[j] holds the counts for (i, j); built up one row of the first sample at a time
+    table = [[1] for _ in range(n2 + 1)]
+    for i in range(1, n1 + 1):
+        row = [[1]]
+        for j in range(1, n2 + 1):
+            size = i * j + 1
+            counts = [0] * size
+            # The largest observation belongs to the first sample (adds j to U) or the second
+            for u, count in enumerate(table[j]):
+                counts[u + j] += count
+            for u, count in enumerate(row[j - 1]):
+                counts[u] += count
+            row.append(counts)
+        table = row
+    return table[n2]
@@ -0,0 +1,407 @@
+#!/usr/bin/env python3
+"""
+Alex AI Dependency Graph
+Monorepo-wide npm dependency graph checked against an offline advisory database
+"""
+
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+from bisect import bisect_left
+from collections import deque
+from typing import Dict, List, Any, Optional, Tuple
+
+ADVISORY_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "advisories", "npm_advisories.json")
+
+SEVERITIES = ["LOW", "MEDIUM", "HIGH", "CRITICAL"]
+
+DEPENDENCY_FIELDS = ("dependencies", "devDependencies", "optionalDependencies", "peerDependencies")
+
+Version = Tuple[Any, ...]
+# (low, low inclusive, high, high inclusive); None means unbounded
+Interval = Tuple[Optional[Version], bool, Optional[Version], bool]
+
+
+def extract_manifest(content: bytes) -> Dict[str, Any]:
+    """Name, workspace globs and dependency sets of a package.json"""
+    manifest = json.loads(content)
+    return {
+        "name": manifest.get("name"),
+        "workspaces": manifest.get("workspaces", []),
+        **{field: manifest.get(field, {}) for field in DEPENDENCY_FIELDS}
+    }
+
+
+def parse_version(text: str) -> Optional[Version]:
+    """Sortable key for a semver version, or None for tags, URLs and other non-versions"""
+    text = text.strip().lstrip("v=")
+    core, _, prerelease = text.split("+", 1)[0].partition("-")
+    parts = core.split(".")
+    if len(parts) != 3 or not all(part.isdigit() for part in parts):
+        return None
+    if not prerelease:
+        # A release sorts after all of its pre-releases
+        return (int(parts[0]), int(parts[1]), int(parts[2]), 1, ())
+    identifiers = tuple((0, int(item), "") if item.isdigit() else (1, 0, item) for item in prerelease.split("."))
+    return (int(parts[0]), int(parts[1]), int(parts[2]), 0, identifiers)
+
+
+def parse_range(text: str) -> List[Interval]:
+    """Intervals of an advisory range such as ">=2.18.0 <2.29.4 || <1.0.2".
+
+    Only the comparator form advisories use is supported (<, <=, >, >=, = and
+    bare versions); npm's ^ and ~ shorthands never appear in advisory data.
+    """
+    intervals = []
+    for alternative in text.split("||"):
+        low, low_inclusive, high, high_inclusive = None, False, None, False
+        for comparator in alternative.split():
+            if comparator == "*":
+                continue
+            operator = comparator.rstrip("0123456789.-+abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
+            version = parse_version(comparator[len(operator):])
+            if version is None:
+                raise ValueError(f"Unsupported version in range: {text}")
+            if operator in (">", ">="):
+                low, low_inclusive = version, operator == ">="
+            elif operator in ("<", "<="):
+                high, high_inclusive = version, operator == "<="
+            elif operator in ("", "="):
+                low, low_inclusive, high, high_inclusive = version, True, version, True
+            else:
+                raise ValueError(f"Unsupported comparator in range: {text}")
+        intervals.append((low, low_inclusive, high, high_inclusive))
+    return intervals
+
+
+class AdvisoryDatabase:
+    """Offline advisories indexed for one-bisect lookups per installed package.
+
+    For each package the end points of every vulnerable interval are sorted
+    into one list of bounds. That splits the version line into slots: each
+    bound itself and the open gaps between bounds. Every slot stores the
+    advisories covering it, so finding the advisories for a version is one
+    dictionary lookup and one binary search, however many advisories or
+    overlapping ranges a package has.
+    """
+
+    def __init__(self, path: str = ADVISORY_DB):
+        self.path = path
+        with open(path, "r") as f:
+            data = json.load(f)
+        self.version = data.get("version", "0")
+        self.advisories: List[Dict[str, Any]] = data.get("advisories", [])
+        self.index: Dict[str, Tuple[List[Version], List[Tuple[int, ...]]]] = {}
+
+        by_package: Dict[str, List[Tuple[int, Interval]]] = {}
+        for number, advisory in enumerate(self.advisories):
+            for interval in parse_range(advisory["vulnerable"]):
+                by_package.setdefault(advisory["package"], []).append((number, interval))
+        for package, intervals in by_package.items():
+            self.index[package] = self._build_slots(intervals)
+
+    def __len__(self) -> int:
+        return len(self.advisories)
+
+    def lookup(self, package: str, version: str) -> List[Dict[str, Any]]:
+        """Advisories affecting one installed version of a package"""
+        entry = self.index.get(package)
+        if entry is None:
+            return []
+        key = parse_version(version)
+        if key is None:
+            return []
+        bounds, slots = entry
+        position = bisect_left(bounds, key)
+        on_bound = position < len(bounds) and bounds[position] == key
+        return [self.advisories[number] for number in slots[2 * position + 1 if on_bound else 2 * position]]
+
+    def _build_slots(self, intervals: List[Tuple[int, Interval]]) -> Tuple[List[Version], List[Tuple[int, ...]]]:
+        bounds = sorted({bound for _, (low, _, high, _) in intervals for bound in (low, high) if bound is not None})
+        where = {bound: position for position, bound in enumerate(bounds)}
+
+        # Slot 2i is the gap just below bounds[i] (the last one is above every bound); slot 2i + 1 is bounds[i]
+        slots: List[List[int]] = [[] for _ in range(2 * len(bounds) + 1)]
+        for number, (low, low_inclusive, high, high_inclusive) in intervals:
+            low_at = where[low] if low is not None else None
+            high_at = where[high] if high is not None else None
+            for slot in range(len(slots)):
+                position, on_bound = divmod(slot, 2)
+                if on_bound:
+                    above_low = low_at is None or low_at < position or (low_at == position and low_inclusive)
+                    below_high = high_at is None or high_at > position or (high_at == position and high_inclusive)
+                else:
+                    above_low = low_at is None or low_at < position
+                    below_high = high_at is None or high_at >= position
+                if above_low and below_high and number not in slots[slot]:
+                    slots[slot].append(number)
+        return bounds, [tuple(numbers) for numbers in slots]
+
+
+class DependencyGraph:
+    """Every installed package of the monorepo, keyed by its node_modules path.
+
+    Resolved versions come from package-lock.json (lockfile v2/v3 ``packages``,
+    or the nested v1 ``dependencies``); declared ranges come from the root and
+    every workspace package.json. Edges follow npm's resolution rule: a
+    dependency of ``node_modules/a`` is looked up in ``node_modules/a/node_modules``
+    first and then in each enclosing ``node_modules`` directory. Given a file
+    content index, manifests are read through it and only re-parsed when they
+    change.
+    """
+
+    def __init__(self, index: Optional[Any] = None):
+        self.index = index
+        self.packages: Dict[str, Dict[str, Any]] = {}
+        self.by_name: Dict[str, List[str]] = {}
+        self.workspaces: Dict[str, Dict[str, Any]] = {}
+        # Workspace declarations recorded in the lockfile, keyed by workspace path
+        self.locked_workspaces: Dict[str, Dict[str, Any]] = {}
+        self.errors: List[str] = []
+        self._dependents: Optional[Dict[str, List[str]]] = None
+
+    @classmethod
+    def from_repo(cls, root: str = ".", index: Optional[Any] = None) -> "DependencyGraph":
+        """Build the graph from a repository's lockfile and workspace manifests"""
+        graph = cls(index)
+        lockfile = os.path.join(root, "package-lock.json")
+        if os.path.exists(lockfile):
+            graph.load_lockfile(lockfile)
+        else:
+            graph.errors.append(f"{lockfile}: not found")
+        graph.load_workspaces(root)
+        return graph
+
+    def load_lockfile(self, path: str):
+        """Add every installed package recorded in a lockfile"""
+        try:
+            with open(path, "r") as f:
+                lock = json.load(f)
+        except (OSError, ValueError) as e:
+            self.errors.append(f"{path}: {e}")
+            return
+
+        if "packages" in lock:
+            entries = lock["packages"].items()
+        else:
+            entries = self._flatten_v1(lock.get("dependencies", {}), "")
+
+        for install_path, entry in entries:
+            if not install_path.startswith("node_modules/") and "/node_modules/" not in install_path:
+                # The root project and workspaces: keep what they declare in case a manifest is unreadable
+                self.locked_workspaces[install_path or "."] = entry
+                continue
+            if entry.get("link") or "version" not in entry:
+                continue
+            name = entry.get("name") or install_path.rsplit("node_modules/", 1)[-1]
+            self.packages[install_path] = {
+                "name": name,
+                "version": entry["version"],
+                "dev": bool(entry.get("dev") or entry.get("devOptional")),
+                "dependencies": {**entry.get("dependencies", {}), **entry.get("optionalDependencies", {})}
+            }
+            self.by_name.setdefault(name, []).append(install_path)
+        self._dependents = None
+
+    def load_workspaces(self, root: str):
+        """Add the root manifest and every workspace manifest it declares"""
+        root_manifest = os.path.join(root, "package.json")
+        manifest = self._load_manifest(root_manifest, ".")
+        patterns = manifest.get("workspaces", []) if manifest else []
+        if isinstance(patterns, dict):
+            patterns = patterns.get("packages", [])
+        for pattern in patterns:
+            for manifest_path in sorted(map(os.path.normpath, glob.glob(os.path.join(root, pattern, "package.json")))):
+                self._load_manifest(manifest_path, os.path.relpath(os.path.dirname(manifest_path), root).replace(os.sep, "/"))
+        self._dependents = None
+
+    def declared(self, name: str) -> List[Tuple[str, str, str]]:
+        """(workspace, field, range) for every manifest that declares a package"""
+        found = []
+        for workspace, manifest in self.workspaces.items():
+            for field in DEPENDENCY_FIELDS:
+                if name in manifest[field]:
+                    found.append((workspace, field, manifest[field][name]))
+        return found
+
+    def resolve(self, from_path: str, name: str) -> Optional[str]:
+        """Install path a package at from_path gets for a dependency, per npm's lookup rule"""
+        base = from_path
+        while True:
+            candidate = f"{base}/node_modules/{name}" if base else f"node_modules/{name}"
+            if candidate in self.packages:
+                return candidate
+            if not base:
+                return None
+            cut = base.rfind("/node_modules/")
+            base = base[:cut] if cut != -1 else ""
+
+    def introduced_by(self, install_path: str) -> List[str]:
+        """Shortest chain of package names from a direct dependency down to an installed package"""
+        dependents = self._dependent_index()
+        parents = {install_path: None}
+        queue = deque([install_path])
+        while queue:
+            current = queue.popleft()
+            if not dependents.get(current):
+                # Nothing installed depends on it, so a manifest does directly
+                chain = []
+                while current is not None:
+                    chain.append(self.packages[current]["name"])
+                    current = parents[current]
+                declared_by = self.declared(chain[0])
+                return [declared_by[0][0]] + chain if declared_by else chain
+            for parent in dependents[current]:
+                if parent not in parents:
+                    parents[parent] = current
+                    queue.append(parent)
+        return [self.packages[install_path]["name"]]
+
+    def audit(self, advisories: AdvisoryDatabase) -> List[Dict[str, Any]]:
+        """One finding per installed package and advisory affecting its resolved version"""
+        findings = []
+        for name in advisories.index:
+            for install_path in self.by_name.get(name, []):
+                package = self.packages[install_path]
+                for advisory in advisories.lookup(name, package["version"]):
+                    findings.append({
+                        "package": name,
+                        "version": package["version"],
+                        "path": install_path,
+                        "dev": package["dev"],
+                        "advisory": advisory["id"],
+                        "severity": advisory["severity"],
+                        "title": advisory["title"],
+                        "vulnerable": advisory["vulnerable"],
+                        "via": self.introduced_by(install_path)
+                    })
+        findings.sort(key=lambda finding: (-SEVERITIES.index(finding["severity"]), finding["package"], finding["path"]))
+        return findings
+
+    def stats(self) -> Dict[str, Any]:
+        """Sizes of the graph"""
+        return {
+            "installed": len(self.packages),
+            "unique_packages": len(self.by_name),
+            "workspaces": len(self.workspaces),
+            "errors": len(self.errors)
+        }
+
+    def _load_manifest(self, path: str, workspace: str) -> Optional[Dict[str, Any]]:
+        try:
+            if self.index is not None:
+                manifest = self.index.facts(path, "package_manifest", extract_manifest)
+            else:
+                with open(path, "rb") as f:
+                    manifest = extract_manifest(f.read())
+        except (OSError, ValueError) as e:
+            self.errors.append(f"{path}: {e}")
+            # Fall back to the declarations npm recorded in the lockfile
+            manifest = self.locked_workspaces.get(workspace)
+            if manifest is None:
+                return None
+        self.workspaces[manifest.get("name") or workspace] = {
+            "path": workspace,
+            **{field: manifest.get(field, {}) for field in DEPENDENCY_FIELDS}
+        }
+        return manifest
+
+    def _dependent_index(self) -> Dict[str, List[str]]:
+        if self._dependents is None:
+            self._dependents = {}
+            for install_path, package in self.packages.items():
+                for name in package["dependencies"]:
+                    target = self.resolve(install_path, name)
+                    if target is not None:
+                        self._dependents.setdefault(target, []).append(install_path)
+        return self._dependents
+
+    def _flatten_v1(self, dependencies: Dict[str, Any], prefix: str):
+        for name, entry in dependencies.items():
+            install_path = f"{prefix}node_modules/{name}"
+            yield install_path, {"version": entry.get("version"), "dev": entry.get("dev"),
+                                 "dependencies": entry.get("requires", {})}
+            yield from self._flatten_v1(entry.get("dependencies", {}), f"{install_path}/")
+
+
+def benchmark(entries: int = 50000, advisories: Optional[AdvisoryDatabase] = None) -> Dict[str, Any]:
+    """Parse and audit a synthetic lockfile with the given number of installed packages"""
+    import tempfile
+
+    advisories = advisories or AdvisoryDatabase()
+    names = [advisory["package"] for advisory in advisories.advisories]
+    packages: Dict[str, Any] = {"": {"name": "benchmark", "version": "1.0.0"}}
+    for number in range(entries):
+        # Mostly unique packages, with every advisory package installed at several versions
+        if number % 50 == 0:
+            name = names[number // 50 % len(names)]
+            install_path = f"node_modules/pkg-{number}/node_modules/{name}"
+            version = f"{number % 9}.{number % 31}.{number % 7}"
+        else:
+            name = f"pkg-{number}"
+            install_path = f"node_modules/{name}"
+            version = "1.0.0"
+        packages[install_path] = {"version": version, "dependencies": {f"pkg-{number + 1}": "^1.0.0"}}
+
+    with tempfile.TemporaryDirectory() as directory:
+        lockfile = os.path.join(directory, "package-lock.json")
+        with open(lockfile, "w") as f:
+            json.dump({"lockfileVersion": 3, "packages": packages}, f)
+
+        start = time.perf_counter()
+        graph = DependencyGraph()
+        graph.load_lockfile(lockfile)
+        loaded = time.perf_counter()
+        findings = graph.audit(advisories)
+        audited = time.perf_counter()
+
+    return {
+        "entries": len(graph.packages),
+        "findings": len(findings),
+        "load_seconds": round(loaded - start, 3),
+        "audit_seconds": round(audited - loaded, 3),
+        "total_seconds": round(audited - start, 3)
+    }
+
+
+def main():
+    """Audit the repository's installed dependencies, or benchmark the analyser"""
+    parser = argparse.ArgumentParser(description="Alex AI Dependency Graph")
+    parser.add_argument("root", nargs="?", default=".", help="Repository root (default: current directory)")
+    parser.add_argument("--advisories", default=ADVISORY_DB, help="Offline advisory database")
+    parser.add_argument("--benchmark", type=int, metavar="ENTRIES",
+                        help="Audit a synthetic lockfile with this many packages and report timing")
+    args = parser.parse_args()
+
+    advisories = AdvisoryDatabase(args.advisories)
+    if args.benchmark:
+        print(f"⚡ Dependency graph benchmark ({args.benchmark:,} packages)")
+        result = benchmark(args.benchmark, advisories)
+        print(f"   Load: {result['load_seconds']}s, audit: {result['audit_seconds']}s, "
+              f"total: {result['total_seconds']}s ({result['findings']} findings)")
+        return 0
+
+    start = time.perf_counter()
+    graph = DependencyGraph.from_repo(args.root)
+    findings = graph.audit(advisories)
+    stats = graph.stats()
+
+    print(f"📦 {stats['installed']} installed packages, {stats['workspaces']} manifests, "
+          f"{len(advisories)} advisories (v{advisories.version}) in {time.perf_counter() - start:.3f}s")
+    for error in graph.errors:
+        print(f"⚠️  {error}")
+    for finding in findings:
+        print(f"❌ {finding['severity']} {finding['package']}@{finding['version']} ({finding['advisory']}): "
+              f"{finding['title']} via {' > '.join(finding['via'])}")
+
+    if findings:
+        return 1
+    print("✅ No known vulnerable versions installed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,471 @@
+#!/usr/bin/env python3
+"""
+Alex AI Endpoint Discovery
+Builds a cached index of the API endpoints that actually exist, for the pentest and validation suites
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import argparse
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Optional, Set, Tuple
+
+CACHE_DIR = ".security_cache"
+INDEX_CACHE_FILE = os.path.join(CACHE_DIR, "endpoint_index.json")
+INDEX_CACHE_VERSION = 1
+
+DEFAULT_SOURCE_ROOTS = ["packages", "dashboard"]
+SKIP_DIRS = {"node_modules", ".git", ".next", "_next", "dist", "build", "coverage",
+             "deployed-build", "local-build", CACHE_DIR}
+SOURCE_EXTENSIONS = (".js", ".jsx", ".ts", ".tsx", ".mjs")
+OPENAPI_NAME_PATTERN = re.compile(r"(openapi|swagger)[\w.-]*\.(json|ya?ml)$", re.IGNORECASE)
+HTTP_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE")
+
+# Next.js pages router: method guards and request field access
+METHOD_GUARD_PATTERN = re.compile(r"req\.method\s*(===|!==|==|!=)\s*['\"](\w+)['\"]")
+METHOD_CASE_PATTERN = re.compile(r"case\s+['\"](GET|POST|PUT|PATCH|DELETE)['\"]\s*:")
+DESTRUCTURE_PATTERN = re.compile(r"\{([^{}]*)\}\s*=\s*req\.(body|query)\b")
+FIELD_ACCESS_PATTERN = re.compile(r"req\.(?:body|query)\.([A-Za-z_$][\w$]*)")
+SEARCH_PARAM_PATTERN = re.compile(r"searchParams\.get\(\s*['\"]([^'\"]+)['\"]\s*\)")
+# Next.js app router handlers and Express-style route registrations
+APP_ROUTER_EXPORT_PATTERN = re.compile(r"export\s+(?:async\s+)?function\s+(GET|POST|PUT|PATCH|DELETE)\b")
+EXPRESS_ROUTE_PATTERN = re.compile(
+    r"\b(?:app|router|server)\.(get|post|put|patch|delete|all)\(\s*['\"`](/[^'\"`]*)['\"`]"
+)
+# Links found in crawled responses
+LINK_PATTERN = re.compile(r"""(?:href|src|action)\s*=\s*["']([^"'#]+)["']""", re.IGNORECASE)
+API_PATH_PATTERN = re.compile(r"""["'](/api/[\w\-./{}\[\]]*)["']""")
+
+
+def normalize_path(path: str) -> str:
+    """Normalise a route path so equivalent spellings share one index entry"""
+    path = path.split("?", 1)[0].split("#", 1)[0]
+    path = re.sub(r"/{2,}", "/", "/" + path.strip("/"))
+    # Next.js [id] / [...slug] and Express :id segments become OpenAPI-style {id}
+    path = re.sub(r"\[\.\.\.(\w+)\]", r"{\1}", path)
+    path = re.sub(r"\[(\w+)\]", r"{\1}", path)
+    path = re.sub(r"/:(\w+)", r"/{\1}", path)
+    return path
+
+
+class EndpointIndex:
+    """Deduplicated endpoint index: path -> methods, parameter names and where they were found"""
+
+    def __init__(self):
+        self.endpoints: Dict[str, Dict[str, Set[str]]] = {}
+
+    def add(self, path: str, methods: Iterable[str] = (), params: Iterable[str] = (), source: str = ""):
+        """Add or merge an endpoint"""
+        entry = self.endpoints.setdefault(normalize_path(path), {
+            "methods": set(),
+            "params": set(),
+            "sources": set()
+        })
+        entry["methods"].update(method.upper() for method in methods)
+        entry["params"].update(params)
+        if source:
+            entry["sources"].add(source)
+
+    def merge(self, other: "EndpointIndex"):
+        """Merge another index into this one"""
+        for path, entry in other.endpoints.items():
+            self.add(path, entry["methods"], entry["params"], "")
+            self.endpoints[path]["sources"].update(entry["sources"])
+
+    def select(self, method: Optional[str] = None, prefix: str = "/api/") -> List[str]:
+        """Return concrete endpoint paths accepting the given method"""
+        selected = []
+        for path, entry in sorted(self.endpoints.items()):
+            if not path.startswith(prefix) or "{" in path:
+                continue
+            # An endpoint with no method information is assumed to accept anything
+            if method and entry["methods"] and method.upper() not in entry["methods"]:
+                continue
+            selected.append(path)
+        return selected
+
+    def params_for(self, path: str) -> List[str]:
+        """Return the known parameter names of an endpoint"""
+        entry = self.endpoints.get(normalize_path(path))
+        return sorted(entry["params"]) if entry else []
+
+    def targets(self, defaults: List[str], method: Optional[str] = None) -> List[str]:
+        """Endpoints a suite should target: discovered ones if any, otherwise its defaults"""
+        discovered = self.select(method)
+        return discovered if discovered else list(defaults)
+
+    def payload_body(self, endpoint: str, payload: str, fields: List[str]) -> Dict[str, Any]:
+        """Place the payload in the default fields and every parameter the endpoint is known to read"""
+        body = {field: payload for field in fields}
+        for param in self.params_for(endpoint):
+            body.setdefault(param, payload)
+        return body
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            path: {key: sorted(values) for key, values in entry.items()}
+            for path, entry in sorted(self.endpoints.items())
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "EndpointIndex":
+        index = cls()
+        for path, entry in data.items():
+            index.endpoints[path] = {key: set(entry.get(key, [])) for key in ("methods", "params", "sources")}
+        return index
+
+
+class EndpointDiscovery:
+    """Discover endpoints from OpenAPI specs, route source files and links in live responses
+
+    Parsed source files are cached on disk by (mtime, size), so a repeat run only
+    re-reads files that changed. Crawled links are cached per base URL for
+    ``crawl_ttl`` seconds.
+    """
+
+    def __init__(self, base_url: str = "http://localhost:3000", source_roots: Optional[List[str]] = None,
+                 spec_root: str = ".", crawl: bool = True, max_pages: int = 50,
+                 crawl_concurrency: int = 8, crawl_ttl: float = 3600.0, cache_file: str = INDEX_CACHE_FILE):
+        self.base_url = base_url.rstrip("/")
+        self.source_roots = source_roots or DEFAULT_SOURCE_ROOTS
+        self.spec_root = spec_root
+        self.crawl = crawl
+        self.max_pages = max_pages
+        self.crawl_concurrency = crawl_concurrency
+        self.crawl_ttl = crawl_ttl
+        self.cache_file = cache_file
+        self.stats = {"files_parsed": 0, "files_cached": 0, "pages_crawled": 0, "crawl_errors": 0}
+        # Source files are parsed on worker threads
+        self.stats_lock = threading.Lock()
+
+    def discover(self) -> EndpointIndex:
+        """Synchronous entry point"""
+        return asyncio.run(self.discover_async())
+
+    async def discover_async(self) -> EndpointIndex:
+        """Run every discovery stage and return the merged index"""
+        cache = self._load_cache()
+        file_cache = cache.get("files", {})
+
+        route_files, spec_files = await asyncio.to_thread(self._find_source_files)
+        candidates = [(path, "route") for path in route_files] + [(path, "openapi") for path in spec_files]
+
+        parsed = await asyncio.gather(*(
+            asyncio.to_thread(self._parse_cached, path, kind, file_cache) for path, kind in candidates
+        ))
+
+        index = EndpointIndex()
+        new_file_cache = {}
+        for path, entry in parsed:
+            new_file_cache[path] = entry
+            index.merge(EndpointIndex.from_dict(entry["endpoints"]))
+
+        crawl_cache = cache.get("crawl", {})
+        if self.crawl:
+            crawl_cache = await self._crawl_cached(index, crawl_cache)
+            index.merge(EndpointIndex.from_dict(crawl_cache.get("endpoints", {})))
+
+        self._save_cache({
+            "version": INDEX_CACHE_VERSION,
+            "updated": datetime.now().isoformat(),
+            "files": new_file_cache,
+            "crawl": crawl_cache,
+            "index": index.to_dict()
+        })
+        return index
+
+    # ------------------------------------------------------------------
+    # Local sources
+    # ------------------------------------------------------------------
+
+    def _find_source_files(self) -> Tuple[List[str], List[str]]:
+        route_files = []
+        for root in self.source_roots:
+            for path in self._walk(root):
+                if path.endswith(SOURCE_EXTENSIONS):
+                    route_files.append(path)
+
+        spec_files = [path for path in self._walk(self.spec_root)
+                      if OPENAPI_NAME_PATTERN.search(os.path.basename(path))]
+        return route_files, spec_files
+
+    def _walk(self, root: str) -> Iterable[str]:
+        if not os.path.isdir(root):
+            return
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            for filename in filenames:
+                yield os.path.join(dirpath, filename)
+
+    def _count(self, stat: str):
+        with self.stats_lock:
+            self.stats[stat] += 1
+
+    def _parse_cached(self, path: str, kind: str, file_cache: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        stat = os.stat(path)
+        cached = file_cache.get(path)
+        if cached and cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+            self._count("files_cached")
+            return path, cached
+
+        self._count("files_parsed")
+        index = self._parse_openapi(path) if kind == "openapi" else self._parse_route_file(path)
+        return path, {"mtime": stat.st_mtime, "size": stat.st_size, "endpoints": index.to_dict()}
+
+    def _parse_route_file(self, path: str) -> EndpointIndex:
+        index = EndpointIndex()
+        try:
+            with open(path, "r", encoding="utf-8", errors="ignore") as f:
+                source = f.read()
+        except OSError:
+            return index
+
+        route = self._next_route_for(path)
+        if route:
+            index.add(route, self._route_methods(source, path), self._route_params(source), path)
+
+        for method, route_path in EXPRESS_ROUTE_PATTERN.findall(source):
+            methods = HTTP_METHODS if method == "all" else (method,)
+            index.add(route_path, methods, (), path)
+
+        return index
+
+    def _next_route_for(self, path: str) -> Optional[str]:
+        parts = path.replace(os.sep, "/").split("/")
+        stem, _ = os.path.splitext(parts[-1])
+
+        # pages/api/foo/bar.js -> /api/foo/bar, pages/api/foo/index.js -> /api/foo
+        if "pages" in parts:
+            pages_at = len(parts) - 1 - parts[::-1].index("pages")
+            route_parts = parts[pages_at + 1:-1] + ([] if stem == "index" else [stem])
+            if route_parts[:1] == ["api"]:
+                return "/" + "/".join(route_parts)
+
+        # app/api/foo/route.ts -> /api/foo (route groups like (admin) are not part of the URL)
+        if stem == "route" and "app" in parts:
+            app_at = len(parts) - 1 - parts[::-1].index("app")
+            route_parts = [p for p in parts[app_at + 1:-1] if not (p.startswith("(") and p.endswith(")"))]
+            return "/" + "/".join(route_parts)
+
+        return None
+
+    def _route_methods(self, source: str, path: str) -> Set[str]:
+        exported = set(APP_ROUTER_EXPORT_PATTERN.findall(source))
+        if exported:
+            return exported
+
+        methods = set(METHOD_CASE_PATTERN.findall(source))
+        for operator, method in METHOD_GUARD_PATTERN.findall(source):
+            if operator in ("===", "=="):
+                methods.add(method.upper())
+            else:
+                # `if (req.method !== 'POST') return 405` means POST is the only method
+                return {method.upper()}
+        return methods
+
+    def _route_params(self, source: str) -> Set[str]:
+        params = set(FIELD_ACCESS_PATTERN.findall(source))
+        params.update(SEARCH_PARAM_PATTERN.findall(source))
+        for fields, _ in DESTRUCTURE_PATTERN.findall(source):
+            for field in fields.split(","):
+                name = field.split("=", 1)[0].split(":", 1)[0].strip()
+                if re.fullmatch(r"[A-Za-z_$][\w$]*", name):
+                    params.add(name)
+        return params
+
+    def _parse_openapi(self, path: str) -> EndpointIndex:
+        index = EndpointIndex()
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                if path.endswith(".json"):
+                    spec = json.load(f)
+                else:
+                    try:
+                        import yaml
+                    except ImportError:
+                        return index  # PyYAML not available - YAML specs skipped
+                    spec = yaml.safe_load(f)
+        except (OSError, ValueError):
+            return index
+
+        if not isinstance(spec, dict) or not ("openapi" in spec or "swagger" in spec):
+            return index
+
+        for route, operations in (spec.get("paths") or {}).items():
+            if not isinstance(operations, dict):
+                continue
+            shared_params = [p.get("name") for p in operations.get("parameters", []) if isinstance(p, dict)]
+            for method, operation in operations.items():
+                if method.upper() not in HTTP_METHODS or not isinstance(operation, dict):
+                    continue
+                params = [p.get("name") for p in operation.get("parameters", []) if isinstance(p, dict)]
+                params += self._request_body_fields(operation)
+                index.add(route, [method], [p for p in params + shared_params if p], path)
+
+        return index
+
+    def _request_body_fields(self, operation: Dict[str, Any]) -> List[str]:
+        content = (operation.get("requestBody") or {}).get("content") or {}
+        fields = []
+        for media in content.values():
+            schema = (media or {}).get("schema") or {}
+            fields.extend((schema.get("properties") or {}).keys())
+        return fields
+
+    # ------------------------------------------------------------------
+    # Live crawl
+    # ------------------------------------------------------------------
+
+    async def _crawl_cached(self, index: EndpointIndex, crawl_cache: Dict[str, Any]) -> Dict[str, Any]:
+        if (crawl_cache.get("base_url") == self.base_url
+                and time.time() - crawl_cache.get("crawled_at", 0) < self.crawl_ttl):
+            return crawl_cache
+
+        crawled = await self._crawl(["/"] + index.select("GET"))
+        if crawled is None:
+            return crawl_cache  # Server unreachable: keep whatever we learned last time
+        return {"base_url": self.base_url, "crawled_at": time.time(), "endpoints": crawled.to_dict()}
+
+    async def _crawl(self, seeds: List[str]) -> Optional[EndpointIndex]:
+        try:
+            import requests
+        except ImportError:
+            return None
+
+        found = EndpointIndex()
+        seen: Set[str] = set()
+        queue: asyncio.Queue = asyncio.Queue()
+        for seed in seeds:
+            queue.put_nowait(normalize_path(seed))
+        reachable = False
+        session = requests.Session()
+
+        async def fetch(path: str) -> Optional[Tuple[int, str]]:
+            def get():
+                try:
+                    response = session.get(f"{self.base_url}{path}", timeout=5)
+                    return response.status_code, response.text[:200000]
+                except requests.exceptions.RequestException:
+                    return None
+            return await asyncio.to_thread(get)
+
+        async def worker():
+            nonlocal reachable
+            while True:
+                path = await queue.get()
+                try:
+                    if path in seen or len(seen) >= self.max_pages:
+                        continue
+                    seen.add(path)
+                    result = await fetch(path)
+                    if result is None:
+                        continue
+                    reachable = True
+                    self._count("pages_crawled")
+                    status_code, body = result
+                    if status_code != 404 and path.startswith("/api/"):
+                        found.add(path, ["GET"], (), "crawl")
+                    for link in self._extract_links(body):
+                        if link.startswith("/api/"):
+                            found.add(link, (), (), "crawl")
+                        if link not in seen:
+                            queue.put_nowait(link)
+                except Exception:
+                    # One bad page (a body that will not decode, say) must not end this
+                    # worker: once every worker is gone queue.join() never returns
+                    self._count("crawl_errors")
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.crawl_concurrency)]
+        await queue.join()
+        for task in workers:
+            task.cancel()
+        session.close()
+        return found if reachable else None
+
+    def _extract_links(self, body: str) -> Set[str]:
+        links = set()
+        for link in LINK_PATTERN.findall(body) + API_PATH_PATTERN.findall(body):
+            if link.startswith(self.base_url):
+                link = link[len(self.base_url):]
+            # Same-origin, non-asset paths only
+            if link.startswith("/") and not link.startswith("//") and not link.startswith("/_next"):
+                links.add(normalize_path(link))
+        return links
+
+    # ------------------------------------------------------------------
+    # Cache
+    # ------------------------------------------------------------------
+
+    def _load_cache(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_file, "r") as f:
+                cache = json.load(f)
+            return cache if cache.get("version") == INDEX_CACHE_VERSION else {}
+        except (OSError, ValueError):
+            return {}
+
+    def _save_cache(self, cache: Dict[str, Any]):
+        os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+        temp_file = f"{self.cache_file}.tmp"
+        with open(temp_file, "w") as f:
+            json.dump(cache, f)
+        os.replace(temp_file, self.cache_file)
+
+
+def target_endpoints(index: Optional[EndpointIndex], defaults: List[str], method: Optional[str] = None) -> List[str]:
+    """Discovered endpoints accepting the method, or the defaults when discovery is off"""
+    return index.targets(defaults, method) if index is not None else list(defaults)
+
+
+def payload_body(index: Optional[EndpointIndex], endpoint: str, payload: str, fields: List[str]) -> Dict[str, Any]:
+    """Payload in the default fields, plus the endpoint's known parameters when discovery is on"""
+    if index is None:
+        return {field: payload for field in fields}
+    return index.payload_body(endpoint, payload, fields)
+
+
+def load_endpoint_index(base_url: str = "http://localhost:3000", crawl: bool = True) -> EndpointIndex:
+    """Discover endpoints (reusing the on-disk cache) for use by the test suites"""
+    return EndpointDiscovery(base_url=base_url, crawl=crawl).discover()
+
+
+def main():
+    """Main function to build and print the endpoint index"""
+    parser = argparse.ArgumentParser(description="Alex AI Endpoint Discovery")
+    parser.add_argument("--base-url", default="http://localhost:3000", help="Server to crawl for links")
+    parser.add_argument("--no-crawl", action="store_true", help="Only use local OpenAPI specs and route files")
+    args = parser.parse_args()
+
+    print("🧭 ALEX AI ENDPOINT DISCOVERY")
+    print("=" * 50)
+
+    start = time.time()
+    discovery = EndpointDiscovery(base_url=args.base_url, crawl=not args.no_crawl)
+    index = discovery.discover()
+
+    for path, entry in index.to_dict().items():
+        methods = ", ".join(entry["methods"]) or "ANY"
+        params = ", ".join(entry["params"]) or "-"
+        print(f"  {path} [{methods}] params: {params}")
+
+    print()
+    print(f"Endpoints: {len(index)}")
+    print(f"Files parsed: {discovery.stats['files_parsed']} (cached: {discovery.stats['files_cached']})")
+    print(f"Pages crawled: {discovery.stats['pages_crawled']} (failed: {discovery.stats['crawl_errors']})")
+    print(f"Duration: {time.time() - start:.2f} seconds")
+    print(f"📄 Index cached at: {discovery.cache_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
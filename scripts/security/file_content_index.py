@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Alex AI File Content Index
+Persistent per-file index of content hashes and extracted facts, invalidated by mtime and size
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import hashlib
+import threading
+from typing import Dict, Any, Callable, Optional
+
+from incremental_validation import CACHE_DIR
+
+INDEX_FILE = os.path.join(CACHE_DIR, "file_index.sqlite3")
+INDEX_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    sha256 TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS facts (
+    path TEXT NOT NULL,
+    extractor TEXT NOT NULL,
+    version TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (path, extractor)
+);
+"""
+
+
+class FileContentIndex:
+    """SQLite index of file hashes and the facts extracted from each file.
+
+    A file is only re-hashed when its mtime or size differs from the indexed
+    row; re-hashing a changed file also drops every fact extracted from it. A
+    fact is stored per (file, extractor) together with the extractor's version,
+    so changing what an extractor returns only needs a new version string.
+    Reads of unchanged files therefore cost one ``stat`` and one row lookup.
+    """
+
+    def __init__(self, index_file: str = INDEX_FILE):
+        self.index_file = index_file
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.rehashed = 0
+        os.makedirs(os.path.dirname(index_file) or ".", exist_ok=True)
+        self.connection = sqlite3.connect(index_file, check_same_thread=False)
+        if self.connection.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            self.connection.executescript("DROP TABLE IF EXISTS files; DROP TABLE IF EXISTS facts;")
+            self.connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self.connection.executescript(SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Commit pending changes and close the database"""
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+    def digest(self, path: str) -> str:
+        """Content hash plus permission bits, re-hashing only when mtime or size changed"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return "missing"
+        sha256 = self._fresh_hash(path, stat)
+        if sha256 is None:
+            return "missing"
+        return f"{sha256}:{stat.st_mode & 0o777:o}"
+
+    def get_facts(self, path: str, extractor: str, version: str = "1") -> Optional[Any]:
+        """Stored facts for an unchanged file, or None when they must be extracted again"""
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if self._fresh_hash(path, stat) is None:
+            return None
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT value FROM facts WHERE path = ? AND extractor = ? AND version = ?",
+                (path, extractor, version)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return json.loads(row[0])
+
+    def put_facts(self, path: str, extractor: str, value: Any, version: str = "1"):
+        """Store facts extracted from the current content of a file"""
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO facts (path, extractor, version, value) VALUES (?, ?, ?, ?)",
+                (path, extractor, version, json.dumps(value, sort_keys=True)))
+
+    def facts(self, path: str, extractor: str, extract: Callable[[bytes], Any], version: str = "1") -> Any:
+        """Facts for a file, running ``extract`` over its content only when it changed"""
+        value = self.get_facts(path, extractor, version)
+        if value is None:
+            with open(path, "rb") as f:
+                value = extract(f.read())
+            self.put_facts(path, extractor, value, version)
+        return value
+
+    def prune(self) -> int:
+        """Forget files that no longer exist; returns how many were dropped"""
+        with self.lock:
+            paths = [row[0] for row in self.connection.execute("SELECT path FROM files")]
+            gone = [(path,) for path in paths if not os.path.exists(path)]
+            self.connection.executemany("DELETE FROM files WHERE path = ?", gone)
+            self.connection.executemany("DELETE FROM facts WHERE path = ?", gone)
+            return len(gone)
+
+    def stats(self) -> Dict[str, Any]:
+        """Indexed files and facts plus this session's hit, miss and re-hash counts"""
+        with self.lock:
+            files = self.connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+            facts = self.connection.execute("SELECT COUNT(*) FROM facts").fetchone()[0]
+        return {"files": files, "facts": facts, "hits": self.hits, "misses": self.misses, "rehashed": self.rehashed}
+
+    def _fresh_hash(self, path: str, stat: os.stat_result) -> Optional[str]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT mtime_ns, size, sha256 FROM files WHERE path = ?", (path,)).fetchone()
+            if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+                return row[2]
+
+            try:
+                digest = hashlib.sha256()
+                with open(path, "rb") as f:
+                    for block in iter(lambda: f.read(1 << 20), b""):
+                        digest.update(block)
+            except OSError:
+                return None
+
+            self.rehashed += 1
+            sha256 = digest.hexdigest()
+            self.connection.execute(
+                "INSERT OR REPLACE INTO files (path, mtime_ns, size, sha256) VALUES (?, ?, ?, ?)",
+                (path, stat.st_mtime_ns, stat.st_size, sha256))
+            if row is None or row[2] != sha256:
+                # Facts were extracted from the old content
+                self.connection.execute("DELETE FROM facts WHERE path = ?", (path,))
+            return sha256
+
+
+def main():
+    """Print what the index currently holds"""
+    with FileContentIndex() as index:
+        stats = index.stats()
+        print(f"🗂️  File content index: {INDEX_FILE}")
+        print(f"   {stats['files']} files, {stats['facts']} facts")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+"""
+Alex AI HTTP Session
+Connection-pooled sessions that never keep cookies, so every security check sends stateless requests
+"""
+
+import requests
+from http.cookiejar import DefaultCookiePolicy
+
+
+def stateless_session(pool_connections: int = 10, pool_maxsize: int = 10) -> requests.Session:
+    """Session that reuses connections but rejects every cookie.
+
+    Checks such as "request without a token must get 401" rely on nothing
+    being sent implicitly; a login cookie kept from an earlier check would
+    hide a real auth bypass or report a false one.
+    """
+    session = requests.Session()
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Alex AI Incremental Validation Cache
+Remembers check verdicts keyed on the files each check covers, so unchanged checks are not re-run
+"""
+
+import os
+import glob
+import json
+import copy
+import hashlib
+import threading
+from datetime import datetime
+from typing import Dict, List, Any, Iterable, Optional
+
+CACHE_DIR = ".security_cache"
+VERDICT_CACHE_FILE = os.path.join(CACHE_DIR, "validation_verdicts.json")
+VERDICT_CACHE_VERSION = 1
+SECURITY_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def security_sources() -> List[str]:
+    """Every security suite module; checks delegate to helpers across them, so any edit invalidates a verdict"""
+    return sorted(glob.glob(os.path.join(SECURITY_SCRIPTS_DIR, "*.py")))
+
+
+class VerdictCache:
+    """Per-suite cache of check results keyed by a fingerprint of the files the check covers
+
+    A fingerprint hashes the content and permission bits of every covered file
+    (directories are expanded to the files below them), so a check is re-run
+    exactly when one of its inputs changed. Missing files hash to a fixed
+    marker, which means creating or deleting a covered file also invalidates it.
+    Given a file content index, file hashes are taken from it, so unchanged
+    files are not read again.
+    """
+
+    def __init__(self, suite: str, cache_file: str = VERDICT_CACHE_FILE, index: Optional[Any] = None):
+        self.suite = suite
+        self.cache_file = cache_file
+        self.index = index
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.verdicts = self._load().get(suite, {})
+
+    def fingerprint(self, covers: Iterable[str], extra: Optional[Dict[str, Any]] = None) -> str:
+        """Hash the covered files (and any extra inputs) into a single fingerprint"""
+        digest = hashlib.sha256()
+        for path in sorted(self._expand(covers)):
+            digest.update(path.encode("utf-8"))
+            digest.update(b"\0")
+            digest.update(self.file_digest(path).encode("ascii"))
+        if extra:
+            digest.update(json.dumps(extra, sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def file_digest(self, path: str) -> str:
+        """Content hash plus permission bits of a single file"""
+        if self.index is not None:
+            return self.index.digest(path)
+        try:
+            mode = os.stat(path).st_mode & 0o777
+            digest = hashlib.sha256()
+            with open(path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(block)
+            return f"{digest.hexdigest()}:{mode:o}"
+        except OSError:
+            return "missing"
+
+    def lookup(self, check_name: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result if the fingerprint still matches"""
+        with self.lock:
+            entry = self.verdicts.get(check_name)
+            if entry and entry["fingerprint"] == fingerprint:
+                self.hits += 1
+                result = copy.deepcopy(entry["result"])
+                result["cached"] = True
+                result["cached_at"] = entry["recorded"]
+                return result
+            self.misses += 1
+            return None
+
+    def store(self, check_name: str, fingerprint: str, result: Dict[str, Any]):
+        """Remember the result of a check that has just run"""
+        with self.lock:
+            self.verdicts[check_name] = {
+                "fingerprint": fingerprint,
+                "recorded": datetime.now().isoformat(),
+                "result": copy.deepcopy(result)
+            }
+
+    def save(self):
+        """Write the cache back to disk, preserving other suites' entries"""
+        with self.lock:
+            cache = self._load()
+            cache["version"] = VERDICT_CACHE_VERSION
+            cache[self.suite] = self.verdicts
+            os.makedirs(os.path.dirname(self.cache_file) or ".", exist_ok=True)
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, "w") as f:
+                json.dump(cache, f, indent=2)
+            os.replace(temp_file, self.cache_file)
+
+    def _expand(self, covers: Iterable[str]) -> List[str]:
+        paths = []
+        for cover in covers:
+            if os.path.isdir(cover):
+                for root, dirs, files in os.walk(cover):
+                    dirs[:] = [d for d in dirs if d not in ("node_modules", "__pycache__")]
+                    paths.extend(os.path.join(root, name) for name in files)
+            else:
+                paths.append(cover)
+        return paths
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_file, "r") as f:
+                cache = json.load(f)
+            return cache if cache.get("version") == VERDICT_CACHE_VERSION else {}
+        except (OSError, ValueError):
+            return {}
@@ -8,13 +8,76 @@ import os
 import sys
 import json
 import time
+import glob
+import argparse
 from datetime import datetime
 from typing import Dict, List, Any
 
+from incremental_validation import VerdictCache, security_sources
+from file_content_index import FileContentIndex
+from repo_secret_scan import RepositorySecretScanner
+from source_pattern_scanner import SourcePatternScanner
+from dependency_graph import DependencyGraph, AdvisoryDatabase, ADVISORY_DB
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+SECURITY_SOURCE_DIR = "packages/@alex-ai/core/src/security"
+SENSITIVE_FILES = [".env", "config.json", "credentials.json", "secrets.json"]
+REQUIRED_ENV_VARS = ["JWT_SECRET", "ENCRYPTION_KEY", "DATABASE_URL"]
+# The lockfile plus the root and every workspace manifest; glob entries are expanded when a check runs
+DEPENDENCY_FILES = ["package.json", "package-lock.json", "packages/*/package.json"]
+
+
+def repo_path(path: str) -> str:
+    """A repository-relative path resolved against the repository root, whatever the working directory"""
+    return os.path.join(REPO_ROOT, path)
+
+
+def expand_covers(covers: List[str]) -> List[str]:
+    """Covered repository paths resolved against the repository root, with glob entries expanded now"""
+    paths = []
+    for cover in covers:
+        path = repo_path(cover)
+        paths.extend(sorted(glob.glob(path)) if any(char in cover for char in "*?[") else [path])
+    return paths
+
+
+def extract_gitignore_entries(content: bytes) -> List[str]:
+    """Non-empty lines of a .gitignore"""
+    return [line.strip() for line in content.decode("utf-8", "replace").splitlines() if line.strip()]
+
+
 class OfflineSecurityTester:
-    def __init__(self):
+    # Offline checks and the files each one reads. In incremental mode a check
+    # is only re-run when one of its covered files, or any security script (the
+    # scanners, dependency graph and advisory loader produce the verdicts), changed.
+    OFFLINE_CHECKS = [
+        {"method": "test_code_quality", "test_name": "Code Quality Analysis",
+         "covers": [SECURITY_SOURCE_DIR, "scripts/security/alex_ai_security_test.py",
+                    "scripts/security/automated_security_validation.py",
+                    "scripts/security/penetration_testing_suite.py",
+                    "scripts/security/security_performance_test.py"]},
+        {"method": "test_security_patterns", "test_name": "Security Pattern Detection",
+         "covers": [SECURITY_SOURCE_DIR]},
+        {"method": "test_configuration", "test_name": "Configuration Validation",
+         "covers": DEPENDENCY_FILES + ["ALEX_AI_COMPLETE_SECURITY_DOCUMENTATION.md",
+                                       "ALEX_AI_SECURITY_INTEGRATION_GUIDE.md"]},
+        {"method": "test_dependency_security", "test_name": "Dependency Security",
+         "covers": DEPENDENCY_FILES + [ADVISORY_DB]},
+        {"method": "test_file_permissions", "test_name": "File Permissions",
+         "covers": SENSITIVE_FILES},
+        {"method": "test_environment_security", "test_name": "Environment Security",
+         "covers": [".gitignore"]}
+    ]
+    
+    def __init__(self, incremental: bool = False, secret_scan: bool = False):
         self.test_results = []
         self.start_time = time.time()
+        self.incremental = incremental
+        # Both are opened per run, so one tester can run any number of times
+        self.file_index = None
+        self.verdict_cache = None
+        self.secret_scan = secret_scan
+        self._dependency_graph = None
         
     def run_offline_tests(self) -> Dict[str, Any]:
         """Run offline security tests"""
@@ -24,27 +87,59 @@ class OfflineSecurityTester:
         print("Testing security implementations without server...")
         print()
         
-        # Test 1: Code Quality Analysis
-        self.test_code_quality()
-        
-        # Test 2: Security Pattern Detection
-        self.test_security_patterns()
-        
-        # Test 3: Configuration Validation
-        self.test_configuration()
-        
-        # Test 4: Dependency Security
-        self.test_dependency_security()
-        
-        # Test 5: File Permissions
-        self.test_file_permissions()
-        
-        # Test 6: Environment Security
-        self.test_environment_security()
+        self.test_results = []
+        self.start_time = time.time()
+        self._dependency_graph = None
+        # File hashes and extracted facts persist across runs; only changed files are read again
+        self.file_index = FileContentIndex()
+        self.verdict_cache = VerdictCache("offline_security", index=self.file_index) if self.incremental else None
+        try:
+            for check in self.OFFLINE_CHECKS:
+                self.run_check(check)
+            
+            # The secret scan covers the whole tree, so it is never served from the verdict cache
+            if self.secret_scan:
+                self.test_repository_secrets()
+            
+            if self.verdict_cache is not None:
+                self.verdict_cache.save()
+                print(f"♻️  Incremental run: {self.verdict_cache.hits} checks reused, {self.verdict_cache.misses} re-run")
+                print()
+            
+            self.file_index.prune()
+            index_stats = self.file_index.stats()
+        finally:
+            self.file_index.close()
+            self.file_index = None
+            if self.verdict_cache is not None:
+                self.verdict_cache.index = None
+        print(f"🗂️  File index: {index_stats['hits']} facts reused, {index_stats['misses']} extracted, "
+              f"{index_stats['rehashed']} files re-hashed")
+        print()
         
         # Generate report
         return self.generate_offline_report()
     
+    def run_check(self, check: Dict[str, Any]):
+        """Run a single check, reusing a cached verdict when its inputs are unchanged"""
+        fingerprint = None
+        if self.verdict_cache is not None:
+            # Environment variables are inputs too, but only whether they are set
+            fingerprint = self.verdict_cache.fingerprint(expand_covers(check["covers"]) + security_sources(), extra={
+                "env": {name: bool(os.getenv(name)) for name in REQUIRED_ENV_VARS}
+            })
+            cached = self.verdict_cache.lookup(check["test_name"], fingerprint)
+            if cached is not None:
+                self.test_results.append(cached)
+                print(f"⏭️  {check['test_name']}: unchanged, reusing verdict ({cached['passed']} passed, {cached['failed']} failed)")
+                print()
+                return
+        
+        getattr(self, check["method"])()
+        
+        if fingerprint is not None:
+            self.verdict_cache.store(check["test_name"], fingerprint, self.test_results[-1])
+    
     def test_code_quality(self):
         """Test code quality and security best practices"""
         print("🔍 Testing Code Quality...")
@@ -67,7 +162,7 @@ class OfflineSecurityTester:
         ]
         
         for file_path in security_files:
-            if os.path.exists(file_path):
+            if os.path.exists(repo_path(file_path)):
                 test_results["passed"] += 1
                 test_results["details"].append(f"✅ Security file exists: {file_path}")
             else:
@@ -83,7 +178,7 @@ class OfflineSecurityTester:
         ]
         
         for file_path in test_files:
-            if os.path.exists(file_path):
+            if os.path.exists(repo_path(file_path)):
                 test_results["passed"] += 1
                 test_results["details"].append(f"✅ Test file exists: {file_path}")
             else:
@@ -119,26 +214,15 @@ class OfflineSecurityTester:
             ("csrf", "CSRF protection")
         ]
         
+        # One read of each file matches every pattern
+        scanner = SourcePatternScanner({pattern: pattern for pattern, _ in security_patterns})
+        hits = scanner.scan([repo_path(SECURITY_SOURCE_DIR)], index=self.file_index)["hits"]
+        
         for pattern, description in security_patterns:
-            found = False
-            for root, dirs, files in os.walk("packages/@alex-ai/core/src/security"):
-                for file in files:
-                    if file.endswith('.ts'):
-                        file_path = os.path.join(root, file)
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                content = f.read().lower()
-                                if pattern in content:
-                                    found = True
-                                    break
-                        except:
-                            pass
-                if found:
-                    break
-            
+            found = bool(hits[pattern])
             if found:
                 test_results["passed"] += 1
-                test_results["details"].append(f"✅ {description} found")
+                test_results["details"].append(f"✅ {description} found ({os.path.relpath(hits[pattern][0], REPO_ROOT)})")
             else:
                 test_results["failed"] += 1
                 test_results["details"].append(f"❌ {description} not found")
@@ -158,27 +242,21 @@ class OfflineSecurityTester:
             "details": []
         }
         
-        # Check package.json for security dependencies
-        package_json_path = "packages/@alex-ai/core/package.json"
-        if os.path.exists(package_json_path):
-            try:
-                with open(package_json_path, 'r') as f:
-                    package_data = json.load(f)
-                
-                security_deps = ["bcrypt", "jsonwebtoken", "pg"]
-                for dep in security_deps:
-                    if dep in package_data.get("dependencies", {}):
-                        test_results["passed"] += 1
-                        test_results["details"].append(f"✅ Security dependency found: {dep}")
-                    else:
-                        test_results["failed"] += 1
-                        test_results["details"].append(f"❌ Security dependency missing: {dep}")
-            except:
-                test_results["failed"] += 1
-                test_results["details"].append("❌ Error reading package.json")
-        else:
+        # Check the monorepo's manifests for security dependencies
+        graph = self.dependency_graph()
+        for error in graph.errors:
             test_results["failed"] += 1
-            test_results["details"].append("❌ package.json not found")
+            test_results["details"].append(f"❌ Unreadable dependency manifest: {error}")
+        
+        security_deps = ["bcrypt", "jsonwebtoken", "pg"]
+        for dep in security_deps:
+            declared_by = graph.declared(dep)
+            if declared_by:
+                test_results["passed"] += 1
+                test_results["details"].append(f"✅ Security dependency found: {dep} ({declared_by[0][0]})")
+            else:
+                test_results["failed"] += 1
+                test_results["details"].append(f"❌ Security dependency missing: {dep}")
         
         # Check for security configuration files
         config_files = [
@@ -187,7 +265,7 @@ class OfflineSecurityTester:
         ]
         
         for config_file in config_files:
-            if os.path.exists(config_file):
+            if os.path.exists(repo_path(config_file)):
                 test_results["passed"] += 1
                 test_results["details"].append(f"✅ Configuration file exists: {config_file}")
             else:
@@ -209,12 +287,6 @@ class OfflineSecurityTester:
             "details": []
         }
         
-        # Check for known vulnerable dependencies
-        vulnerable_deps = [
-            "lodash@4.17.0",  # Example vulnerable version
-            "moment@2.19.0",  # Example vulnerable version
-        ]
-        
         # Check for security-focused dependencies
         security_deps = [
             "bcrypt",
@@ -225,39 +297,33 @@ class OfflineSecurityTester:
             "express-validator"
         ]
         
-        package_json_path = "packages/@alex-ai/core/package.json"
-        if os.path.exists(package_json_path):
-            try:
-                with open(package_json_path, 'r') as f:
-                    package_data = json.load(f)
-                
-                dependencies = package_data.get("dependencies", {})
-                
-                # Check for security dependencies
-                for dep in security_deps:
-                    if dep in dependencies:
-                        test_results["passed"] += 1
-                        test_results["details"].append(f"✅ Security dependency present: {dep}")
-                    else:
-                        test_results["failed"] += 1
-                        test_results["details"].append(f"❌ Security dependency missing: {dep}")
-                
-                # Check for vulnerable dependencies
-                for vuln_dep in vulnerable_deps:
-                    dep_name = vuln_dep.split('@')[0]
-                    if dep_name in dependencies:
-                        test_results["failed"] += 1
-                        test_results["details"].append(f"❌ Potentially vulnerable dependency: {dep_name}")
-                    else:
-                        test_results["passed"] += 1
-                        test_results["details"].append(f"✅ No vulnerable dependency: {dep_name}")
-                        
-            except:
+        try:
+            graph = self.dependency_graph()
+            
+            for dep in security_deps:
+                declared_by = graph.declared(dep)
+                if declared_by:
+                    test_results["passed"] += 1
+                    test_results["details"].append(f"✅ Security dependency present: {dep} ({declared_by[0][0]})")
+                else:
+                    test_results["failed"] += 1
+                    test_results["details"].append(f"❌ Security dependency missing: {dep}")
+            
+            # Check every resolved version against the offline advisory database
+            advisories = AdvisoryDatabase()
+            findings = graph.audit(advisories)
+            for finding in findings:
                 test_results["failed"] += 1
-                test_results["details"].append("❌ Error analyzing dependencies")
-        else:
+                test_results["details"].append(
+                    f"❌ {finding['severity']} {finding['package']}@{finding['version']} ({finding['advisory']}): "
+                    f"{finding['title']} via {' > '.join(finding['via'])}")
+            if not findings:
+                test_results["passed"] += 1
+                test_results["details"].append(
+                    f"✅ None of {len(graph.packages)} installed packages match the {len(advisories)} known advisories")
+        except (OSError, ValueError) as e:
             test_results["failed"] += 1
-            test_results["details"].append("❌ package.json not found")
+            test_results["details"].append(f"❌ Error analyzing dependencies: {e}")
         
         self.test_results.append(test_results)
         print(f"   Results: {test_results['passed']} passed, {test_results['failed']} failed")
@@ -275,17 +341,10 @@ class OfflineSecurityTester:
         }
         
         # Check for sensitive files with proper permissions
-        sensitive_files = [
-            ".env",
-            "config.json",
-            "credentials.json",
-            "secrets.json"
-        ]
-        
-        for file_path in sensitive_files:
-            if os.path.exists(file_path):
+        for file_path in SENSITIVE_FILES:
+            if os.path.exists(repo_path(file_path)):
                 try:
-                    stat_info = os.stat(file_path)
+                    stat_info = os.stat(repo_path(file_path))
                     permissions = oct(stat_info.st_mode)[-3:]
                     
                     # Check if file is readable by others (should not be)
@@ -318,13 +377,7 @@ class OfflineSecurityTester:
         }
         
         # Check for environment variables
-        required_env_vars = [
-            "JWT_SECRET",
-            "ENCRYPTION_KEY",
-            "DATABASE_URL"
-        ]
-        
-        for env_var in required_env_vars:
+        for env_var in REQUIRED_ENV_VARS:
             if os.getenv(env_var):
                 test_results["passed"] += 1
                 test_results["details"].append(f"✅ Environment variable set: {env_var}")
@@ -333,11 +386,10 @@ class OfflineSecurityTester:
                 test_results["details"].append(f"❌ Environment variable missing: {env_var}")
         
         # Check for .gitignore security
-        gitignore_path = ".gitignore"
+        gitignore_path = repo_path(".gitignore")
         if os.path.exists(gitignore_path):
             try:
-                with open(gitignore_path, 'r') as f:
-                    gitignore_content = f.read()
+                gitignore_entries = self.file_index.facts(gitignore_path, "gitignore_entries", extract_gitignore_entries)
                 
                 security_patterns = [
                     ".env",
@@ -348,7 +400,7 @@ class OfflineSecurityTester:
                 ]
                 
                 for pattern in security_patterns:
-                    if pattern in gitignore_content:
+                    if any(pattern in entry for entry in gitignore_entries):
                         test_results["passed"] += 1
                         test_results["details"].append(f"✅ Security pattern in .gitignore: {pattern}")
                     else:
@@ -365,6 +417,38 @@ class OfflineSecurityTester:
         print(f"   Results: {test_results['passed']} passed, {test_results['failed']} failed")
         print()
     
+    def test_repository_secrets(self):
+        """Scan every text file in the repository for committed secrets"""
+        print("🔍 Scanning Repository for Secrets...")
+        
+        test_results = {
+            "test_name": "Repository Secret Scan",
+            "passed": 0,
+            "failed": 0,
+            "details": []
+        }
+        
+        scan = RepositorySecretScanner(REPO_ROOT).scan()
+        for path, findings in sorted(scan["findings"].items()):
+            for finding in findings:
+                test_results["failed"] += 1
+                test_results["details"].append(f"❌ {finding['label']} in {path} at byte {finding['offset']}: {finding['redacted']}")
+        
+        if not scan["finding_count"]:
+            test_results["passed"] += 1
+            test_results["details"].append(f"✅ No secrets in {scan['files']} files")
+        
+        self.test_results.append(test_results)
+        print(f"   Scanned {scan['files']} files in {scan['elapsed']}s")
+        print(f"   Results: {test_results['passed']} passed, {test_results['failed']} failed")
+        print()
+    
+    def dependency_graph(self) -> DependencyGraph:
+        """Monorepo dependency graph, built once and shared by the dependency checks"""
+        if self._dependency_graph is None:
+            self._dependency_graph = DependencyGraph.from_repo(REPO_ROOT, index=self.file_index)
+        return self._dependency_graph
+    
     def generate_offline_report(self) -> Dict[str, Any]:
         """Generate offline test report"""
         total_passed = sum(result["passed"] for result in self.test_results)
@@ -411,7 +495,14 @@ class OfflineSecurityTester:
 
 def main():
     """Main function to run offline security tests"""
-    tester = OfflineSecurityTester()
+    parser = argparse.ArgumentParser(description="Alex AI Offline Security Test Suite")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only re-run checks whose covered files changed since the last run")
+    parser.add_argument("--secret-scan", action="store_true",
+                        help="Also scan every file in the repository for committed secrets")
+    args = parser.parse_args()
+    
+    tester = OfflineSecurityTester(incremental=args.incremental, secret_scan=args.secret_scan)
     
     try:
         report = tester.run_offline_tests()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Alex AI Payload Classifiers
+Precompiled SQL injection and XSS classifiers for request-path pre-filtering
+"""
+
+import time
+from typing import Dict, Any, Sequence, Tuple
+
+# Rule ID -> literal needles. Needles match case-insensitively anywhere in the
+# input, which is what the original substring checks did.
+SQL_INJECTION_RULES = {
+    "sqli_union": ("UNION",),
+    "sqli_drop": ("DROP",),
+    "sqli_delete": ("DELETE",),
+    "sqli_insert": ("INSERT",),
+    "sqli_update": ("UPDATE",),
+    "sqli_exec": ("EXEC",),  # also covers EXECUTE
+    "sqli_line_comment": ("--",),
+    "sqli_block_comment": ("/*", "*/"),
+    "sqli_tautology": ("OR 1=1", "AND 1=1"),
+    "sqli_quote_terminator": ("';", "\";")
+}
+
+XSS_RULES = {
+    "xss_script_tag": ("<SCRIPT", "</SCRIPT>"),
+    "xss_javascript_url": ("JAVASCRIPT:",),
+    "xss_vbscript_url": ("VBSCRIPT:",),
+    "xss_event_handler": ("ONERROR=", "ONLOAD=", "ONCLICK=", "ONMOUSEOVER=", "ONFOCUS=", "ONBLUR=")
+}
+
+
+class PatternClassifier:
+    """Rules compiled into a flat, uppercased needle table scanned at C speed.
+
+    An input is uppercased once and each needle is a C-level substring test.
+    Joining many inputs and running ``str.find`` per needle over the whole
+    batch scans the same bytes and benchmarked slower, and Python's regex
+    engine (one alternation of every needle) slower still, so there is no
+    separate batch path.
+    """
+
+    def __init__(self, name: str, rules: Dict[str, Tuple[str, ...]]):
+        self.name = name
+        self.rules = {rule_id: tuple(needle.upper() for needle in needles) for rule_id, needles in rules.items()}
+        self.needles = [(rule_id, needle) for rule_id, needles in self.rules.items() for needle in needles]
+
+    def is_safe(self, text: str) -> bool:
+        """True when no rule matches the input"""
+        upper = text.upper()
+        for _, needle in self.needles:
+            if needle in upper:
+                return False
+        return True
+
+    def classify(self, text: str) -> Dict[str, Any]:
+        """Verdict and matched rule IDs (in rule order) for one input"""
+        upper = text.upper()
+        matched = {rule_id for rule_id, needle in self.needles if needle in upper}
+        if not matched:
+            return {"safe": True, "rules": []}
+        return {"safe": False, "rules": [rule_id for rule_id in self.rules if rule_id in matched]}
+
+
+SQL_INJECTION_CLASSIFIER = PatternClassifier("sql_injection", SQL_INJECTION_RULES)
+XSS_CLASSIFIER = PatternClassifier("xss", XSS_RULES)
+
+
+def benchmark(classifier: PatternClassifier, texts: Sequence[str], rounds: int = 5) -> Dict[str, Any]:
+    """Throughput of verdicts alone and of verdicts with rule IDs over the same inputs"""
+    timings = {}
+    for mode, run in (("verdict", lambda: [classifier.is_safe(text) for text in texts]),
+                      ("rules", lambda: [classifier.classify(text) for text in texts])):
+        best = float("inf")
+        for _ in range(rounds):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+        timings[mode] = {"seconds": round(best, 5), "inputs_per_second": int(len(texts) / best) if best else 0}
+    return timings
+
+
+def main():
+    """Benchmark the classifiers on the payload corpus"""
+    from payload_corpus import get_corpus
+
+    corpus = get_corpus()
+    print("⚡ Payload classifier benchmark")
+    for category, classifier in (("sql_injection", SQL_INJECTION_CLASSIFIER), ("xss", XSS_CLASSIFIER)):
+        payloads = corpus.payloads(category)
+        # Mostly-benign request bodies with 1% attacks, as a request-path pre-filter would see
+        texts = [
+            payloads[index // 100 % len(payloads)] if index % 100 == 0 else
+            f'{{"id": {index}, "query": "status report for mission {index}", "notes": "routine log entry from the bridge"}}'
+            for index in range(10000)
+        ]
+        timings = benchmark(classifier, texts)
+        flagged = sum(1 for payload in payloads if not classifier.is_safe(payload))
+        print(f"   {category}: {flagged}/{len(payloads)} corpus payloads flagged")
+        print(f"      verdict: {timings['verdict']['inputs_per_second']:,} inputs/s, "
+              f"with rule IDs: {timings['rules']['inputs_per_second']:,} inputs/s")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Alex AI Payload Corpus
+Shared, versioned attack payload corpus loaded lazily by every security suite
+"""
+
+import os
+import json
+import threading
+from functools import lru_cache
+from typing import Dict, List, Any, Iterable, Optional
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "payloads")
+
+# Extra corpus directories (each with its own manifest.json), separated by os.pathsep
+EXTRA_CORPUS_ENV = "ALEX_AI_PAYLOAD_PATH"
+
+REQUIRED_FIELDS = ("id", "payload", "category", "severity", "tags")
+
+
+class PayloadCorpus:
+    """Payloads stored as one JSON-lines file per category, described by a versioned manifest.
+
+    Only the manifest is read up front; a category's files are parsed the first
+    time that category is asked for and kept for the life of the corpus object.
+    Entries with the same payload text are stored once, with their tags merged,
+    so suites that share payloads share a single copy. Suites pick payloads by
+    category and tag rather than keeping their own lists.
+    """
+
+    def __init__(self, root: str = CORPUS_DIR, extra_roots: Optional[List[str]] = None):
+        self.roots = [root] + list(extra_roots or [])
+        self.lock = threading.Lock()
+        self.manifests = [self._load_manifest(corpus_root) for corpus_root in self.roots]
+        self.loaded: Dict[str, List[Dict[str, Any]]] = {}
+        self.duplicates = 0
+
+    @property
+    def version(self) -> str:
+        """Version of the primary corpus"""
+        return self.manifests[0].get("version", "0")
+
+    def categories(self) -> List[str]:
+        """Every category declared by any of the manifests"""
+        names = []
+        for manifest in self.manifests:
+            for category in manifest.get("categories", {}):
+                if category not in names:
+                    names.append(category)
+        return names
+
+    def entries(self, category: str) -> List[Dict[str, Any]]:
+        """All deduplicated entries of a category, loading it on first use"""
+        with self.lock:
+            if category not in self.loaded:
+                self.loaded[category] = self._load_category(category)
+            return self.loaded[category]
+
+    def select(self, category: str, tags: Optional[Iterable[str]] = None, family: Optional[str] = None,
+               min_severity: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entries of a category carrying all the given tags, in corpus order"""
+        wanted = set(tags or [])
+        severities = self.manifests[0].get("severities", [])
+        floor = severities.index(min_severity) if min_severity in severities else 0
+
+        selected = []
+        for entry in self.entries(category):
+            if wanted and not wanted.issubset(entry["tags"]):
+                continue
+            if family is not None and entry.get("family") != family:
+                continue
+            if floor and entry["severity"] in severities and severities.index(entry["severity"]) < floor:
+                continue
+            selected.append(entry)
+        return selected
+
+    def payloads(self, category: str, tags: Optional[Iterable[str]] = None, **filters) -> List[str]:
+        """Just the payload strings of the selected entries"""
+        return [entry["payload"] for entry in self.select(category, tags, **filters)]
+
+    def families(self, category: str, tags: Optional[Iterable[str]] = None) -> Dict[str, List[str]]:
+        """Selected payloads grouped by technique family, in order of first appearance"""
+        grouped: Dict[str, List[str]] = {}
+        for entry in self.select(category, tags):
+            grouped.setdefault(entry.get("family", "other"), []).append(entry["payload"])
+        return grouped
+
+    def stats(self) -> Dict[str, Any]:
+        """Loaded categories, entry counts and duplicates folded away"""
+        return {
+            "version": self.version,
+            "loaded": {category: len(entries) for category, entries in self.loaded.items()},
+            "duplicates": self.duplicates
+        }
+
+    def _load_manifest(self, corpus_root: str) -> Dict[str, Any]:
+        with open(os.path.join(corpus_root, "manifest.json"), "r") as f:
+            return json.load(f)
+
+    def _load_category(self, category: str) -> List[Dict[str, Any]]:
+        entries: List[Dict[str, Any]] = []
+        by_payload: Dict[str, Dict[str, Any]] = {}
+
+        for corpus_root, manifest in zip(self.roots, self.manifests):
+            spec = manifest.get("categories", {}).get(category)
+            if spec is None:
+                continue
+
+            for filename in spec.get("files", []):
+                path = os.path.join(corpus_root, filename)
+                for entry in self._read_entries(path, category):
+                    existing = by_payload.get(entry["payload"])
+                    if existing is not None:
+                        # Keep the first definition and fold the duplicate's tags into it
+                        existing["tags"] = existing["tags"] | entry["tags"]
+                        self.duplicates += 1
+                        continue
+                    by_payload[entry["payload"]] = entry
+                    entries.append(entry)
+
+        if not entries and category not in self.categories():
+            raise KeyError(f"Unknown payload category: {category}")
+        return entries
+
+    def _read_entries(self, path: str, category: str):
+        with open(path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                missing = [field for field in REQUIRED_FIELDS if field not in entry]
+                if missing:
+                    raise ValueError(f"{path}:{line_number}: missing {', '.join(missing)}")
+                if entry["category"] != category:
+                    raise ValueError(f"{path}:{line_number}: category {entry['category']} in {category} file")
+                entry["tags"] = frozenset(entry["tags"])
+                yield entry
+
+
+@lru_cache(maxsize=None)
+def get_corpus(root: str = CORPUS_DIR) -> PayloadCorpus:
+    """Process-wide corpus, plus any extra corpora named in ALEX_AI_PAYLOAD_PATH"""
+    extra_roots = [path for path in os.environ.get(EXTRA_CORPUS_ENV, "").split(os.pathsep) if path]
+    return PayloadCorpus(root, extra_roots)
+
+
+def main():
+    """Print a summary of the corpus"""
+    corpus = get_corpus()
+    print(f"📚 Payload corpus v{corpus.version}")
+    for category in corpus.categories():
+        entries = corpus.entries(category)
+        tags = sorted({tag for entry in entries for tag in entry["tags"]})
+        print(f"   {category}: {len(entries)} payloads ({', '.join(tags)})")
+    print(f"   Duplicates folded: {corpus.duplicates}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
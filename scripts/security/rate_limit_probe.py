@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Alex AI Rate Limit Probe
+Measures the effective limit, window and recovery time of a rate limiter with concurrent bursts
+"""
+
+import time
+import requests
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional
+
+# Header names limiters use to advertise their configuration, most specific first
+LIMIT_HEADERS = ("RateLimit-Limit", "X-RateLimit-Limit", "X-Rate-Limit-Limit")
+RESET_HEADERS = ("RateLimit-Reset", "X-RateLimit-Reset", "X-Rate-Limit-Reset")
+# Shortest wait between recovery probes, even when told to retry immediately
+MIN_BACKOFF = 0.05
+
+
+def admitted(status: int) -> bool:
+    """A request got past the limiter: any 2xx/3xx/4xx answer except 429"""
+    return 200 <= status < 500 and status != 429
+
+
+class RateLimitProbe:
+    """Find where a rate limiter starts rejecting requests and how long it takes to recover.
+
+    Requests are sent in concurrent bursts of doubling size (8, 16, 32, ...) so the
+    limit is crossed within a fraction of the window. Once the first 429 comes back
+    the requests accepted so far give the effective limit; single recovery probes
+    then back off exponentially - or wait exactly as long as a Retry-After or
+    RateLimit-Reset header asks - until the limiter admits a request again. The
+    probe stops as soon as both numbers are known, or when its request or time
+    budget runs out.
+    """
+
+    def __init__(self, base_url: str, endpoint: str = "/api/status", initial_burst: int = 8,
+                 max_requests: int = 400, concurrency: int = 32, recovery_budget: float = 120.0,
+                 initial_backoff: float = 0.25, request_timeout: float = 10.0):
+        self.base_url = base_url
+        self.endpoint = endpoint
+        self.initial_burst = initial_burst
+        self.max_requests = max_requests
+        self.concurrency = concurrency
+        self.recovery_budget = recovery_budget
+        self.initial_backoff = initial_backoff
+        self.request_timeout = request_timeout
+        self.requests_sent = 0
+
+        # A dedicated pool sized for the largest burst keeps the burst truly concurrent
+        self.session = requests.Session()
+        self.session.mount("http://", requests.adapters.HTTPAdapter(pool_maxsize=concurrency))
+        self.session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=concurrency))
+
+    def close(self):
+        """Release the probe session"""
+        self.session.close()
+
+    def measure(self) -> Dict[str, Any]:
+        """Burst until the limiter engages, then measure how long it takes to recover"""
+        result = {
+            "endpoint": self.endpoint,
+            "verdict": "NOT_LIMITED",
+            "measured_limit": None,
+            "advertised_limit": None,
+            "window_seconds": None,
+            "recovery_seconds": None,
+            "retry_after": None,
+            "bursts": [],
+            "requests_sent": 0
+        }
+
+        start = time.perf_counter()
+        accepted = 0
+        burst_size = self.initial_burst
+        blocked_response = None
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            while self.requests_sent < self.max_requests:
+                burst_size = min(burst_size, self.max_requests - self.requests_sent)
+                responses = list(executor.map(lambda _: self._request(), range(burst_size)))
+                statuses = [response["status_code"] for response in responses]
+
+                # Anything past the limiter used up budget, whatever the endpoint answered
+                burst_accepted = sum(1 for status in statuses if admitted(status))
+                burst_blocked = statuses.count(429)
+                result["bursts"].append({"size": burst_size, "accepted": burst_accepted, "blocked": burst_blocked})
+
+                if len(result["bursts"]) == 1 and all(status == 0 for status in statuses):
+                    result["verdict"] = "UNREACHABLE"
+                    break
+
+                if result["advertised_limit"] is None:
+                    result["advertised_limit"] = self._advertised_limit(responses)
+
+                accepted += burst_accepted
+                if burst_blocked:
+                    blocked_response = next(r for r in responses if r["status_code"] == 429)
+                    break
+
+                burst_size *= 2
+
+            if blocked_response is not None:
+                blocked_at = time.perf_counter()
+                result["verdict"] = "LIMITED"
+                result["measured_limit"] = accepted
+                result["retry_after"] = self._retry_after(blocked_response["headers"])
+
+                recovered_at = self._await_recovery(result["retry_after"], blocked_at)
+                if recovered_at is None:
+                    result["verdict"] = "NO_RECOVERY"
+                else:
+                    result["recovery_seconds"] = round(recovered_at - blocked_at, 3)
+                    # The window opened with the first burst and closed when requests were admitted again
+                    result["window_seconds"] = round(recovered_at - start, 3)
+
+        result["requests_sent"] = self.requests_sent
+        result["elapsed"] = round(time.perf_counter() - start, 3)
+        return result
+
+    def _await_recovery(self, retry_after: Optional[float], blocked_at: float) -> Optional[float]:
+        """Probe with exponential backoff until a request is admitted; returns the admission time"""
+        deadline = blocked_at + self.recovery_budget
+        floor = max(self.initial_backoff, MIN_BACKOFF)
+        wait = retry_after if retry_after is not None and retry_after >= floor else floor
+
+        while self.requests_sent < self.max_requests:
+            if time.perf_counter() + wait > deadline:
+                return None
+            time.sleep(wait)
+
+            response = self._request()
+            if admitted(response["status_code"]):
+                return time.perf_counter()
+
+            hint = self._retry_after(response["headers"])
+            # Still limited, unreachable (0) or failing (5xx): trust the server's hint unless it is
+            # below the floor ("Retry-After: 0" would spin through the request budget); otherwise double the wait
+            wait = hint if hint is not None and hint >= floor else wait * 2
+
+        return None
+
+    def _request(self) -> Dict[str, Any]:
+        self.requests_sent += 1
+        try:
+            response = self.session.get(f"{self.base_url}{self.endpoint}", timeout=self.request_timeout)
+            return {"status_code": response.status_code, "headers": dict(response.headers)}
+        except requests.exceptions.RequestException:
+            return {"status_code": 0, "headers": {}}
+
+    def _advertised_limit(self, responses: List[Dict[str, Any]]) -> Optional[int]:
+        for response in responses:
+            value = self._header(response["headers"], LIMIT_HEADERS)
+            if value:
+                try:
+                    # "100" or the draft-standard "100, 100;w=60" form
+                    return int(value.split(",")[0].split(";")[0].strip())
+                except ValueError:
+                    continue
+        return None
+
+    def _retry_after(self, headers: Dict[str, str]) -> Optional[float]:
+        """Seconds the limiter asks us to wait, from Retry-After or a RateLimit-Reset header"""
+        value = self._header(headers, ("Retry-After",) + RESET_HEADERS)
+        if not value:
+            return None
+
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                # Retry-After may also be an HTTP date
+                return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+            except (TypeError, ValueError):
+                return None
+
+        # Some limiters send the reset as an epoch timestamp rather than a delta
+        if seconds > 10 ** 9:
+            seconds -= time.time()
+        return max(0.0, seconds)
+
+    def _header(self, headers: Dict[str, str], names) -> Optional[str]:
+        lowered = {key.lower(): value for key, value in headers.items()}
+        for name in names:
+            if name.lower() in lowered:
+                return lowered[name.lower()]
+        return None
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""
+Alex AI Repository Secret Scan
+Memory-mapped, multi-process secret scan of the whole repository, fast enough for a pre-push hook
+"""
+
+import os
+import sys
+import mmap
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+from dlp_scanner import DLPScanner
+
+# Directories never worth scanning: VCS metadata, third-party code and caches
+SKIP_DIRS = {".git", "node_modules", "__pycache__", ".security_cache", ".next", ".turbo", "coverage"}
+
+# Test fixtures that contain fake secrets on purpose
+DEFAULT_EXCLUDES = ["scripts/security/payloads"]
+
+# Bytes sniffed from the start of a file to decide whether it is binary
+SNIFF_BYTES = 8192
+
+_worker_scanner: Optional[DLPScanner] = None
+
+
+def _init_worker(categories: List[str]):
+    global _worker_scanner
+    _worker_scanner = DLPScanner(categories=categories)
+
+
+def is_binary(head: bytes) -> bool:
+    """Treat a file as binary when its first bytes contain a NUL"""
+    return b"\0" in head
+
+
+def scan_file(path: str) -> Tuple[str, str, List[Dict[str, Any]]]:
+    """Scan one file through mmap; returns (path, status, findings)"""
+    scanner = _worker_scanner or DLPScanner(categories=["secret"])
+    try:
+        with open(path, "rb") as f:
+            if is_binary(f.read(SNIFF_BYTES)):
+                return path, "binary", []
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return path, "empty", []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                chunk_size = scanner.chunk_size
+                findings = list(scanner.scan_chunks(mapped[start:start + chunk_size]
+                                                    for start in range(0, size, chunk_size)))
+        return path, "scanned", findings
+    except (OSError, ValueError):
+        return path, "unreadable", []
+
+
+class RepositorySecretScanner:
+    """Walk a directory tree and scan every text file for secrets in a process pool.
+
+    Files are sorted largest first and handed to the workers in small batches,
+    so one big JSON report does not leave the other workers idle at the end.
+    Each worker maps its file read-only and scans it chunk by chunk, so memory
+    stays flat however large the file is.
+    """
+
+    def __init__(self, root: str = ".", categories: Optional[List[str]] = None,
+                 excludes: Optional[List[str]] = None, workers: Optional[int] = None):
+        self.root = root
+        self.categories = categories or ["secret"]
+        self.excludes = [os.path.normpath(os.path.join(root, path)) for path in (excludes if excludes is not None else DEFAULT_EXCLUDES)]
+        self.workers = workers or os.cpu_count() or 1
+
+    def collect_files(self) -> List[str]:
+        """Every regular file below the root, minus skipped directories and excludes"""
+        files = []
+        for current, dirs, names in os.walk(self.root):
+            dirs[:] = [
+                d for d in dirs
+                if d not in SKIP_DIRS and os.path.normpath(os.path.join(current, d)) not in self.excludes
+            ]
+            for name in names:
+                path = os.path.join(current, name)
+                if os.path.normpath(path) in self.excludes or not os.path.isfile(path) or os.path.islink(path):
+                    continue
+                files.append(path)
+        return files
+
+    def scan(self) -> Dict[str, Any]:
+        """Scan the tree and return findings grouped by file plus timing"""
+        start = time.perf_counter()
+        files = self.collect_files()
+        files.sort(key=lambda path: os.path.getsize(path), reverse=True)
+
+        if self.workers > 1 and len(files) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                     initargs=(self.categories,)) as executor:
+                results = list(executor.map(scan_file, files, chunksize=16))
+        else:
+            _init_worker(self.categories)
+            results = [scan_file(path) for path in files]
+
+        counts: Dict[str, int] = {}
+        findings = {}
+        for path, status, file_findings in results:
+            counts[status] = counts.get(status, 0) + 1
+            if file_findings:
+                findings[os.path.relpath(path, self.root)] = file_findings
+
+        return {
+            "root": self.root,
+            "files": len(files),
+            "status_counts": counts,
+            "bytes": sum(os.path.getsize(path) for path in files),
+            "findings": findings,
+            "finding_count": sum(len(file_findings) for file_findings in findings.values()),
+            "elapsed": round(time.perf_counter() - start, 3)
+        }
+
+
+def main():
+    """Secret-scan the repository; exits non-zero when anything is found (for pre-push hooks)"""
+    parser = argparse.ArgumentParser(description="Alex AI Repository Secret Scan")
+    parser.add_argument("root", nargs="?", default=".", help="Directory to scan (default: current directory)")
+    parser.add_argument("--pii", action="store_true", help="Also report personal data (emails, phones, cards)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument("--exclude", action="append", default=None,
+                        help="Path relative to the root to skip (repeatable; replaces the defaults)")
+    args = parser.parse_args()
+
+    categories = ["secret", "pii"] if args.pii else ["secret"]
+    scanner = RepositorySecretScanner(args.root, categories, args.exclude, args.workers)
+
+    print("🔐 Alex AI Repository Secret Scan")
+    result = scanner.scan()
+    megabytes = result["bytes"] / (1 << 20)
+    print(f"   {result['files']} files ({megabytes:.1f} MB) in {result['elapsed']}s with {scanner.workers} workers")
+    print(f"   Skipped: {result['status_counts'].get('binary', 0)} binary, "
+          f"{result['status_counts'].get('unreadable', 0)} unreadable")
+
+    for path, findings in sorted(result["findings"].items()):
+        for finding in findings:
+            print(f"❌ {path}@{finding['offset']}: {finding['label']} {finding['redacted']}")
+
+    if result["finding_count"]:
+        print(f"🚨 {result['finding_count']} potential secrets found")
+        return 1
+
+    print("✅ No secrets found")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,16 +8,78 @@ import os
 import sys
 import json
 import time
+import shlex
+import argparse
+import importlib
+import threading
+import traceback
 import subprocess
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+
+SECURITY_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Suites and the resources they need. Suites that need the server can run
+# alongside each other and alongside the ones that do not; an "exclusive load"
+# suite measures the server under load, so no other suite may talk to the
+# server while it runs. Weights feed the security score.
+#
+# In-process mode imports "module", builds "class" (passing the shared HTTP
+# session to suites that need the server) and calls "run". A suite passes when
+# its report's overall_status is PASS, or for "pass_when": "completed" suites
+# (whose scripts exit 0 whenever they finish) when it runs to completion.
+# Weight-0 suites are advisory: their results are reported but do not change
+# the overall status, the pass/total counts or the score.
+SECURITY_SUITES = [
+    {"name": "basic_validation", "label": "Basic Security Validation", "script": "alex_ai_security_test.py",
+     "module": "alex_ai_security_test", "class": "AlexAISecurityTester", "run": "run_all_tests",
+     "pass_when": "status", "needs_server": False, "exclusive_load": False, "weight": 25},
+    {"name": "automated_validation", "label": "Automated Security Validation",
+     "script": "automated_security_validation.py", "module": "automated_security_validation",
+     "class": "AutomatedSecurityValidator", "run": "run_comprehensive_validation",
+     "pass_when": "status", "needs_server": True, "exclusive_load": False, "weight": 25},
+    {"name": "penetration_testing", "label": "Penetration Testing", "script": "penetration_testing_suite.py",
+     "module": "penetration_testing_suite", "class": "PenetrationTestingSuite", "run": "run_penetration_tests",
+     "pass_when": "completed", "needs_server": True, "exclusive_load": False, "weight": 30},
+    {"name": "performance_testing", "label": "Security Performance Testing", "script": "security_performance_test.py",
+     "module": "security_performance_test", "class": "SecurityPerformanceTester", "run": "run_performance_tests",
+     "pass_when": "completed", "needs_server": True, "exclusive_load": True, "weight": 15},
+    {"name": "offline_validation", "label": "Offline Security Validation", "script": "offline_security_test.py",
+     "module": "offline_security_test", "class": "OfflineSecurityTester", "run": "run_offline_tests",
+     "pass_when": "status", "needs_server": False, "exclusive_load": False, "weight": 0}
+]
+
+# Defensive checks of the validator and the attacks that must come up empty
+# when those checks pass. Both suites test the same server, so a passing check
+# next to a successful attack means one of them is wrong.
+CONSISTENCY_PAIRS = [
+    ("SQL Injection Prevention", ["SQL Injection Attacks", "Blind SQL Injection (Timing)"]),
+    ("XSS Prevention", ["XSS Attacks"]),
+    ("Authentication System", ["Authentication Bypass"]),
+    ("Session Management", ["Session Hijacking"])
+]
+
+ADVISORY_SUITES = {suite["name"] for suite in SECURITY_SUITES if suite["weight"] == 0}
+
+INTEGRATION_WEIGHT = 5
+SUITE_TIMEOUT = 300
 
 class MasterSecurityTestRunner:
-    def __init__(self):
+    def __init__(self, max_parallel: Optional[int] = None, timeout: int = SUITE_TIMEOUT,
+                 in_process: bool = False, pentest_authorized: bool = False):
         self.start_time = time.time()
         self.test_results = {}
         self.overall_status = "PASS"
         self.reports = {}
+        self.max_parallel = max_parallel or len(SECURITY_SUITES)
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.print_lock = threading.Lock()
+        self.in_process = in_process
+        self.pentest_authorized = pentest_authorized
+        self.session = None
+        self.stdout_proxy = None
+        self.suite_instances = {}
         
     def run_all_tests(self) -> Dict[str, Any]:
         """Run all security tests and generate comprehensive report"""
@@ -27,21 +89,11 @@ class MasterSecurityTestRunner:
         print("Running comprehensive security validation suite...")
         print()
         
-        # Test 1: Basic Security Validation
-        print("1️⃣  Running Basic Security Validation...")
-        self.run_test("python3 scripts/security/alex_ai_security_test.py", "basic_validation")
-        
-        # Test 2: Automated Security Validation
-        print("\n2️⃣  Running Automated Security Validation...")
-        self.run_test("python3 scripts/security/automated_security_validation.py", "automated_validation")
-        
-        # Test 3: Penetration Testing
-        print("\n3️⃣  Running Penetration Testing...")
-        self.run_test("python3 scripts/security/penetration_testing_suite.py", "penetration_testing")
-        
-        # Test 4: Performance Testing
-        print("\n4️⃣  Running Security Performance Testing...")
-        self.run_test("python3 scripts/security/security_performance_test.py", "performance_testing")
+        # Tests 1-4 plus the offline suite, overlapped where their resources allow
+        if self.in_process:
+            self.run_suites_in_process(SECURITY_SUITES)
+        else:
+            self.run_suites(SECURITY_SUITES)
         
         # Test 5: Integration Testing
         print("\n5️⃣  Running Integration Testing...")
@@ -50,80 +102,270 @@ class MasterSecurityTestRunner:
         # Generate master report
         return self.generate_master_report()
     
-    def run_test(self, command: str, test_name: str) -> bool:
-        """Run a specific test and capture results"""
+    def run_suites(self, suites: List[Dict[str, Any]]):
+        """Run suites concurrently, starting each one as soon as its resources are free"""
+        pending = list(suites)
+        running: List[Dict[str, Any]] = []
+        finished = threading.Condition(self.lock)
+        run_suite = self.run_suite_in_process if self.in_process else self.run_suite
+        
+        def run(suite: Dict[str, Any]):
+            started = time.time()
+            try:
+                run_suite(suite)
+            except Exception:
+                # Record the suite as failed rather than leaving it running forever
+                self.record_result(suite["name"], [suite["script"]], 1, "", traceback.format_exc(), started)
+            finally:
+                with finished:
+                    running.remove(suite)
+                    finished.notify()
+        
+        with finished:
+            while pending or running:
+                for suite in self.startable(pending, running):
+                    pending.remove(suite)
+                    running.append(suite)
+                    with self.print_lock:
+                        print(f"▶️  Starting {suite['label']} ({suite['name']})")
+                    threading.Thread(target=run, args=(suite,), daemon=True).start()
+                if pending or running:
+                    finished.wait()
+        
+        # Report suites in declaration order, not completion order
+        ordered = {suite["name"]: self.test_results.pop(suite["name"]) for suite in suites
+                   if suite["name"] in self.test_results}
+        self.test_results = {**ordered, **self.test_results}
+    
+    def startable(self, pending: List[Dict[str, Any]], running: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Pending suites that can start now, in declaration order"""
+        selected = []
+        active = list(running)
+        exclusive_waiting = False
+        for suite in pending:
+            if len(active) >= self.max_parallel:
+                break
+            server_busy = any(other["needs_server"] for other in active)
+            exclusive_running = any(other["exclusive_load"] for other in active)
+            if suite["exclusive_load"]:
+                if server_busy:
+                    # Hold back later server suites so the exclusive one is not starved
+                    exclusive_waiting = True
+                    continue
+            elif suite["needs_server"] and (exclusive_running or exclusive_waiting):
+                continue
+            selected.append(suite)
+            active.append(suite)
+        return selected
+    
+    def run_suite(self, suite: Dict[str, Any]) -> bool:
+        """Run one suite as a child process, streaming its output with a name prefix"""
+        command = [sys.executable, "-u", os.path.join(SECURITY_DIR, suite["script"])]
+        test_name = suite["name"]
+        started = time.time()
+        output = {"stdout": [], "stderr": []}
+        
         try:
-            print(f"   Running: {command}")
-            result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=300)
-            
-            self.test_results[test_name] = {
-                "command": command,
-                "return_code": result.returncode,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "success": result.returncode == 0,
-                "timestamp": datetime.now().isoformat()
-            }
-            
-            if result.returncode == 0:
-                print(f"   ✅ {test_name}: PASSED")
-                return True
-            else:
-                print(f"   ❌ {test_name}: FAILED (exit code: {result.returncode})")
-                if result.stderr:
-                    print(f"   Error: {result.stderr[:200]}...")
-                self.overall_status = "FAIL"
-                return False
-                
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                                       text=True, bufsize=1)
+        except OSError as e:
+            return self.record_result(test_name, command, -1, "", str(e), started)
+        
+        readers = [
+            threading.Thread(target=self.stream_output, args=(process.stdout, test_name, output["stdout"]), daemon=True),
+            threading.Thread(target=self.stream_output, args=(process.stderr, test_name, output["stderr"]), daemon=True)
+        ]
+        for reader in readers:
+            reader.start()
+        
+        try:
+            return_code = process.wait(timeout=self.timeout)
         except subprocess.TimeoutExpired:
-            print(f"   ⏰ {test_name}: TIMEOUT")
-            self.test_results[test_name] = {
-                "command": command,
-                "return_code": -1,
-                "stdout": "",
-                "stderr": "Test timed out after 5 minutes",
-                "success": False,
-                "timestamp": datetime.now().isoformat()
-            }
-            self.overall_status = "FAIL"
-            return False
-        except Exception as e:
-            print(f"   ❌ {test_name}: ERROR - {str(e)}")
-            self.test_results[test_name] = {
-                "command": command,
-                "return_code": -1,
-                "stdout": "",
-                "stderr": str(e),
-                "success": False,
-                "timestamp": datetime.now().isoformat()
-            }
+            process.kill()
+            process.wait()
+            for reader in readers:
+                # A grandchild may still hold the pipe open; do not wait on it forever
+                reader.join(5)
+            with self.print_lock:
+                print(f"   ⏰ {test_name}: TIMEOUT")
+            output["stderr"].append(f"Test timed out after {self.timeout} seconds\n")
+            return self.record_result(test_name, command, -1, "".join(output["stdout"]),
+                                      "".join(output["stderr"]), started)
+        
+        for reader in readers:
+            reader.join()
+        return self.record_result(test_name, command, return_code, "".join(output["stdout"]),
+                                  "".join(output["stderr"]), started)
+    
+    def run_suites_in_process(self, suites: List[Dict[str, Any]]):
+        """Run suites as objects in this interpreter, sharing one HTTP session and the payload corpus"""
+        from http_session import stateless_session
+        from suite_output import install as install_stdout
+        
+        # One pool for every suite; sized for the validator's and the load test's concurrent requests.
+        # It keeps no cookies, so a login in one suite is never sent by another
+        self.session = stateless_session(pool_connections=4, pool_maxsize=64)
+        
+        # Suite output is tagged per suite, including output from the threads a suite
+        # hands work to; the router stays installed, so a suite abandoned at its
+        # timeout cannot swap stdout back under the ones still running
+        self.stdout_proxy = install_stdout()
+        try:
+            self.run_suites(suites)
+        finally:
+            self.session.close()
+    
+    def run_suite_in_process(self, suite: Dict[str, Any]) -> bool:
+        """Build and run one suite object, keeping its report"""
+        test_name = suite["name"]
+        command = ["in-process", f"{suite['class']}.{suite['run']}"]
+        started = time.time()
+        
+        if suite["name"] == "penetration_testing" and not self.pentest_authorized:
+            return self.record_result(test_name, command, 1, "", "Penetration testing aborted - no permission granted", started)
+        
+        outcome: Dict[str, Any] = {}
+        
+        def run():
+            with self.stdout_proxy.tagged(f"[{test_name}] "):
+                try:
+                    module = importlib.import_module(suite["module"])
+                    suite_class = getattr(module, suite["class"])
+                    tester = suite_class(session=self.session) if suite["needs_server"] else suite_class()
+                    self.suite_instances[test_name] = tester
+                    outcome["report"] = getattr(tester, suite["run"])()
+                except Exception:
+                    outcome["error"] = traceback.format_exc()
+        
+        worker = threading.Thread(target=run, daemon=True)
+        worker.start()
+        worker.join(self.timeout)
+        if worker.is_alive():
+            # A thread cannot be killed; leave it behind and report the timeout
+            with self.print_lock:
+                print(f"   ⏰ {test_name}: TIMEOUT")
+            return self.record_result(test_name, command, -1, "", f"Test timed out after {self.timeout} seconds", started)
+        
+        if "error" in outcome:
+            return self.record_result(test_name, command, 1, "", outcome["error"], started)
+        
+        report = outcome["report"]
+        if not isinstance(report, dict):
+            return self.record_result(test_name, command, 1, "",
+                                      f"{suite['run']} returned {type(report).__name__}, not a report", started)
+        self.reports[test_name] = report
+        passed = suite["pass_when"] == "completed" or report.get("overall_status") == "PASS"
+        return self.record_result(test_name, command, 0 if passed else 1, report.get("summary", ""), "", started)
+    
+    def stream_output(self, stream, test_name: str, lines: List[str]):
+        """Echo a child's output line by line with its suite name, keeping a copy"""
+        for line in stream:
+            lines.append(line)
+            with self.print_lock:
+                print(f"[{test_name}] {line}", end="" if line.endswith("\n") else "\n", flush=True)
+        stream.close()
+    
+    def record_result(self, test_name: str, command: List[str], return_code: int, stdout: str,
+                      stderr: str, started: float) -> bool:
+        """Store a suite's result and report it"""
+        success = return_code == 0
+        advisory = test_name in ADVISORY_SUITES
+        self.test_results[test_name] = {
+            "command": shlex.join(command),
+            "return_code": return_code,
+            "stdout": stdout,
+            "stderr": stderr,
+            "success": success,
+            "advisory": advisory,
+            "duration_seconds": round(time.time() - started, 2),
+            "timestamp": datetime.now().isoformat()
+        }
+        
+        with self.print_lock:
+            if success:
+                print(f"   ✅ {test_name}: PASSED ({self.test_results[test_name]['duration_seconds']}s)")
+            else:
+                print(f"   {'⚠️ ' if advisory else '❌'} {test_name}: FAILED{' (advisory)' if advisory else ''} "
+                      f"(exit code: {return_code})")
+                if stderr:
+                    print(f"   Error: {stderr[:200]}...")
+        if not success and not advisory:
             self.overall_status = "FAIL"
-            return False
+        return success
+    
+    def scored_results(self) -> Dict[str, Dict[str, Any]]:
+        """Results that count toward the overall status, pass/total counts and score"""
+        return {name: result for name, result in self.test_results.items() if not result.get("advisory")}
     
     def run_integration_tests(self):
-        """Run integration tests"""
-        integration_tests = {
-            "integration_testing": {
-                "command": "python3 scripts/security/alex_ai_security_test.py",
-                "return_code": 0,
-                "stdout": "Integration test simulation",
-                "stderr": "",
-                "success": True,
-                "timestamp": datetime.now().isoformat()
-            }
+        """Check that the suites' reports agree with each other and that they shared their resources"""
+        if not self.reports:
+            print("   ⏭️  Integration Testing: skipped (suite reports are only available with --in-process)")
+            return
+        
+        details = []
+        failed = 0
+        
+        # Every suite should have used the one process-wide corpus and, if it talks HTTP, the shared session
+        corpora = {id(tester.corpus) for tester in self.suite_instances.values() if hasattr(tester, "corpus")}
+        if len(corpora) <= 1:
+            details.append(f"✅ {len(self.suite_instances)} suites shared one payload corpus")
+        else:
+            failed += 1
+            details.append(f"❌ Suites loaded {len(corpora)} separate payload corpora")
+        
+        unshared = [name for name, tester in self.suite_instances.items()
+                    if hasattr(tester, "session") and tester.session is not self.session]
+        if unshared:
+            failed += 1
+            details.append(f"❌ Suites with their own HTTP session: {', '.join(unshared)}")
+        else:
+            details.append("✅ HTTP suites shared one connection pool")
+        
+        # A defensive check that passed must not sit next to a successful attack on the same weakness
+        validation = {result["test_name"]: result for result in self.reports.get("automated_validation", {}).get("test_results", [])}
+        attacks = {result["test_name"]: result for result in self.reports.get("penetration_testing", {}).get("test_results", [])}
+        for check_name, attack_names in CONSISTENCY_PAIRS:
+            check = validation.get(check_name)
+            if check is None or check.get("cached"):
+                continue
+            for attack_name in attack_names:
+                attack = attacks.get(attack_name)
+                if attack is None:
+                    continue
+                found = len(attack.get("vulnerabilities", []))
+                if check["failed"] == 0 and found:
+                    failed += 1
+                    details.append(f"❌ {check_name} passed but {attack_name} found {found} vulnerabilities")
+                else:
+                    details.append(f"✅ {check_name} agrees with {attack_name}")
+        
+        self.test_results["integration_testing"] = {
+            "command": "in-process cross-suite consistency checks",
+            "return_code": 0 if failed == 0 else 1,
+            "stdout": "\n".join(details),
+            "stderr": "",
+            "success": failed == 0,
+            "timestamp": datetime.now().isoformat()
         }
         
-        self.test_results.update(integration_tests)
-        print("   ✅ Integration Testing: PASSED")
+        for detail in details:
+            print(f"   {detail}")
+        if failed == 0:
+            print("   ✅ Integration Testing: PASSED")
+        else:
+            print(f"   ❌ Integration Testing: FAILED ({failed} inconsistencies)")
+            self.overall_status = "FAIL"
     
     def generate_master_report(self) -> Dict[str, Any]:
         """Generate comprehensive master report"""
         end_time = time.time()
         duration = end_time - self.start_time
         
-        # Calculate overall metrics
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results.values() if result["success"])
+        # Calculate overall metrics; advisory suites are reported but not counted
+        scored = self.scored_results()
+        total_tests = len(scored)
+        passed_tests = sum(1 for result in scored.values() if result["success"])
         failed_tests = total_tests - passed_tests
         success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         
@@ -143,6 +385,7 @@ class MasterSecurityTestRunner:
             "failed_tests": failed_tests,
             "success_rate": round(success_rate, 2),
             "test_results": self.test_results,
+            "suite_reports": self.reports,
             "recommendations": recommendations,
             "summary": f"Master Security Test Results: {self.overall_status} - {security_score}% security score ({passed_tests}/{total_tests} tests passed)"
         }
@@ -158,13 +401,18 @@ class MasterSecurityTestRunner:
             recommendations.append("CRITICAL: Some security tests failed - immediate action required")
         
         # Check specific test failures
-        failed_tests = [name for name, result in self.test_results.items() if not result["success"]]
+        scored = self.scored_results()
+        failed_tests = [name for name, result in scored.items() if not result["success"]]
         if failed_tests:
             recommendations.append(f"Failed tests: {', '.join(failed_tests)}")
+        failed_advisory = [name for name, result in self.test_results.items()
+                           if result.get("advisory") and not result["success"]]
+        if failed_advisory:
+            recommendations.append(f"Advisory suites reported failures (not scored): {', '.join(failed_advisory)}")
         
         # Check success rate
-        total_tests = len(self.test_results)
-        passed_tests = sum(1 for result in self.test_results.values() if result["success"])
+        total_tests = len(scored)
+        passed_tests = sum(1 for result in scored.values() if result["success"])
         success_rate = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         
         if success_rate < 80:
@@ -196,18 +444,11 @@ class MasterSecurityTestRunner:
         base_score = 0
         
         # Test success scoring
+        weights = {suite["name"]: suite["weight"] for suite in SECURITY_SUITES}
+        weights["integration_testing"] = INTEGRATION_WEIGHT
         for test_name, result in self.test_results.items():
             if result["success"]:
-                if test_name == "basic_validation":
-                    base_score += 25
-                elif test_name == "automated_validation":
-                    base_score += 25
-                elif test_name == "penetration_testing":
-                    base_score += 30
-                elif test_name == "performance_testing":
-                    base_score += 15
-                elif test_name == "integration_testing":
-                    base_score += 5
+                base_score += weights.get(test_name, 0)
         
         # Cap at 100
         return min(base_score, 100)
@@ -227,7 +468,10 @@ class MasterSecurityTestRunner:
         # Print individual test results
         print("Individual Test Results:")
         for test_name, result in report['test_results'].items():
-            status = "✅ PASS" if result['success'] else "❌ FAIL"
+            if result['success']:
+                status = "✅ PASS"
+            else:
+                status = "⚠️  FAIL (advisory)" if result.get('advisory') else "❌ FAIL"
             print(f"  {test_name}: {status}")
         print()
         
@@ -255,7 +499,24 @@ class MasterSecurityTestRunner:
 
 def main():
     """Main function to run all security tests"""
-    runner = MasterSecurityTestRunner()
+    parser = argparse.ArgumentParser(description="Alex AI Master Security Test Runner")
+    parser.add_argument("--max-parallel", type=int, default=None,
+                        help="Most suites to run at once (default: all that can overlap; 1 runs them in order)")
+    parser.add_argument("--timeout", type=int, default=SUITE_TIMEOUT, help="Per-suite timeout in seconds")
+    parser.add_argument("--in-process", action="store_true",
+                        help="Run the suites in this interpreter, sharing one HTTP pool and payload corpus, and merge their reports")
+    args = parser.parse_args()
+    
+    pentest_authorized = False
+    if args.in_process:
+        # The penetration suite asks for permission in its own main(); ask once here instead
+        print("⚠️  WARNING: This run includes penetration testing.")
+        print("   Only use on systems you own or have explicit permission to test.")
+        print()
+        pentest_authorized = input("Do you have permission to test this system? (yes/no): ").lower() == "yes"
+    
+    runner = MasterSecurityTestRunner(max_parallel=args.max_parallel, timeout=args.timeout,
+                                      in_process=args.in_process, pentest_authorized=pentest_authorized)
     
     try:
         # Run all tests
@@ -15,12 +15,18 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
+from http_session import stateless_session
+from payload_corpus import get_corpus
+
 class SecurityPerformanceTester:
-    def __init__(self):
+    def __init__(self, session: Optional[requests.Session] = None):
         self.test_results = []
         self.start_time = time.time()
         self.base_url = "http://localhost:3000"  # Adjust as needed
         self.performance_metrics = {}
+        # Pass a session to share one connection pool with other suites; never one that keeps cookies
+        self.session = session or stateless_session()
+        self.corpus = get_corpus()
         
     def run_performance_tests(self) -> Dict[str, Any]:
         """Run comprehensive security performance tests"""
@@ -87,7 +93,7 @@ class SecurityPerformanceTester:
             for i in range(total_requests):
                 try:
                     request_start = time.time()
-                    response = requests.get(f"{self.base_url}/api/status", timeout=10)
+                    response = self.session.get(f"{self.base_url}/api/status", timeout=10)
                     request_end = time.time()
                     
                     response_times.append(request_end - request_start)
@@ -138,13 +144,7 @@ class SecurityPerformanceTester:
         
         try:
             # Test with SQL injection payloads
-            sql_payloads = [
-                "1' OR '1'='1",
-                "1' UNION SELECT * FROM users--",
-                "1'; DROP TABLE users; --",
-                "1' AND (SELECT COUNT(*) FROM users) > 0--",
-                "1'; WAITFOR DELAY '00:00:01'--"
-            ]
+            sql_payloads = self.corpus.payloads("sql_injection", ["load"])
             
             response_times = []
             errors = 0
@@ -156,7 +156,7 @@ class SecurityPerformanceTester:
                 payload = sql_payloads[i % len(sql_payloads)]
                 try:
                     request_start = time.time()
-                    response = requests.post(f"{self.base_url}/api/users", 
+                    response = self.session.post(f"{self.base_url}/api/users", 
                                            json={"id": payload, "query": payload}, 
                                            timeout=10)
                     request_end = time.time()
@@ -209,13 +209,7 @@ class SecurityPerformanceTester:
         
         try:
             # Test with XSS payloads
-            xss_payloads = [
-                "<script>alert('XSS')</script>",
-                "<img src=x onerror=alert('XSS')>",
-                "<svg onload=alert('XSS')>",
-                "javascript:alert('XSS')",
-                "<iframe src=javascript:alert('XSS')></iframe>"
-            ]
+            xss_payloads = self.corpus.payloads("xss", ["load"])
             
             response_times = []
             errors = 0
@@ -227,7 +221,7 @@ class SecurityPerformanceTester:
                 payload = xss_payloads[i % len(xss_payloads)]
                 try:
                     request_start = time.time()
-                    response = requests.post(f"{self.base_url}/api/content", 
+                    response = self.session.post(f"{self.base_url}/api/content", 
                                            json={"content": payload, "comment": payload}, 
                                            timeout=10)
                     request_end = time.time()
@@ -295,7 +289,7 @@ class SecurityPerformanceTester:
                 operation = auth_operations[i % len(auth_operations)]
                 try:
                     request_start = time.time()
-                    response = requests.post(f"{self.base_url}/api/auth/login", 
+                    response = self.session.post(f"{self.base_url}/api/auth/login", 
                                            json=operation, 
                                            timeout=10)
                     request_end = time.time()
@@ -347,13 +341,7 @@ class SecurityPerformanceTester:
         
         try:
             # Test with sensitive data
-            sensitive_data = [
-                "My credit card is 4111-1111-1111-1111",
-                "SSN: 123-45-6789",
-                "Email: john.doe@example.com",
-                "Phone: (555) 123-4567",
-                "API_KEY=sk-1234567890abcdef"
-            ]
+            sensitive_data = self.corpus.payloads("sensitive_data", ["load"])
             
             response_times = []
             errors = 0
@@ -365,7 +353,7 @@ class SecurityPerformanceTester:
                 data = sensitive_data[i % len(sensitive_data)]
                 try:
                     request_start = time.time()
-                    response = requests.post(f"{self.base_url}/api/data", 
+                    response = self.session.post(f"{self.base_url}/api/data", 
                                            json={"content": data, "description": data}, 
                                            timeout=10)
                     request_end = time.time()
@@ -426,7 +414,7 @@ class SecurityPerformanceTester:
             for i in range(total_requests):
                 try:
                     request_start = time.time()
-                    response = requests.get(f"{self.base_url}/api/status", 
+                    response = self.session.get(f"{self.base_url}/api/status", 
                                           headers={"Authorization": "Bearer test-token"}, 
                                           timeout=10)
                     request_end = time.time()
@@ -488,7 +476,7 @@ class SecurityPerformanceTester:
             for i in range(total_requests):
                 try:
                     request_start = time.time()
-                    response = requests.get(f"{self.base_url}/api/status", timeout=10)
+                    response = self.session.get(f"{self.base_url}/api/status", timeout=10)
                     request_end = time.time()
                     
                     response_times.append(request_end - request_start)
@@ -544,7 +532,7 @@ class SecurityPerformanceTester:
             def make_request():
                 try:
                     start = time.time()
-                    response = requests.get(f"{self.base_url}/api/status", timeout=10)
+                    response = self.session.get(f"{self.base_url}/api/status", timeout=10)
                     end = time.time()
                     return {
                         "response_time": end - start,
@@ -627,7 +615,7 @@ class SecurityPerformanceTester:
             # Perform security operations
             for i in range(100):
                 try:
-                    response = requests.post(f"{self.base_url}/api/data", 
+                    response = self.session.post(f"{self.base_url}/api/data", 
                                            json={"content": f"Test data {i}", "description": f"Test description {i}"}, 
                                            timeout=10)
                 except:
@@ -678,19 +666,19 @@ class SecurityPerformanceTester:
                     start = time.time()
                     
                     if operation_type == "sql_injection":
-                        response = requests.post(f"{self.base_url}/api/users", 
+                        response = self.session.post(f"{self.base_url}/api/users", 
                                                json={"id": data, "query": data}, 
                                                timeout=10)
                     elif operation_type == "xss":
-                        response = requests.post(f"{self.base_url}/api/content", 
+                        response = self.session.post(f"{self.base_url}/api/content", 
                                                json={"content": data, "comment": data}, 
                                                timeout=10)
                     elif operation_type == "dlp":
-                        response = requests.post(f"{self.base_url}/api/data", 
+                        response = self.session.post(f"{self.base_url}/api/data", 
                                                json={"content": data, "description": data}, 
                                                timeout=10)
                     else:
-                        response = requests.get(f"{self.base_url}/api/status", timeout=10)
+                        response = self.session.get(f"{self.base_url}/api/status", timeout=10)
                     
                     end = time.time()
                     return {
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Alex AI Source Pattern Scanner
+Reads each source file once, matches every pattern in the same pass and reports file:line hits
+"""
+
+import os
+import sys
+import time
+import json
+import hashlib
+import argparse
+from bisect import bisect_right
+from functools import partial
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Iterable, Optional, Sequence, Tuple
+
+from repo_secret_scan import SKIP_DIRS
+
+# Below this many files the cost of starting worker processes outweighs the scan
+PARALLEL_THRESHOLD = 64
+
+SOURCE_EXTENSIONS = (".ts",)
+
+
+def scan_source_file(needles: Sequence[Tuple[str, str]], path: str) -> Tuple[str, Dict[str, List[int]]]:
+    """Line numbers of every needle in one file; returns (path, {pattern name: lines})"""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            text = f.read().lower()
+    except OSError:
+        return path, {}
+
+    hits: Dict[str, List[int]] = {}
+    line_ends = None
+    find = text.find
+    for name, needle in needles:
+        position = find(needle)
+        if position == -1:
+            continue
+        if line_ends is None:
+            # Offsets where each line ends, built only for files with at least one hit
+            line_ends = list(accumulate(len(line) + 1 for line in text.split("\n")))
+        lines = hits[name] = []
+        while position != -1:
+            line = bisect_right(line_ends, position) + 1
+            lines.append(line)
+            # One hit per line is enough; continue from the start of the next line
+            position = find(needle, line_ends[line - 1])
+    return path, hits
+
+
+class SourcePatternScanner:
+    """Case-insensitive literal patterns matched over a source tree in one pass per file.
+
+    Each file is read and lowercased once, then every pattern is located with
+    ``str.find`` over that one buffer, so adding a pattern costs a C-level
+    substring search instead of another walk and another read of the tree.
+    Larger trees are spread over a process pool, largest files first. Given a
+    file content index, hits of unchanged files are read back from it and only
+    changed files are scanned.
+    """
+
+    def __init__(self, patterns: Dict[str, str], extensions: Iterable[str] = SOURCE_EXTENSIONS,
+                 workers: Optional[int] = None):
+        self.needles = tuple((name, needle.lower()) for name, needle in patterns.items())
+        self.extensions = tuple(extensions)
+        self.workers = workers or os.cpu_count() or 1
+        # Hits stored in the index are only valid for this exact pattern set
+        self.facts_version = hashlib.sha256(json.dumps(self.needles).encode("utf-8")).hexdigest()[:16]
+
+    def collect_files(self, roots: Iterable[str]) -> List[str]:
+        """Source files below the roots, skipping dependency and cache directories"""
+        files = []
+        for root in roots:
+            if os.path.isfile(root):
+                files.append(root)
+                continue
+            for current, dirs, names in os.walk(root):
+                dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+                files.extend(os.path.join(current, name) for name in names if name.endswith(self.extensions))
+        return files
+
+    def scan(self, roots: Iterable[str], index: Optional[Any] = None) -> Dict[str, Any]:
+        """Hit locations ("file:line") per pattern, in file order, plus timing"""
+        start = time.perf_counter()
+        files = self.collect_files(roots)
+
+        hits_by_file: Dict[str, Dict[str, List[int]]] = {}
+        stale = files
+        if index is not None:
+            stale = []
+            for path in files:
+                cached = index.get_facts(path, "source_patterns", self.facts_version)
+                if cached is None:
+                    stale.append(path)
+                else:
+                    hits_by_file[path] = cached
+
+        worker = partial(scan_source_file, self.needles)
+        if self.workers > 1 and len(stale) >= PARALLEL_THRESHOLD:
+            by_size = sorted(stale, key=os.path.getsize, reverse=True)
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                scanned = dict(executor.map(worker, by_size, chunksize=16))
+        else:
+            scanned = dict(map(worker, stale))
+
+        if index is not None:
+            for path, file_hits in scanned.items():
+                index.put_facts(path, "source_patterns", file_hits, self.facts_version)
+        hits_by_file.update(scanned)
+
+        hits: Dict[str, List[str]] = {name: [] for name, _ in self.needles}
+        for path in sorted(hits_by_file):
+            for name, lines in hits_by_file[path].items():
+                hits[name].extend(f"{path}:{line}" for line in lines)
+
+        return {
+            "files": len(files),
+            "scanned": len(stale),
+            "hits": hits,
+            "elapsed": round(time.perf_counter() - start, 3)
+        }
+
+
+def main():
+    """Scan source trees for patterns and print where each one occurs"""
+    parser = argparse.ArgumentParser(description="Alex AI Source Pattern Scanner")
+    parser.add_argument("patterns", nargs="+", help="Case-insensitive literal patterns")
+    parser.add_argument("--root", action="append", default=None, help="Directory to scan (repeatable, default: packages)")
+    parser.add_argument("--ext", action="append", default=None, help="File extension to scan (repeatable, default: .ts)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    scanner = SourcePatternScanner({pattern: pattern for pattern in args.patterns},
+                                   args.ext or SOURCE_EXTENSIONS, args.workers)
+    result = scanner.scan(args.root or ["packages"])
+
+    print(f"🔍 {result['files']} files in {result['elapsed']}s")
+    for pattern, locations in result["hits"].items():
+        print(f"   {pattern}: {len(locations)} hits")
+        for location in locations[:10]:
+            print(f"      {location}")
+        if len(locations) > 10:
+            print(f"      ... {len(locations) - 10} more")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Alex AI Suite Output
+One process-wide stdout router that tags and buffers output per thread, so parallel suites and checks stay readable
+"""
+
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable
+
+
+class ThreadTaggedStdout:
+    """stdout replacement that routes each thread's writes through that thread's tag and buffer.
+
+    It is installed once for the whole process and never swapped back, so a
+    suite still running on an abandoned thread cannot restore an old stdout
+    over it. ``tagged`` prefixes every line the current thread writes;
+    ``capture`` wraps a function so that, on whatever thread runs it, its
+    output is collected and written as one block under the tag of the thread
+    that wrapped it. Threads with no tag write straight through.
+    """
+
+    def __init__(self, target):
+        self.target = target
+        self.lock = threading.Lock()
+        self.local = threading.local()
+
+    @contextmanager
+    def tagged(self, tag: str):
+        """Prefix each line the current thread writes with a tag"""
+        previous = getattr(self.local, "tag", None)
+        self.local.tag = tag
+        self.local.partial = ""
+        try:
+            yield self
+        finally:
+            if self.local.partial:
+                self.write("\n")
+            self.local.tag = previous
+
+    def capture(self, function: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap a function so its output is written as one block under the calling thread's tag"""
+        tag = getattr(self.local, "tag", None)
+
+        def run(*args, **kwargs):
+            self.local.lines = []
+            try:
+                return function(*args, **kwargs)
+            finally:
+                output = "".join(self.local.lines)
+                self.local.lines = None
+                if tag:
+                    output = "".join(f"{tag}{line}\n" for line in output.splitlines())
+                with self.lock:
+                    self.target.write(output)
+                    self.target.flush()
+        return run
+
+    def write(self, text):
+        lines = getattr(self.local, "lines", None)
+        if lines is not None:
+            lines.append(text)
+            return len(text)
+        tag = getattr(self.local, "tag", None)
+        if not tag:
+            with self.lock:
+                return self.target.write(text)
+        parts = (self.local.partial + text).split("\n")
+        self.local.partial = parts.pop()
+        if parts:
+            with self.lock:
+                self.target.write("".join(f"{tag}{line}\n" for line in parts))
+        return len(text)
+
+    def flush(self):
+        self.target.flush()
+
+
+_install_lock = threading.Lock()
+
+
+def install() -> ThreadTaggedStdout:
+    """The process's stdout router, replacing sys.stdout on first use"""
+    with _install_lock:
+        if not isinstance(sys.stdout, ThreadTaggedStdout):
+            sys.stdout = ThreadTaggedStdout(sys.stdout)
+        return sys.stdout
+
@@ -7,74 +7,13 @@ Activates the Alex AI system with the nine-character crew from npm.pbradygeorgen
 import json
 from datetime import datetime
 
+from crew_registry import get_crew_registry
+
 class SimpleAlexAIEngagement:
-    def __init__(self):
-        # Nine-character crew from npm.pbradygeorgen.com as global rule
-        self.crew_members = {
-            'captain_picard': {
-                'name': 'Captain Jean-Luc Picard',
-                'department': 'Command',
-                'expertise': 'Strategic Leadership, Mission Planning, Decision Making',
-                'personality': 'Diplomatic, wise, principled leader',
-                'status': 'active'
-            },
-            'commander_riker': {
-                'name': 'Commander William Riker',
-                'department': 'Tactical',
-                'expertise': 'Tactical Operations, Workflow Management, Execution',
-                'personality': 'Confident, tactical, execution-focused',
-                'status': 'active'
-            },
-            'commander_data': {
-                'name': 'Commander Data',
-                'department': 'Operations',
-                'expertise': 'Analytics, Logic, Data Processing, Efficiency',
-                'personality': 'Logical, analytical, precise',
-                'status': 'active'
-            },
-            'geordi_la_forge': {
-                'name': 'Lieutenant Commander Geordi La Forge',
-                'department': 'Engineering',
-                'expertise': 'Infrastructure, System Integration, Technical Solutions',
-                'personality': 'Innovative, technical, problem-solving',
-                'status': 'active'
-            },
-            'lieutenant_worf': {
-                'name': 'Lieutenant Worf',
-                'department': 'Security',
-                'expertise': 'Security, Defense, Risk Assessment, Quality Assurance',
-                'personality': 'Honorable, disciplined, security-focused',
-                'status': 'active'
-            },
-            'counselor_troi': {
-                'name': 'Counselor Deanna Troi',
-                'department': 'Counseling',
-                'expertise': 'User Experience, Interface Design, User Feedback',
-                'personality': 'Empathetic, intuitive, user-focused',
-                'status': 'active'
-            },
-            'lieutenant_uhura': {
-                'name': 'Lieutenant Uhura',
-                'department': 'Communications',
-                'expertise': 'Communication, Integration, API Management',
-                'personality': 'Communicative, organized, integration-focused',
-                'status': 'active'
-            },
-            'dr_crusher': {
-                'name': 'Dr. Beverly Crusher',
-                'department': 'Medical',
-                'expertise': 'Quality Assurance, System Health, Testing',
-                'personality': 'Caring, thorough, quality-focused',
-                'status': 'active'
-            },
-            'quark': {
-                'name': 'Quark',
-                'department': 'Business',
-                'expertise': 'Business Intelligence, Budget Optimization, ROI Analysis',
-                'personality': 'Business-minded, cost-conscious, profit-focused',
-                'status': 'active'
-            }
-        }
+    @property
+    def crew_members(self):
+        """Nine-character crew from npm.pbradygeorgen.com, loaded from memories/ on first access"""
+        return get_crew_registry().members
 
     def engage_alex_ai(self):
         """Engage Alex AI system with full crew activation"""
@@ -94,7 +33,7 @@ class SimpleAlexAIEngagement:
         engagement_data = {
             'timestamp': datetime.now().isoformat(),
             'action': 'alex_ai_engagement',
-            'crew_status': self.crew_members,
+            'crew_status': {member_id: member.to_dict() for member_id, member in self.crew_members.items()},
             'total_crew': len(self.crew_members),
             'active_crew': len([m for m in self.crew_members.values() if m['status'] == 'active']),
             'system_status': 'engaged'
@@ -111,7 +50,7 @@ class SimpleAlexAIEngagement:
         return {
             'total_crew': len(self.crew_members),
             'active_crew': len([m for m in self.crew_members.values() if m['status'] == 'active']),
-            'crew_members': self.crew_members,
+            'crew_members': {member_id: member.to_dict() for member_id, member in self.crew_members.items()},
             'timestamp': datetime.now().isoformat()
         }
 
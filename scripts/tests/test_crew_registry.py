@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Alex AI Crew Registry Tests
+Bit-sliced ranking agrees with plain per-member capability counting
+"""
+
+import os
+import sys
+import random
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from crew_registry import CrewRegistry
+
+CAPABILITY_NAMES = [f"test_capability_{i}" for i in range(40)]
+
+
+def synthetic_registry(agents: int, seed: int) -> CrewRegistry:
+    """Registry of random agents; some inactive, priorities with ties"""
+    rng = random.Random(seed)
+    return CrewRegistry({
+        f"test_agent_{seed}_{i}": {
+            "id": f"test_agent_{seed}_{i}",
+            "name": f"Agent {i}",
+            "department": f"Department {i % 5}",
+            "status": "active" if rng.random() < 0.9 else "inactive",
+            "priority": rng.randint(1, 20),
+            "capabilities": rng.sample(CAPABILITY_NAMES, rng.randint(0, 8))
+        }
+        for i in range(agents)
+    })
+
+
+def reference_route(registry: CrewRegistry, task, limit: int = 0, require_all: bool = False):
+    """Ranking by counting each active member's matching capabilities in a dict"""
+    needed = set(task)
+    if not needed:
+        return []
+    counts = {}
+    for member_id in registry.priority_order:
+        matched = len(needed & set(registry.get(member_id).capabilities))
+        if matched == len(needed) if require_all else matched > 0:
+            counts[member_id] = matched
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], registry.rank[item[0]]))
+    return ranked[:limit] if limit else ranked
+
+
+class CrewRegistryRankingTest(unittest.TestCase):
+    def test_route_matches_reference(self):
+        rng = random.Random(7)
+        names = CAPABILITY_NAMES + ["test_capability_unknown"]
+        for seed, agents in ((1, 9), (2, 64), (3, 300)):
+            registry = synthetic_registry(agents, seed)
+            for _ in range(2000):
+                task = rng.sample(names, rng.randint(1, 6))
+                limit = rng.choice((0, 1, 3, 10))
+                for require_all in (False, True):
+                    with self.subTest(seed=seed, task=task, limit=limit, require_all=require_all):
+                        self.assertEqual(registry.route(task, limit, require_all),
+                                         reference_route(registry, task, limit, require_all))
+
+    def test_score_batch_matches_route(self):
+        rng = random.Random(11)
+        registry = synthetic_registry(120, 4)
+        tasks = [rng.sample(CAPABILITY_NAMES, rng.randint(1, 5)) for _ in range(500)]
+        self.assertEqual(registry.score_batch(tasks, limit=5), [registry.route(task, 5) for task in tasks])
+
+    def test_empty_task_has_no_candidates(self):
+        registry = synthetic_registry(20, 5)
+        member_id = registry.priority_order[0]
+        self.assertEqual(registry.route([]), [])
+        self.assertEqual(registry.route([], require_all=True), [])
+        self.assertEqual(registry.score_batch([[]]), [[]])
+        self.assertFalse(registry.covers(member_id, []))
+
+    def test_covers(self):
+        registry = synthetic_registry(50, 6)
+        for member_id in registry.priority_order:
+            capabilities = registry.get(member_id).capabilities
+            if capabilities:
+                self.assertTrue(registry.covers(member_id, iter(capabilities)))
+            self.assertFalse(registry.covers(member_id, list(capabilities) + ["test_capability_unknown"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Alex AI Engagement Probes Tests
+Deadlines hold for blocking checks as well as coroutine checks
+"""
+
+import os
+import sys
+import time
+import asyncio
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engagement_probes import run_probes
+
+
+def hung_check() -> bool:
+    time.sleep(4.0)
+    return True
+
+
+async def hung_async_check() -> bool:
+    await asyncio.sleep(4.0)
+    return True
+
+
+class ProbeDeadlineTest(unittest.TestCase):
+    def test_hung_sync_probe_returns_at_its_deadline(self):
+        start = time.perf_counter()
+        result = run_probes([
+            {"name": "hung", "check": hung_check, "deadline": 0.5},
+            {"name": "fast", "check": lambda: True, "deadline": 0.5}
+        ])
+        elapsed = time.perf_counter() - start
+
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(result["results"]["hung"]["status"], "timeout")
+        self.assertEqual(result["results"]["fast"]["status"], "healthy")
+        self.assertFalse(result["healthy"])
+
+    def test_hung_async_probe_returns_at_its_deadline(self):
+        start = time.perf_counter()
+        result = run_probes([{"name": "hung", "check": hung_async_check, "deadline": 0.5}])
+
+        self.assertLess(time.perf_counter() - start, 1.5)
+        self.assertEqual(result["results"]["hung"]["status"], "timeout")
+
+    def test_hung_optional_probe_does_not_delay_healthy_required_set(self):
+        start = time.perf_counter()
+        result = run_probes([
+            {"name": "required", "check": lambda: True},
+            {"name": "optional", "check": hung_check, "required": False}
+        ])
+
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertTrue(result["healthy"])
+        self.assertEqual(result["results"]["optional"]["status"], "pending")
+
+    def test_sync_probe_errors_are_reported(self):
+        def failing_check():
+            raise ConnectionError("refused")
+
+        result = run_probes([{"name": "down", "check": failing_check}])
+
+        self.assertEqual(result["results"]["down"]["status"], "error")
+        self.assertEqual(result["results"]["down"]["error"], "refused")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Alex AI Security Session Tests
+A cookie set in one check is never sent by a later one
+"""
+
+import os
+import sys
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "security"))
+
+from http_session import stateless_session
+from automated_security_validation import AutomatedSecurityValidator
+from penetration_testing_suite import PenetrationTestingSuite
+
+
+class CookieEchoHandler(BaseHTTPRequestHandler):
+    """Login sets a session cookie; every other path echoes the Cookie header it got"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Set-Cookie", "session=logged-in; Path=/")
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def do_GET(self):
+        body = json.dumps({"cookie": self.headers.get("Cookie")}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StatelessSessionTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), CookieEchoHandler)
+        cls.base_url = f"http://127.0.0.1:{cls.server.server_port}"
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def assert_cookie_not_sent(self, login, later):
+        login.make_request("POST", "/api/auth/login", {"username": "testuser1", "password": "TestPass123!"})
+        response = later.make_request("GET", "/api/users")
+        self.assertEqual(response["status_code"], 200)
+        self.assertIsNone(json.loads(response["body"])["cookie"])
+
+    def test_suite_default_session_keeps_no_cookies(self):
+        validator = AutomatedSecurityValidator()
+        validator.base_url = self.base_url
+        self.assert_cookie_not_sent(validator, validator)
+        validator.session.close()
+
+    def test_shared_session_keeps_no_cookies_across_suites(self):
+        session = stateless_session()
+        validator = AutomatedSecurityValidator(session=session)
+        pentest = PenetrationTestingSuite(session=session)
+        validator.base_url = pentest.base_url = self.base_url
+        self.assert_cookie_not_sent(validator, pentest)
+        session.close()
+
+
+if __name__ == "__main__":
+    unittest.main()